@@ -53,10 +53,16 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
     log_dir: Path = Field(default=Path("logs"), description="Directory for log files")
     debug: bool = Field(default=False, description="Enable debug mode")
+    pretty_json: bool = Field(default=False, description="Indent JSON tool responses for readability")
+    use_uvloop: bool = Field(default=True, description="Use uvloop for the event loop when it is installed")
     
     # Request Configuration
     request_timeout: int = Field(default=30, description="HTTP request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of API retries")
+    resource_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Seconds to reuse rendered project, user and KPI resources (0 disables)"
+    )
     
     def validate_auth_config(self) -> None:
         """Validate that authentication configuration is complete."""
@@ -1,5 +1,6 @@
 """KPI use cases for calculating business metrics."""
 
+import heapq
 import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
@@ -121,8 +122,7 @@ class KPIUseCases:
     async def get_top_performing_projects(self, limit: int = 10) -> List[ProjectHealthScore]:
         """Get top performing projects by health score."""
         health_scores = await self.get_project_health_scores()
-        health_scores.sort(key=lambda x: x.overall_score, reverse=True)
-        return health_scores[:limit]
+        return heapq.nlargest(limit, health_scores, key=lambda x: x.overall_score)
     
     async def _get_all_project_revisions(self, projects: List[PlannerProject]) -> Dict[str, int]:
         """Get revision counts for all projects."""
@@ -141,7 +141,7 @@ class KPIUseCases:
                 revisions = len(result.get('projectHistory', []))
                 project_revisions[project.id] = revisions
             except Exception as e:
-                logger.warning(f"Failed to get revisions for project {project.id}: {e}")
+                logger.warning("Failed to get revisions for project %s: %s", project.id, e)
                 project_revisions[project.id] = 0
         
         return project_revisions
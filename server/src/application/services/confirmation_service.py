@@ -7,6 +7,7 @@ or closing projects.
 """
 
 import hashlib
+import hmac
 import json
 import secrets
 import time
@@ -31,9 +32,18 @@ class ConfirmationService:
             default_expiry_minutes: Default token expiration time in minutes.
         """
         self.secret_key = secret_key or secrets.token_urlsafe(32)
+        self._secret_bytes = self.secret_key.encode('utf-8')
+        # Keyed once; _sign copies it so the key schedule is not redone per token
+        self._base_mac = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
         self.default_expiry_minutes = default_expiry_minutes
         self._used_tokens: Dict[str, float] = {}  # Track used tokens with cleanup timestamp
         
+    def _sign(self, payload: bytes) -> str:
+        """Sign a token payload with HMAC-SHA256 over the service secret."""
+        mac = self._base_mac.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+        
     def generate_token(
         self,
         action: str,
@@ -72,12 +82,7 @@ class ConfirmationService:
         payload_encoded = payload_json.encode('utf-8')
         
         # Create signature
-        signature = hashlib.pbkdf2_hmac(
-            'sha256',
-            payload_encoded,
-            self.secret_key.encode('utf-8'),
-            100000
-        ).hex()
+        signature = self._sign(payload_encoded)
         
         # Combine payload and signature
         token = f"{payload_json}|{signature}"
@@ -88,18 +93,19 @@ class ConfirmationService:
             "expires_in_seconds": int(expires_minutes * 60)
         }
     
-    def validate_token(self, token: str) -> Dict:
+    def validate_token(self, token: str, expected_action: Optional[str] = None) -> Dict:
         """
         Validate and extract data from a confirmation token.
         
         Args:
             token: The confirmation token to validate
+            expected_action: If given, reject tokens issued for any other action
             
         Returns:
             Dictionary containing action and data from the token
             
         Raises:
-            ValueError: If token is invalid, expired, or already used
+            ValueError: If token is invalid, expired, already used, or for another action
         """
         try:
             # Split token into payload and signature
@@ -111,19 +117,18 @@ class ConfirmationService:
             
             # Verify signature
             payload_encoded = payload_json.encode('utf-8')
-            expected_signature = hashlib.pbkdf2_hmac(
-                'sha256',
-                payload_encoded,
-                self.secret_key.encode('utf-8'),
-                100000
-            ).hex()
+            expected_signature = self._sign(payload_encoded)
             
-            if not secrets.compare_digest(provided_signature, expected_signature):
+            if not hmac.compare_digest(provided_signature, expected_signature):
                 raise ValueError("Invalid token signature")
             
             # Parse payload
             payload = json.loads(payload_json)
             
+            # The action is covered by the signature; check it before the token is consumed
+            if expected_action is not None and payload["action"] != expected_action:
+                raise ValueError("Invalid token: wrong action type")
+            
             # Check if token has been used
             token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
             if token_hash in self._used_tokens:
@@ -189,3 +194,39 @@ class ConfirmationService:
             "token_expires_in_seconds": token_info["expires_in_seconds"],
             "next_step": f"To proceed, call confirm_{action}_{item_type} with the confirmation_token"
         }
+    
+    def generate_preview_with_token(
+        self,
+        token_action: str,
+        data: Dict,
+        action: str,
+        items: List[Dict],
+        item_type: str,
+        warnings: List[str],
+        expires_minutes: Optional[int] = None
+    ) -> Dict:
+        """
+        Sign a confirmation token and build the preview response in one step.
+        
+        Equivalent to ``create_preview_response(..., token_info=generate_token(...))``.
+        
+        Args:
+            token_action: Action stored in the token (e.g., "close_projects")
+            data: Data associated with the action
+            action: The action being previewed (e.g., "delete", "close")
+            items: List of items that would be affected
+            item_type: Type of items (e.g., "projects", "users")
+            warnings: List of warning messages
+            expires_minutes: Token expiration time in minutes (default: service default)
+            
+        Returns:
+            Standardized preview response dictionary
+        """
+        token_info = self.generate_token(token_action, data, expires_minutes)
+        return self.create_preview_response(
+            action=action,
+            items=items,
+            item_type=item_type,
+            warnings=warnings,
+            token_info=token_info
+        )
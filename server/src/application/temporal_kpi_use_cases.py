@@ -266,23 +266,17 @@ class TemporalKPICalculator:
         for ts in revision_timestamps:
             daily_counts[ts.date()] += 1
         
-        daily_velocities = [(date_key, count) for date_key, count in sorted(daily_counts.items())]
+        daily_velocities = sorted(daily_counts.items())
         
-        # Calculate weekly velocities
+        # Roll the daily totals up into weeks and months, so keys are built once per active day
         weekly_counts = defaultdict(int)
-        for ts in revision_timestamps:
-            week_key = f"{ts.year}-W{ts.isocalendar()[1]:02d}"
-            weekly_counts[week_key] += 1
-        
-        weekly_velocities = [(week_key, count) for week_key, count in sorted(weekly_counts.items())]
-        
-        # Calculate monthly velocities
         monthly_counts = defaultdict(int)
-        for ts in revision_timestamps:
-            month_key = f"{ts.year}-{ts.month:02d}"
-            monthly_counts[month_key] += 1
+        for day, count in daily_velocities:
+            weekly_counts[f"{day.year}-W{day.isocalendar()[1]:02d}"] += count
+            monthly_counts[f"{day.year}-{day.month:02d}"] += count
         
-        monthly_velocities = [(month_key, count) for month_key, count in sorted(monthly_counts.items())]
+        weekly_velocities = sorted(weekly_counts.items())
+        monthly_velocities = sorted(monthly_counts.items())
         
         # Analyze velocity trend
         velocity_trend = "stable"
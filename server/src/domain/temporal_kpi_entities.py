@@ -1,6 +1,7 @@
 """Temporal KPI entities for time-based analysis."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, date
 from enum import Enum
@@ -113,6 +114,11 @@ class TeamTemporalMetrics:
     # Seasonal patterns
     monthly_activity_trend: Dict[str, int]
     quarterly_productivity: Dict[str, float]
+    
+    @cached_property
+    def sorted_monthly_activity_trend(self) -> List[Tuple[str, int]]:
+        """Get the monthly activity trend ordered by month, computed once."""
+        return sorted(self.monthly_activity_trend.items())
 
 
 @dataclass
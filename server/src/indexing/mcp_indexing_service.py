@@ -135,6 +135,11 @@ class MCPIndexingService:
             for target in self.targets.values()
         ]
     
+    def has_target(self, target_name: str) -> bool:
+        """Check whether an indexing target is configured."""
+        
+        return target_name in self.targets
+    
     def get_target_details(self, target_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific target."""
         
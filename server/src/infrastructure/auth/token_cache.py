@@ -36,9 +36,9 @@ class TokenCache:
                 with open(self.cache_file, "r") as f:
                     cache_data = f.read()
                     self.msal_cache.deserialize(cache_data)
-                logger.info(f"Loaded token cache from {self.cache_file}")
+                logger.info("Loaded token cache from %s", self.cache_file)
             except Exception as e:
-                logger.warning(f"Failed to load token cache: {e}")
+                logger.warning("Failed to load token cache: %s", e)
     
     def save(self) -> None:
         """Save token cache to disk."""
@@ -49,9 +49,9 @@ class TokenCache:
                     f.write(self.msal_cache.serialize())
                 # Secure the cache file (owner read/write only)
                 os.chmod(self.cache_file, 0o600)
-                logger.debug(f"Saved token cache to {self.cache_file}")
+                logger.debug("Saved token cache to %s", self.cache_file)
             except Exception as e:
-                logger.error(f"Failed to save token cache: {e}")
+                logger.error("Failed to save token cache: %s", e)
     
     def clear(self) -> None:
         """Clear the token cache."""
@@ -61,4 +61,4 @@ class TokenCache:
             self.msal_cache = SerializableTokenCache()
             logger.info("Token cache cleared")
         except Exception as e:
-            logger.error(f"Failed to clear token cache: {e}")
+            logger.error("Failed to clear token cache: %s", e)
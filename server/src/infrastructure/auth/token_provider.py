@@ -117,36 +117,56 @@ class OAuth2TokenProvider(TokenProvider):
         
         self._current_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+    
+    def _has_valid_token(self) -> bool:
+        """Check whether the current token is valid for at least five more minutes."""
+        return bool(
+            self._current_token
+            and self._token_expiry
+            and datetime.now() < self._token_expiry - timedelta(minutes=5)
+        )
     
     async def get_token(self) -> str:
         """
         Get a valid access token, using cache if available.
         
+        Concurrent callers that find the token expired share a single
+        acquisition instead of each contacting the identity provider.
+        
         Returns:
             Valid bearer token string
         """
         # Check if cached token is still valid
-        if self._current_token and self._token_expiry:
-            if datetime.now() < self._token_expiry - timedelta(minutes=5):
-                logger.debug("Using cached access token")
-                return self._current_token
+        if self._has_valid_token():
+            logger.debug("Using cached access token")
+            return self._current_token
         
-        # Try to acquire token from cache
-        accounts = self.app.get_accounts()
-        if accounts:
-            logger.debug(f"Found {len(accounts)} cached accounts")
-            result = await asyncio.to_thread(
-                self.app.acquire_token_silent,
-                scopes=[self.scope],
-                account=accounts[0]
-            )
-            if result and "access_token" in result:
-                logger.info("✅ Acquired token from cache")
-                self._update_token_from_result(result)
-                return self._current_token
+        # Created lazily so the lock binds to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
         
-        # No cached token, acquire new one
-        return await self.refresh_token()
+        async with self._refresh_lock:
+            # Another caller may have acquired a token while we waited
+            if self._has_valid_token():
+                return self._current_token
+            
+            # Try to acquire token from cache
+            accounts = self.app.get_accounts()
+            if accounts:
+                logger.debug("Found %s cached accounts", len(accounts))
+                result = await asyncio.to_thread(
+                    self.app.acquire_token_silent,
+                    scopes=[self.scope],
+                    account=accounts[0]
+                )
+                if result and "access_token" in result:
+                    logger.info("✅ Acquired token from cache")
+                    self._update_token_from_result(result)
+                    return self._current_token
+            
+            # No cached token, acquire new one
+            return await self.refresh_token()
     
     async def refresh_token(self) -> str:
         """
@@ -173,7 +193,7 @@ class OAuth2TokenProvider(TokenProvider):
             if "user_code" not in flow:
                 raise AuthenticationError("Failed to create device flow")
             
-            logger.info(f"Device code flow initiated: {flow['message']}")
+            logger.info("Device code flow initiated: %s", flow['message'])
             print(f"\n{flow['message']}\n")
             
             result = await asyncio.to_thread(
@@ -202,7 +222,7 @@ class OAuth2TokenProvider(TokenProvider):
         expires_in = result.get("expires_in", 3600)
         self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
         
-        logger.debug(f"Token expires at: {self._token_expiry}")
+        logger.debug("Token expires at: %s", self._token_expiry)
         self.cache.save()
 
 
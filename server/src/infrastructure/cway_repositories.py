@@ -63,7 +63,7 @@ class CwayUserRepository:
             return users
             
         except Exception as e:
-            logger.error(f"Failed to fetch users: {e}")
+            logger.error("Failed to fetch users: %s", e)
             raise CwayAPIError(f"Failed to fetch users: {e}")
             
     async def find_user_by_id(self, user_id: str) -> Optional[CwayUser]:
@@ -137,7 +137,7 @@ class CwayUserRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to fetch users page: {e}")
+            logger.error("Failed to fetch users page: %s", e)
             raise CwayAPIError(f"Failed to fetch users page: {e}")
     
     async def search_users(self, query: Optional[str] = None) -> List[CwayUser]:
@@ -178,7 +178,7 @@ class CwayUserRepository:
             return users
             
         except Exception as e:
-            logger.error(f"Failed to search users: {e}")
+            logger.error("Failed to search users: %s", e)
             raise CwayAPIError(f"Failed to search users: {e}")
     
     async def create_user(self, email: str, username: str, first_name: Optional[str] = None, 
@@ -220,7 +220,7 @@ class CwayUserRepository:
             )
             
         except Exception as e:
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise CwayAPIError(f"Failed to create user: {e}")
     
     async def update_user_name(self, username: str, first_name: Optional[str] = None,
@@ -262,7 +262,7 @@ class CwayUserRepository:
             )
             
         except Exception as e:
-            logger.error(f"Failed to update user name: {e}")
+            logger.error("Failed to update user name: %s", e)
             raise CwayAPIError(f"Failed to update user name: {e}")
     
     async def delete_user(self, username: str) -> bool:
@@ -280,7 +280,7 @@ class CwayUserRepository:
             return result.get("deleteUsers", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete user: {e}")
+            logger.error("Failed to delete user: %s", e)
             raise CwayAPIError(f"Failed to delete user: {e}")
     
     async def find_users_and_teams(self, search: Optional[str] = None, page: int = 0, size: int = 10) -> Dict[str, Any]:
@@ -329,7 +329,7 @@ class CwayUserRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to search users and teams: {e}")
+            logger.error("Failed to search users and teams: %s", e)
             raise CwayAPIError(f"Failed to search users and teams: {e}")
     
     async def get_permission_groups(self) -> List[Dict[str, Any]]:
@@ -350,7 +350,7 @@ class CwayUserRepository:
             return result.get("getPermissionGroups", [])
             
         except Exception as e:
-            logger.error(f"Failed to get permission groups: {e}")
+            logger.error("Failed to get permission groups: %s", e)
             raise CwayAPIError(f"Failed to get permission groups: {e}")
     
     async def set_user_permissions(self, usernames: List[str], permission_group_id: str) -> bool:
@@ -369,7 +369,7 @@ class CwayUserRepository:
             return result.get("setPermissionGroupForUsers", False)
             
         except Exception as e:
-            logger.error(f"Failed to set user permissions: {e}")
+            logger.error("Failed to set user permissions: %s", e)
             raise CwayAPIError(f"Failed to set user permissions: {e}")
 
 
@@ -414,7 +414,7 @@ class CwayProjectRepository:
             return projects
             
         except Exception as e:
-            logger.error(f"Failed to fetch planner projects: {e}")
+            logger.error("Failed to fetch planner projects: %s", e)
             raise CwayAPIError(f"Failed to fetch planner projects: {e}")
             
     async def find_project_by_id(self, project_id: str) -> Optional[PlannerProject]:
@@ -473,7 +473,7 @@ class CwayProjectRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to search projects: {e}")
+            logger.error("Failed to search projects: %s", e)
             raise CwayAPIError(f"Failed to search projects: {e}")
     
     async def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
@@ -556,7 +556,7 @@ class CwayProjectRepository:
             return result.get("project")
             
         except Exception as e:
-            logger.error(f"Failed to get project: {e}")
+            logger.error("Failed to get project: %s", e)
             raise CwayAPIError(f"Failed to get project: {e}")
     
     async def create_project(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
@@ -581,7 +581,7 @@ class CwayProjectRepository:
             return result.get("createProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to create project: {e}")
+            logger.error("Failed to create project: %s", e)
             raise CwayAPIError(f"Failed to create project: {e}")
     
     async def update_project(self, project_id: str, name: Optional[str] = None,
@@ -611,7 +611,7 @@ class CwayProjectRepository:
             return result.get("updateProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to update project: {e}")
+            logger.error("Failed to update project: %s", e)
             raise CwayAPIError(f"Failed to update project: {e}")
     
     async def close_projects(self, project_ids: List[str], force: bool = False) -> bool:
@@ -630,7 +630,7 @@ class CwayProjectRepository:
             return result.get("closeProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to close projects: {e}")
+            logger.error("Failed to close projects: %s", e)
             raise CwayAPIError(f"Failed to close projects: {e}")
     
     async def reopen_projects(self, project_ids: List[str]) -> bool:
@@ -648,7 +648,7 @@ class CwayProjectRepository:
             return result.get("reopenProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to reopen projects: {e}")
+            logger.error("Failed to reopen projects: %s", e)
             raise CwayAPIError(f"Failed to reopen projects: {e}")
     
     async def delete_projects(self, project_ids: List[str], force: bool = False) -> bool:
@@ -667,7 +667,7 @@ class CwayProjectRepository:
             return result.get("deleteProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete projects: {e}")
+            logger.error("Failed to delete projects: %s", e)
             raise CwayAPIError(f"Failed to delete projects: {e}")
     
     async def get_artwork(self, artwork_id: str) -> Optional[Dict[str, Any]]:
@@ -692,7 +692,7 @@ class CwayProjectRepository:
             return result.get("artwork")
             
         except Exception as e:
-            logger.error(f"Failed to get artwork: {e}")
+            logger.error("Failed to get artwork: %s", e)
             raise CwayAPIError(f"Failed to get artwork: {e}")
     
     async def create_artwork(self, project_id: str, name: str, 
@@ -725,7 +725,7 @@ class CwayProjectRepository:
             return artworks[0] if artworks else {}
             
         except Exception as e:
-            logger.error(f"Failed to create artwork: {e}")
+            logger.error("Failed to create artwork: %s", e)
             raise CwayAPIError(f"Failed to create artwork: {e}")
     
     async def approve_artwork(self, artwork_id: str) -> Optional[Dict[str, Any]]:
@@ -745,7 +745,7 @@ class CwayProjectRepository:
             return result.get("approveArtwork")
             
         except Exception as e:
-            logger.error(f"Failed to approve artwork: {e}")
+            logger.error("Failed to approve artwork: %s", e)
             raise CwayAPIError(f"Failed to approve artwork: {e}")
     
     async def reject_artwork(self, artwork_id: str, reason: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -769,7 +769,7 @@ class CwayProjectRepository:
             return result.get("rejectArtwork")
             
         except Exception as e:
-            logger.error(f"Failed to reject artwork: {e}")
+            logger.error("Failed to reject artwork: %s", e)
             raise CwayAPIError(f"Failed to reject artwork: {e}")
     
     async def get_artworks_to_approve(self) -> List[Dict[str, Any]]:
@@ -811,7 +811,7 @@ class CwayProjectRepository:
             return result.get("artworksToApprove", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artworks to approve: {e}")
+            logger.error("Failed to get artworks to approve: %s", e)
             raise CwayAPIError(f"Failed to get artworks to approve: {e}")
     
     async def get_artworks_to_upload(self) -> List[Dict[str, Any]]:
@@ -853,7 +853,7 @@ class CwayProjectRepository:
             return result.get("artworksToUpload", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artworks to upload: {e}")
+            logger.error("Failed to get artworks to upload: %s", e)
             raise CwayAPIError(f"Failed to get artworks to upload: {e}")
     
     async def get_my_artworks(self) -> Dict[str, Any]:
@@ -870,7 +870,7 @@ class CwayProjectRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get user's artworks: {e}")
+            logger.error("Failed to get user's artworks: %s", e)
             raise CwayAPIError(f"Failed to get user's artworks: {e}")
     
     async def create_artwork_download_job(self, artwork_ids: List[str], zip_name: Optional[str] = None) -> str:
@@ -910,7 +910,7 @@ class CwayProjectRepository:
             return result.get("createDownloadJob")
             
         except Exception as e:
-            logger.error(f"Failed to create artwork download job: {e}")
+            logger.error("Failed to create artwork download job: %s", e)
             raise CwayAPIError(f"Failed to create artwork download job: {e}")
     
     async def get_artwork_preview(self, artwork_id: str) -> Optional[Dict[str, Any]]:
@@ -941,7 +941,7 @@ class CwayProjectRepository:
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get artwork preview: {e}")
+            logger.error("Failed to get artwork preview: %s", e)
             raise CwayAPIError(f"Failed to get artwork preview: {e}")
     
     async def get_project_status_summary(self) -> Dict[str, Any]:
@@ -1007,7 +1007,7 @@ class CwayProjectRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get project status summary: {e}")
+            logger.error("Failed to get project status summary: %s", e)
             raise CwayAPIError(f"Failed to get project status summary: {e}")
     
     async def compare_projects(self, project_ids: List[str]) -> Dict[str, Any]:
@@ -1058,7 +1058,7 @@ class CwayProjectRepository:
             return result.get("projectHistory", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project history: {e}")
+            logger.error("Failed to get project history: %s", e)
             raise CwayAPIError(f"Failed to get project history: {e}")
     
     async def get_monthly_project_trends(self) -> List[Dict[str, Any]]:
@@ -1077,7 +1077,7 @@ class CwayProjectRepository:
             return result.get("openProjectsCountByMonth", [])
             
         except Exception as e:
-            logger.error(f"Failed to get monthly project trends: {e}")
+            logger.error("Failed to get monthly project trends: %s", e)
             raise CwayAPIError(f"Failed to get monthly project trends: {e}")
     
     async def get_artwork_history(self, artwork_id: str) -> List[Dict[str, Any]]:
@@ -1102,7 +1102,7 @@ class CwayProjectRepository:
             return result.get("artworkHistory", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artwork history: {e}")
+            logger.error("Failed to get artwork history: %s", e)
             raise CwayAPIError(f"Failed to get artwork history: {e}")
     
     async def analyze_artwork_ai(self, artwork_id: str) -> str:
@@ -1121,7 +1121,7 @@ class CwayProjectRepository:
             return thread_id
             
         except Exception as e:
-            logger.error(f"Failed to trigger AI artwork analysis: {e}")
+            logger.error("Failed to trigger AI artwork analysis: %s", e)
             raise CwayAPIError(f"Failed to trigger AI artwork analysis: {e}")
     
     async def generate_project_summary_ai(self, project_id: str, audience: str = "PROJECT_MANAGER") -> str:
@@ -1143,7 +1143,7 @@ class CwayProjectRepository:
             return summary
             
         except Exception as e:
-            logger.error(f"Failed to generate AI project summary: {e}")
+            logger.error("Failed to generate AI project summary: %s", e)
             raise CwayAPIError(f"Failed to generate AI project summary: {e}")
     
     async def get_folder_tree(self) -> List[Dict[str, Any]]:
@@ -1166,7 +1166,7 @@ class CwayProjectRepository:
             return result.get("tree", [])
             
         except Exception as e:
-            logger.error(f"Failed to get folder tree: {e}")
+            logger.error("Failed to get folder tree: %s", e)
             raise CwayAPIError(f"Failed to get folder tree: {e}")
     
     async def get_folder(self, folder_id: str) -> Optional[Dict[str, Any]]:
@@ -1187,7 +1187,7 @@ class CwayProjectRepository:
             return result.get("folder")
             
         except Exception as e:
-            logger.error(f"Failed to get folder: {e}")
+            logger.error("Failed to get folder: %s", e)
             raise CwayAPIError(f"Failed to get folder: {e}")
     
     async def get_folder_items(self, folder_id: str, page: int = 0, 
@@ -1217,7 +1217,7 @@ class CwayProjectRepository:
             return result.get("itemsForFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to get folder items: {e}")
+            logger.error("Failed to get folder items: %s", e)
             raise CwayAPIError(f"Failed to get folder items: {e}")
     
     async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
@@ -1239,7 +1239,7 @@ class CwayProjectRepository:
             return result.get("file")
             
         except Exception as e:
-            logger.error(f"Failed to get file: {e}")
+            logger.error("Failed to get file: %s", e)
             raise CwayAPIError(f"Failed to get file: {e}")
     
     async def search_media_center(
@@ -1315,7 +1315,7 @@ class CwayProjectRepository:
             }
             
         except Exception as e:
-            logger.error(f"Failed to search media center: {e}")
+            logger.error("Failed to search media center: %s", e)
             raise CwayAPIError(f"Failed to search media center: {e}")
     
     async def create_folder(self, name: str, parent_folder_id: Optional[str] = None,
@@ -1347,7 +1347,7 @@ class CwayProjectRepository:
             return result.get("createFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to create folder: {e}")
+            logger.error("Failed to create folder: %s", e)
             raise CwayAPIError(f"Failed to create folder: {e}")
     
     async def rename_file(self, file_id: str, new_name: str) -> Dict[str, Any]:
@@ -1371,7 +1371,7 @@ class CwayProjectRepository:
             return result.get("renameFile", {})
             
         except Exception as e:
-            logger.error(f"Failed to rename file: {e}")
+            logger.error("Failed to rename file: %s", e)
             raise CwayAPIError(f"Failed to rename file: {e}")
     
     async def rename_folder(self, folder_id: str, new_name: str) -> Dict[str, Any]:
@@ -1395,7 +1395,7 @@ class CwayProjectRepository:
             return result.get("renameFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to rename folder: {e}")
+            logger.error("Failed to rename folder: %s", e)
             raise CwayAPIError(f"Failed to rename folder: {e}")
     
     async def move_files(self, file_ids: List[str], target_folder_id: str) -> Dict[str, Any]:
@@ -1419,7 +1419,7 @@ class CwayProjectRepository:
             return result.get("moveFiles", {"success": False, "movedCount": 0})
             
         except Exception as e:
-            logger.error(f"Failed to move files: {e}")
+            logger.error("Failed to move files: %s", e)
             raise CwayAPIError(f"Failed to move files: {e}")
     
     async def delete_file(self, file_id: str) -> bool:
@@ -1435,7 +1435,7 @@ class CwayProjectRepository:
             return result.get("deleteFile", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete file: {e}")
+            logger.error("Failed to delete file: %s", e)
             raise CwayAPIError(f"Failed to delete file: {e}")
     
     async def delete_folder(self, folder_id: str, force: bool = False) -> bool:
@@ -1454,7 +1454,7 @@ class CwayProjectRepository:
             return result.get("deleteFolder", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete folder: {e}")
+            logger.error("Failed to delete folder: %s", e)
             raise CwayAPIError(f"Failed to delete folder: {e}")
     
     async def get_media_center_stats(self) -> Dict[str, Any]:
@@ -1477,7 +1477,7 @@ class CwayProjectRepository:
             return result.get("mediaCenterStats", {})
             
         except Exception as e:
-            logger.error(f"Failed to get media center stats: {e}")
+            logger.error("Failed to get media center stats: %s", e)
             raise CwayAPIError(f"Failed to get media center stats: {e}")
     
     async def download_folder_contents(self, folder_id: str, zip_name: Optional[str] = None) -> str:
@@ -1519,7 +1519,7 @@ class CwayProjectRepository:
             return result.get("createDownloadJob")
             
         except Exception as e:
-            logger.error(f"Failed to create folder download job: {e}")
+            logger.error("Failed to create folder download job: %s", e)
             raise CwayAPIError(f"Failed to create folder download job: {e}")
     
     async def download_project_media(self, project_id: str, zip_name: Optional[str] = None) -> str:
@@ -1572,7 +1572,7 @@ class CwayProjectRepository:
             return result.get("createDownloadJob")
             
         except Exception as e:
-            logger.error(f"Failed to create project media download job: {e}")
+            logger.error("Failed to create project media download job: %s", e)
             raise CwayAPIError(f"Failed to create project media download job: {e}")
     
     async def get_project_members(self, project_id: str) -> List[Dict[str, Any]]:
@@ -1597,7 +1597,7 @@ class CwayProjectRepository:
             return result.get("projectMembers", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project members: {e}")
+            logger.error("Failed to get project members: %s", e)
             raise CwayAPIError(f"Failed to get project members: {e}")
     
     async def add_project_member(self, project_id: str, user_id: str, role: str = "MEMBER") -> Dict[str, Any]:
@@ -1626,7 +1626,7 @@ class CwayProjectRepository:
             return result.get("addProjectMember", {})
             
         except Exception as e:
-            logger.error(f"Failed to add project member: {e}")
+            logger.error("Failed to add project member: %s", e)
             raise CwayAPIError(f"Failed to add project member: {e}")
     
     async def remove_project_member(self, project_id: str, user_id: str) -> bool:
@@ -1645,7 +1645,7 @@ class CwayProjectRepository:
             return result.get("removeProjectMember", False)
             
         except Exception as e:
-            logger.error(f"Failed to remove project member: {e}")
+            logger.error("Failed to remove project member: %s", e)
             raise CwayAPIError(f"Failed to remove project member: {e}")
     
     async def update_project_member_role(self, project_id: str, user_id: str, role: str) -> Dict[str, Any]:
@@ -1673,7 +1673,7 @@ class CwayProjectRepository:
             return result.get("updateProjectMemberRole", {})
             
         except Exception as e:
-            logger.error(f"Failed to update project member role: {e}")
+            logger.error("Failed to update project member role: %s", e)
             raise CwayAPIError(f"Failed to update project member role: {e}")
     
     async def get_project_comments(self, project_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -1702,7 +1702,7 @@ class CwayProjectRepository:
             return result.get("projectComments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project comments: {e}")
+            logger.error("Failed to get project comments: %s", e)
             raise CwayAPIError(f"Failed to get project comments: {e}")
     
     async def add_project_comment(self, project_id: str, text: str) -> Dict[str, Any]:
@@ -1731,7 +1731,7 @@ class CwayProjectRepository:
             return result.get("addProjectComment", {})
             
         except Exception as e:
-            logger.error(f"Failed to add project comment: {e}")
+            logger.error("Failed to add project comment: %s", e)
             raise CwayAPIError(f"Failed to add project comment: {e}")
     
     async def get_project_attachments(self, project_id: str) -> List[Dict[str, Any]]:
@@ -1758,7 +1758,7 @@ class CwayProjectRepository:
             return result.get("projectAttachments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project attachments: {e}")
+            logger.error("Failed to get project attachments: %s", e)
             raise CwayAPIError(f"Failed to get project attachments: {e}")
     
     async def upload_project_attachment(self, project_id: str, file_id: str, name: str) -> Dict[str, Any]:
@@ -1784,7 +1784,7 @@ class CwayProjectRepository:
             return result.get("attachFileToProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to upload project attachment: {e}")
+            logger.error("Failed to upload project attachment: %s", e)
             raise CwayAPIError(f"Failed to upload project attachment: {e}")
     
     async def submit_artwork_for_review(self, artwork_id: str) -> Dict[str, Any]:
@@ -1805,7 +1805,7 @@ class CwayProjectRepository:
             return result.get("submitArtworkForReview", {})
             
         except Exception as e:
-            logger.error(f"Failed to submit artwork for review: {e}")
+            logger.error("Failed to submit artwork for review: %s", e)
             raise CwayAPIError(f"Failed to submit artwork for review: {e}")
     
     async def request_artwork_changes(self, artwork_id: str, reason: str) -> Dict[str, Any]:
@@ -1831,7 +1831,7 @@ class CwayProjectRepository:
             return result.get("requestArtworkChanges", {})
             
         except Exception as e:
-            logger.error(f"Failed to request artwork changes: {e}")
+            logger.error("Failed to request artwork changes: %s", e)
             raise CwayAPIError(f"Failed to request artwork changes: {e}")
     
     async def get_artwork_comments(self, artwork_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -1860,7 +1860,7 @@ class CwayProjectRepository:
             return result.get("artworkComments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artwork comments: {e}")
+            logger.error("Failed to get artwork comments: %s", e)
             raise CwayAPIError(f"Failed to get artwork comments: {e}")
     
     async def add_artwork_comment(self, artwork_id: str, text: str) -> Dict[str, Any]:
@@ -1889,7 +1889,7 @@ class CwayProjectRepository:
             return result.get("addArtworkComment", {})
             
         except Exception as e:
-            logger.error(f"Failed to add artwork comment: {e}")
+            logger.error("Failed to add artwork comment: %s", e)
             raise CwayAPIError(f"Failed to add artwork comment: {e}")
     
     async def get_artwork_versions(self, artwork_id: str) -> List[Dict[str, Any]]:
@@ -1919,7 +1919,7 @@ class CwayProjectRepository:
             return result.get("artworkVersions", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artwork versions: {e}")
+            logger.error("Failed to get artwork versions: %s", e)
             raise CwayAPIError(f"Failed to get artwork versions: {e}")
     
     async def restore_artwork_version(self, artwork_id: str, version_id: str) -> Dict[str, Any]:
@@ -1945,7 +1945,7 @@ class CwayProjectRepository:
             return result.get("restoreArtworkVersion", {})
             
         except Exception as e:
-            logger.error(f"Failed to restore artwork version: {e}")
+            logger.error("Failed to restore artwork version: %s", e)
             raise CwayAPIError(f"Failed to restore artwork version: {e}")
     
     async def assign_artwork(self, artwork_id: str, user_id: str) -> Dict[str, Any]:
@@ -1975,7 +1975,7 @@ class CwayProjectRepository:
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to assign artwork: {e}")
+            logger.error("Failed to assign artwork: %s", e)
             raise CwayAPIError(f"Failed to assign artwork: {e}")
     
     async def duplicate_artwork(self, artwork_id: str, new_name: Optional[str] = None) -> Dict[str, Any]:
@@ -2003,7 +2003,7 @@ class CwayProjectRepository:
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to duplicate artwork: {e}")
+            logger.error("Failed to duplicate artwork: %s", e)
             raise CwayAPIError(f"Failed to duplicate artwork: {e}")
     
     async def archive_artwork(self, artwork_id: str) -> Dict[str, Any]:
@@ -2027,7 +2027,7 @@ class CwayProjectRepository:
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to archive artwork: {e}")
+            logger.error("Failed to archive artwork: %s", e)
             raise CwayAPIError(f"Failed to archive artwork: {e}")
     
     async def unarchive_artwork(self, artwork_id: str) -> Dict[str, Any]:
@@ -2051,7 +2051,7 @@ class CwayProjectRepository:
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to unarchive artwork: {e}")
+            logger.error("Failed to unarchive artwork: %s", e)
             raise CwayAPIError(f"Failed to unarchive artwork: {e}")
     
     async def get_team_members(self, project_id: str) -> List[Dict[str, Any]]:
@@ -2083,7 +2083,7 @@ class CwayProjectRepository:
             return project.get("team", [])
             
         except Exception as e:
-            logger.error(f"Failed to get team members: {e}")
+            logger.error("Failed to get team members: %s", e)
             raise CwayAPIError(f"Failed to get team members: {e}")
     
     async def add_team_member(self, project_id: str, user_id: str, role: Optional[str] = None) -> Dict[str, Any]:
@@ -2116,7 +2116,7 @@ class CwayProjectRepository:
             return team_member
             
         except Exception as e:
-            logger.error(f"Failed to add team member: {e}")
+            logger.error("Failed to add team member: %s", e)
             raise CwayAPIError(f"Failed to add team member: {e}")
     
     async def remove_team_member(self, project_id: str, user_id: str) -> Dict[str, Any]:
@@ -2141,7 +2141,7 @@ class CwayProjectRepository:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to remove team member: {e}")
+            logger.error("Failed to remove team member: %s", e)
             raise CwayAPIError(f"Failed to remove team member: {e}")
     
     async def update_team_member_role(self, project_id: str, user_id: str, role: str) -> Dict[str, Any]:
@@ -2174,7 +2174,7 @@ class CwayProjectRepository:
             return team_member
             
         except Exception as e:
-            logger.error(f"Failed to update team member role: {e}")
+            logger.error("Failed to update team member role: %s", e)
             raise CwayAPIError(f"Failed to update team member role: {e}")
     
     async def get_user_roles(self) -> List[Dict[str, Any]]:
@@ -2195,7 +2195,7 @@ class CwayProjectRepository:
             return result.get("userRoles", [])
             
         except Exception as e:
-            logger.error(f"Failed to get user roles: {e}")
+            logger.error("Failed to get user roles: %s", e)
             raise CwayAPIError(f"Failed to get user roles: {e}")
     
     async def transfer_project_ownership(self, project_id: str, new_owner_id: str) -> Dict[str, Any]:
@@ -2227,7 +2227,7 @@ class CwayProjectRepository:
             return project
             
         except Exception as e:
-            logger.error(f"Failed to transfer project ownership: {e}")
+            logger.error("Failed to transfer project ownership: %s", e)
             raise CwayAPIError(f"Failed to transfer project ownership: {e}")
     
     async def search_artworks(self, query: Optional[str] = None, project_id: Optional[str] = None,
@@ -2266,7 +2266,7 @@ class CwayProjectRepository:
             return result.get("searchArtworks", {"artworks": [], "totalHits": 0, "page": 0})
             
         except Exception as e:
-            logger.error(f"Failed to search artworks: {e}")
+            logger.error("Failed to search artworks: %s", e)
             raise CwayAPIError(f"Failed to search artworks: {e}")
     
     async def get_project_timeline(self, project_id: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -2297,7 +2297,7 @@ class CwayProjectRepository:
             return result.get("projectTimeline", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project timeline: {e}")
+            logger.error("Failed to get project timeline: %s", e)
             raise CwayAPIError(f"Failed to get project timeline: {e}")
     
     async def get_user_activity(self, user_id: str, days: int = 30, limit: int = 100) -> List[Dict[str, Any]]:
@@ -2327,7 +2327,7 @@ class CwayProjectRepository:
             return result.get("userActivity", [])
             
         except Exception as e:
-            logger.error(f"Failed to get user activity: {e}")
+            logger.error("Failed to get user activity: %s", e)
             raise CwayAPIError(f"Failed to get user activity: {e}")
     
     async def bulk_update_artwork_status(self, artwork_ids: List[str], status: str) -> Dict[str, Any]:
@@ -2358,7 +2358,7 @@ class CwayProjectRepository:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to bulk update artwork status: {e}")
+            logger.error("Failed to bulk update artwork status: %s", e)
             raise CwayAPIError(f"Failed to bulk update artwork status: {e}")
     
     async def find_shares(self, limit: int = 50) -> List[Dict[str, Any]]:
@@ -2389,7 +2389,7 @@ class CwayProjectRepository:
             return shares_data.get("shares", [])
             
         except Exception as e:
-            logger.error(f"Failed to find shares: {e}")
+            logger.error("Failed to find shares: %s", e)
             raise CwayAPIError(f"Failed to find shares: {e}")
     
     async def get_share(self, share_id: str) -> Optional[Dict[str, Any]]:
@@ -2419,7 +2419,7 @@ class CwayProjectRepository:
             return result.get("share")
             
         except Exception as e:
-            logger.error(f"Failed to get share: {e}")
+            logger.error("Failed to get share: %s", e)
             raise CwayAPIError(f"Failed to get share: {e}")
     
     async def create_share(self, name: str, file_ids: List[str], 
@@ -2457,7 +2457,7 @@ class CwayProjectRepository:
             return result.get("createShare", {})
             
         except Exception as e:
-            logger.error(f"Failed to create share: {e}")
+            logger.error("Failed to create share: %s", e)
             raise CwayAPIError(f"Failed to create share: {e}")
     
     async def delete_share(self, share_id: str) -> bool:
@@ -2473,7 +2473,7 @@ class CwayProjectRepository:
             return result.get("deleteShare", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete share: {e}")
+            logger.error("Failed to delete share: %s", e)
             raise CwayAPIError(f"Failed to delete share: {e}")
 
 
@@ -2502,7 +2502,7 @@ class CwayCategoryRepository:
             return result.get("categories", [])
             
         except Exception as e:
-            logger.error(f"Failed to get categories: {e}")
+            logger.error("Failed to get categories: %s", e)
             raise CwayAPIError(f"Failed to get categories: {e}")
     
     async def get_brands(self) -> List[Dict[str, Any]]:
@@ -2522,7 +2522,7 @@ class CwayCategoryRepository:
             return result.get("brands", [])
             
         except Exception as e:
-            logger.error(f"Failed to get brands: {e}")
+            logger.error("Failed to get brands: %s", e)
             raise CwayAPIError(f"Failed to get brands: {e}")
     
     async def get_print_specifications(self) -> List[Dict[str, Any]]:
@@ -2545,9 +2545,47 @@ class CwayCategoryRepository:
             return result.get("printSpecifications", [])
             
         except Exception as e:
-            logger.error(f"Failed to get print specifications: {e}")
+            logger.error("Failed to get print specifications: %s", e)
             raise CwayAPIError(f"Failed to get print specifications: {e}")
     
+    async def get_taxonomy(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get categories, brands, and print specifications in a single request."""
+        query = """
+        query GetTaxonomy {
+            categories {
+                id
+                name
+                description
+                color
+            }
+            brands {
+                id
+                name
+                description
+            }
+            printSpecifications {
+                id
+                name
+                description
+                width
+                height
+                unit
+            }
+        }
+        """
+        
+        try:
+            result = await self.graphql_client.execute_query(query)
+            return {
+                "categories": result.get("categories", []),
+                "brands": result.get("brands", []),
+                "specifications": result.get("printSpecifications", [])
+            }
+            
+        except Exception as e:
+            logger.error("Failed to get taxonomy: %s", e)
+            raise CwayAPIError(f"Failed to get taxonomy: {e}")
+    
     async def create_category(self, name: str, description: Optional[str] = None, 
                              color: Optional[str] = None) -> Dict[str, Any]:
         """Create a new category."""
@@ -2573,7 +2611,7 @@ class CwayCategoryRepository:
             return result.get("createCategory", {})
             
         except Exception as e:
-            logger.error(f"Failed to create category: {e}")
+            logger.error("Failed to create category: %s", e)
             raise CwayAPIError(f"Failed to create category: {e}")
     
     async def create_brand(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
@@ -2598,7 +2636,7 @@ class CwayCategoryRepository:
             return result.get("createBrand", {})
             
         except Exception as e:
-            logger.error(f"Failed to create brand: {e}")
+            logger.error("Failed to create brand: %s", e)
             raise CwayAPIError(f"Failed to create brand: {e}")
     
     async def create_print_specification(self, name: str, width: float, height: float,
@@ -2630,7 +2668,7 @@ class CwayCategoryRepository:
             return result.get("createPrintSpecification", {})
             
         except Exception as e:
-            logger.error(f"Failed to create print specification: {e}")
+            logger.error("Failed to create print specification: %s", e)
             raise CwayAPIError(f"Failed to create print specification: {e}")
 
 
@@ -2657,7 +2695,7 @@ class CwaySystemRepository:
             return result.get("loginInfo")
             
         except Exception as e:
-            logger.error(f"Failed to get login info: {e}")
+            logger.error("Failed to get login info: %s", e)
             # This might fail if loginInfo doesn't have the expected fields
             return None
             
@@ -2668,5 +2706,5 @@ class CwaySystemRepository:
             result = await self.graphql_client.execute_query("{ __typename }")
             return result.get("__typename") == "Query"
         except Exception as e:
-            logger.error(f"Connection validation failed: {e}")
+            logger.error("Connection validation failed: %s", e)
             return False
\ No newline at end of file
@@ -54,7 +54,7 @@ class CwayGraphQLClient:
         try:
             settings.validate_auth_config()
         except ValueError as e:
-            logger.error(f"Authentication configuration error: {e}")
+            logger.error("Authentication configuration error: %s", e)
             raise
         
         if settings.auth_method == "oauth2":
@@ -109,22 +109,26 @@ class CwayGraphQLClient:
                 transport=transport,
                 fetch_schema_from_transport=False  # Skip schema introspection for performance
             )
+            # One long-lived session so queries share the HTTP connection pool and can run concurrently
+            await self._client.connect_async()
             
             duration_ms = (time.time() - start_time) * 1000
-            logger.info(f"✅ Connected to Cway GraphQL API at {self.api_url}")
+            logger.info("✅ Connected to Cway GraphQL API at %s", self.api_url)
             log_performance("GraphQL Connection", duration_ms, f"URL: {self.api_url}")
             log_request_flow("GraphQL Connected", f"Ready to execute queries")
             
         except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"❌ Failed to connect to Cway GraphQL API: {e}")
+            logger.error("❌ Failed to connect to Cway GraphQL API: %s", e)
             log_performance("GraphQL Connection Failed", duration_ms, f"Error: {e}")
             raise
         
     async def disconnect(self) -> None:
         """Close the GraphQL client connection."""
-        if self._client and self._client.transport:
-            await self._client.transport.close()
+        if self._client:
+            # Closes the persistent session opened by connect_async and its transport
+            await self._client.close_async()
+            self._client = None
         logger.info("Disconnected from Cway GraphQL API")
         
     async def execute_query(
@@ -153,19 +157,19 @@ class CwayGraphQLClient:
         
         for attempt in range(settings.max_retries):
             try:
-                logger.debug(f"Executing GraphQL query (attempt {attempt + 1})")
-                result = await self._client.execute_async(gql_query, variable_values=variables)
+                logger.debug("Executing GraphQL query (attempt %s)", attempt + 1)
+                result = await self._client.session.execute(gql_query, variable_values=variables)
                 logger.debug("GraphQL query executed successfully")
                 return result
                 
             except TransportError as e:
-                logger.warning(f"Transport error on attempt {attempt + 1}: {e}")
+                logger.warning("Transport error on attempt %s: %s", attempt + 1, e)
                 if attempt == settings.max_retries - 1:
                     raise ConnectionError(f"Failed to connect to Cway API after {settings.max_retries} attempts") from e
                 await asyncio.sleep(2 ** attempt)  # Exponential backoff
                 
             except Exception as e:
-                logger.error(f"Unexpected error in GraphQL query: {e}")
+                logger.error("Unexpected error in GraphQL query: %s", e)
                 raise CwayAPIError(f"GraphQL query failed: {e}") from e
                 
         raise ConnectionError("Max retries exceeded")
@@ -216,7 +220,7 @@ class CwayGraphQLClient:
             result = await self.execute_query(introspection_query)
             return result.get("__schema")
         except Exception as e:
-            logger.warning(f"Schema introspection failed: {e}")
+            logger.warning("Schema introspection failed: %s", e)
             return None
             
 
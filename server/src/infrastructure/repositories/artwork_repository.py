@@ -4,11 +4,12 @@ Artwork Repository - Handles artwork operations.
 Single Responsibility: Artwork data access only.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 import logging
 
 from src.infrastructure.graphql_client import CwayAPIError
-from .base_repository import BaseRepository
+from .base_repository import MAX_CONCURRENT_FETCHES, BaseRepository
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +39,78 @@ class ArtworkRepository(BaseRepository):
             return result.get("artwork")
             
         except Exception as e:
-            logger.error(f"Failed to get artwork: {e}")
+            logger.error("Failed to get artwork: %s", e)
             raise CwayAPIError(f"Failed to get artwork: {e}")
     
+    async def get_artwork_current_files(self, artwork_id: str) -> Optional[Dict[str, Any]]:
+        """Get an artwork's name and the files of its current revision."""
+        query = """
+        query GetArtworkCurrentFiles($id: UUID!) {
+            artwork(id: $id) {
+                id
+                name
+                currentRevision {
+                    id
+                    files {
+                        id
+                        name
+                    }
+                }
+            }
+        }
+        """
+        
+        try:
+            result = await self._execute_query(query, {"id": artwork_id})
+            return result.get("artwork")
+            
+        except Exception as e:
+            logger.error("Failed to get artwork files: %s", e)
+            raise CwayAPIError(f"Failed to get artwork files: {e}")
+    
+    async def create_artwork_download_job(self, artwork_ids: List[str], zip_name: Optional[str] = None) -> str:
+        """Create a download job for artwork files (latest revisions)."""
+        mutation = """
+        mutation CreateDownloadJob($selections: [DownloadFileDescriptorInput!]!, $zipName: String, $forceZipFile: Boolean) {
+            createDownloadJob(selections: $selections, zipName: $zipName, forceZipFile: $forceZipFile)
+        }
+        """
+        
+        # Fetch each artwork's current revision concurrently, bounded to avoid hammering the API
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        
+        async def fetch_artwork(artwork_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_artwork_current_files(artwork_id)
+        
+        artworks = await asyncio.gather(*(fetch_artwork(artwork_id) for artwork_id in artwork_ids))
+        
+        selections = [
+            {
+                "fileId": file["id"],
+                "fileName": file.get("name", "file"),
+                "folder": artwork.get("name", "artwork")
+            }
+            for artwork in artworks
+            if artwork and artwork.get("currentRevision")
+            for file in artwork["currentRevision"].get("files") or []
+        ]
+        if not selections:
+            raise CwayAPIError("No files found for the specified artworks")
+        
+        try:
+            variables = {
+                "selections": selections,
+                "zipName": zip_name or "artworks",
+                "forceZipFile": True
+            }
+            result = await self._execute_mutation(mutation, variables)
+            return result.get("createDownloadJob")
+            
+        except Exception as e:
+            logger.error("Failed to create artwork download job: %s", e)
+            raise CwayAPIError(f"Failed to create artwork download job: {e}")
+    
     async def create_artwork(self, project_id: str, name: str, 
                             description: Optional[str] = None) -> Dict[str, Any]:
         """Create a new artwork in a project."""
@@ -71,7 +141,7 @@ class ArtworkRepository(BaseRepository):
             return artworks[0] if artworks else {}
             
         except Exception as e:
-            logger.error(f"Failed to create artwork: {e}")
+            logger.error("Failed to create artwork: %s", e)
             raise CwayAPIError(f"Failed to create artwork: {e}")
     
     async def approve_artwork(self, artwork_id: str) -> Optional[Dict[str, Any]]:
@@ -91,7 +161,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("approveArtwork")
             
         except Exception as e:
-            logger.error(f"Failed to approve artwork: {e}")
+            logger.error("Failed to approve artwork: %s", e)
             raise CwayAPIError(f"Failed to approve artwork: {e}")
     
     async def reject_artwork(self, artwork_id: str, reason: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -115,9 +185,47 @@ class ArtworkRepository(BaseRepository):
             return result.get("rejectArtwork")
             
         except Exception as e:
-            logger.error(f"Failed to reject artwork: {e}")
+            logger.error("Failed to reject artwork: %s", e)
             raise CwayAPIError(f"Failed to reject artwork: {e}")
     
+    async def approve_artworks(self, project_id: str, artwork_ids: List[str]) -> bool:
+        """Approve several artworks in a project with one mutation."""
+        mutation = """
+        mutation ApproveArtworks($projectId: UUID!, $artworkIds: [UUID!]!) {
+            approveArtworks(projectId: $projectId, artworkIds: $artworkIds)
+        }
+        """
+        
+        try:
+            result = await self._execute_mutation(mutation, {
+                "projectId": project_id,
+                "artworkIds": artwork_ids
+            })
+            return result.get("approveArtworks", False)
+            
+        except Exception as e:
+            logger.error("Failed to approve artworks: %s", e)
+            raise CwayAPIError(f"Failed to approve artworks: {e}")
+    
+    async def reject_artworks(self, project_id: str, artwork_ids: List[str]) -> bool:
+        """Reject several artworks in a project with one mutation."""
+        mutation = """
+        mutation RejectArtworks($projectId: UUID!, $artworkIds: [UUID!]!) {
+            rejectArtworks(projectId: $projectId, artworkIds: $artworkIds)
+        }
+        """
+        
+        try:
+            result = await self._execute_mutation(mutation, {
+                "projectId": project_id,
+                "artworkIds": artwork_ids
+            })
+            return result.get("rejectArtworks", False)
+            
+        except Exception as e:
+            logger.error("Failed to reject artworks: %s", e)
+            raise CwayAPIError(f"Failed to reject artworks: {e}")
+    
     async def get_artworks_to_approve(self) -> List[Dict[str, Any]]:
         """Get all artworks awaiting approval by the current user."""
         query = """
@@ -157,7 +265,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("artworksToApprove", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artworks to approve: {e}")
+            logger.error("Failed to get artworks to approve: %s", e)
             raise CwayAPIError(f"Failed to get artworks to approve: {e}")
     
     async def get_artworks_to_upload(self) -> List[Dict[str, Any]]:
@@ -199,7 +307,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("artworksToUpload", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artworks to upload: {e}")
+            logger.error("Failed to get artworks to upload: %s", e)
             raise CwayAPIError(f"Failed to get artworks to upload: {e}")
     
     async def get_my_artworks(self) -> Dict[str, Any]:
@@ -216,7 +324,7 @@ class ArtworkRepository(BaseRepository):
             }
             
         except Exception as e:
-            logger.error(f"Failed to get user's artworks: {e}")
+            logger.error("Failed to get user's artworks: %s", e)
             raise CwayAPIError(f"Failed to get user's artworks: {e}")
     
     async def submit_artwork_for_review(self, artwork_id: str) -> Dict[str, Any]:
@@ -237,7 +345,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("submitArtworkForReview", {})
             
         except Exception as e:
-            logger.error(f"Failed to submit artwork for review: {e}")
+            logger.error("Failed to submit artwork for review: %s", e)
             raise CwayAPIError(f"Failed to submit artwork for review: {e}")
     
     async def request_artwork_changes(self, artwork_id: str, reason: str) -> Dict[str, Any]:
@@ -263,7 +371,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("requestArtworkChanges", {})
             
         except Exception as e:
-            logger.error(f"Failed to request artwork changes: {e}")
+            logger.error("Failed to request artwork changes: %s", e)
             raise CwayAPIError(f"Failed to request artwork changes: {e}")
     
     async def get_artwork_comments(self, artwork_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -292,7 +400,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("artworkComments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artwork comments: {e}")
+            logger.error("Failed to get artwork comments: %s", e)
             raise CwayAPIError(f"Failed to get artwork comments: {e}")
     
     async def add_artwork_comment(self, artwork_id: str, text: str) -> Dict[str, Any]:
@@ -321,7 +429,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("addArtworkComment", {})
             
         except Exception as e:
-            logger.error(f"Failed to add artwork comment: {e}")
+            logger.error("Failed to add artwork comment: %s", e)
             raise CwayAPIError(f"Failed to add artwork comment: {e}")
     
     async def get_artwork_versions(self, artwork_id: str) -> List[Dict[str, Any]]:
@@ -351,7 +459,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("artworkVersions", [])
             
         except Exception as e:
-            logger.error(f"Failed to get artwork versions: {e}")
+            logger.error("Failed to get artwork versions: %s", e)
             raise CwayAPIError(f"Failed to get artwork versions: {e}")
     
     async def restore_artwork_version(self, artwork_id: str, version_id: str) -> Dict[str, Any]:
@@ -377,7 +485,7 @@ class ArtworkRepository(BaseRepository):
             return result.get("restoreArtworkVersion", {})
             
         except Exception as e:
-            logger.error(f"Failed to restore artwork version: {e}")
+            logger.error("Failed to restore artwork version: %s", e)
             raise CwayAPIError(f"Failed to restore artwork version: {e}")
     
     async def assign_artwork(self, artwork_id: str, user_id: str) -> Dict[str, Any]:
@@ -407,7 +515,7 @@ class ArtworkRepository(BaseRepository):
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to assign artwork: {e}")
+            logger.error("Failed to assign artwork: %s", e)
             raise CwayAPIError(f"Failed to assign artwork: {e}")
     
     async def duplicate_artwork(self, artwork_id: str, new_name: Optional[str] = None) -> Dict[str, Any]:
@@ -435,7 +543,7 @@ class ArtworkRepository(BaseRepository):
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to duplicate artwork: {e}")
+            logger.error("Failed to duplicate artwork: %s", e)
             raise CwayAPIError(f"Failed to duplicate artwork: {e}")
     
     async def archive_artwork(self, artwork_id: str) -> Dict[str, Any]:
@@ -459,7 +567,7 @@ class ArtworkRepository(BaseRepository):
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to archive artwork: {e}")
+            logger.error("Failed to archive artwork: %s", e)
             raise CwayAPIError(f"Failed to archive artwork: {e}")
     
     async def unarchive_artwork(self, artwork_id: str) -> Dict[str, Any]:
@@ -483,5 +591,5 @@ class ArtworkRepository(BaseRepository):
             return artwork
             
         except Exception as e:
-            logger.error(f"Failed to unarchive artwork: {e}")
+            logger.error("Failed to unarchive artwork: %s", e)
             raise CwayAPIError(f"Failed to unarchive artwork: {e}")
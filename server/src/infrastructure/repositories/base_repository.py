@@ -12,6 +12,9 @@ from src.infrastructure.graphql_client import CwayGraphQLClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent API requests issued by one fan-out call
+MAX_CONCURRENT_FETCHES = 5
+
 
 class BaseRepository:
     """
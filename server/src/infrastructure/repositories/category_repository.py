@@ -34,7 +34,7 @@ class CategoryRepository(BaseRepository):
             return result.get("categories", [])
             
         except Exception as e:
-            logger.error(f"Failed to get categories: {e}")
+            logger.error("Failed to get categories: %s", e)
             raise CwayAPIError(f"Failed to get categories: {e}")
     
     async def get_brands(self) -> List[Dict[str, Any]]:
@@ -54,7 +54,7 @@ class CategoryRepository(BaseRepository):
             return result.get("brands", [])
             
         except Exception as e:
-            logger.error(f"Failed to get brands: {e}")
+            logger.error("Failed to get brands: %s", e)
             raise CwayAPIError(f"Failed to get brands: {e}")
     
     async def get_print_specifications(self) -> List[Dict[str, Any]]:
@@ -77,9 +77,47 @@ class CategoryRepository(BaseRepository):
             return result.get("printSpecifications", [])
             
         except Exception as e:
-            logger.error(f"Failed to get print specifications: {e}")
+            logger.error("Failed to get print specifications: %s", e)
             raise CwayAPIError(f"Failed to get print specifications: {e}")
     
+    async def get_taxonomy(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get categories, brands, and print specifications in a single request."""
+        query = """
+        query GetTaxonomy {
+            categories {
+                id
+                name
+                description
+                color
+            }
+            brands {
+                id
+                name
+                description
+            }
+            printSpecifications {
+                id
+                name
+                description
+                width
+                height
+                unit
+            }
+        }
+        """
+        
+        try:
+            result = await self._execute_query(query, {})
+            return {
+                "categories": result.get("categories", []),
+                "brands": result.get("brands", []),
+                "specifications": result.get("printSpecifications", [])
+            }
+            
+        except Exception as e:
+            logger.error("Failed to get taxonomy: %s", e)
+            raise CwayAPIError(f"Failed to get taxonomy: {e}")
+    
     async def create_category(self, name: str, description: Optional[str] = None, 
                              color: Optional[str] = None) -> Dict[str, Any]:
         """Create a new category."""
@@ -105,7 +143,7 @@ class CategoryRepository(BaseRepository):
             return result.get("createCategory", {})
             
         except Exception as e:
-            logger.error(f"Failed to create category: {e}")
+            logger.error("Failed to create category: %s", e)
             raise CwayAPIError(f"Failed to create category: {e}")
     
     async def create_brand(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
@@ -130,7 +168,7 @@ class CategoryRepository(BaseRepository):
             return result.get("createBrand", {})
             
         except Exception as e:
-            logger.error(f"Failed to create brand: {e}")
+            logger.error("Failed to create brand: %s", e)
             raise CwayAPIError(f"Failed to create brand: {e}")
     
     async def create_print_specification(self, name: str, width: float, height: float,
@@ -162,5 +200,5 @@ class CategoryRepository(BaseRepository):
             return result.get("createPrintSpecification", {})
             
         except Exception as e:
-            logger.error(f"Failed to create print specification: {e}")
+            logger.error("Failed to create print specification: %s", e)
             raise CwayAPIError(f"Failed to create print specification: {e}")
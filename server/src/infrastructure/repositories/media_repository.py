@@ -36,7 +36,7 @@ class MediaRepository(BaseRepository):
             return result.get("tree", [])
             
         except Exception as e:
-            logger.error(f"Failed to get folder tree: {e}")
+            logger.error("Failed to get folder tree: %s", e)
             raise CwayAPIError(f"Failed to get folder tree: {e}")
     
     async def get_folder(self, folder_id: str) -> Optional[Dict[str, Any]]:
@@ -57,7 +57,7 @@ class MediaRepository(BaseRepository):
             return result.get("folder")
             
         except Exception as e:
-            logger.error(f"Failed to get folder: {e}")
+            logger.error("Failed to get folder: %s", e)
             raise CwayAPIError(f"Failed to get folder: {e}")
     
     async def get_folder_items(self, folder_id: str, page: int = 0, 
@@ -86,7 +86,7 @@ class MediaRepository(BaseRepository):
             return result.get("itemsForFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to get folder items: {e}")
+            logger.error("Failed to get folder items: %s", e)
             raise CwayAPIError(f"Failed to get folder items: {e}")
     
     async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
@@ -108,7 +108,7 @@ class MediaRepository(BaseRepository):
             return result.get("file")
             
         except Exception as e:
-            logger.error(f"Failed to get file: {e}")
+            logger.error("Failed to get file: %s", e)
             raise CwayAPIError(f"Failed to get file: {e}")
     
     async def search_media_center(
@@ -184,7 +184,7 @@ class MediaRepository(BaseRepository):
             }
             
         except Exception as e:
-            logger.error(f"Failed to search media center: {e}")
+            logger.error("Failed to search media center: %s", e)
             raise CwayAPIError(f"Failed to search media center: {e}")
     
     async def create_folder(self, name: str, parent_folder_id: Optional[str] = None,
@@ -216,7 +216,7 @@ class MediaRepository(BaseRepository):
             return result.get("createFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to create folder: {e}")
+            logger.error("Failed to create folder: %s", e)
             raise CwayAPIError(f"Failed to create folder: {e}")
     
     async def rename_file(self, file_id: str, new_name: str) -> Dict[str, Any]:
@@ -240,7 +240,7 @@ class MediaRepository(BaseRepository):
             return result.get("renameFile", {})
             
         except Exception as e:
-            logger.error(f"Failed to rename file: {e}")
+            logger.error("Failed to rename file: %s", e)
             raise CwayAPIError(f"Failed to rename file: {e}")
     
     async def rename_folder(self, folder_id: str, new_name: str) -> Dict[str, Any]:
@@ -264,7 +264,7 @@ class MediaRepository(BaseRepository):
             return result.get("renameFolder", {})
             
         except Exception as e:
-            logger.error(f"Failed to rename folder: {e}")
+            logger.error("Failed to rename folder: %s", e)
             raise CwayAPIError(f"Failed to rename folder: {e}")
     
     async def move_files(self, file_ids: List[str], target_folder_id: str) -> Dict[str, Any]:
@@ -288,7 +288,7 @@ class MediaRepository(BaseRepository):
             return result.get("moveFiles", {"success": False, "movedCount": 0})
             
         except Exception as e:
-            logger.error(f"Failed to move files: {e}")
+            logger.error("Failed to move files: %s", e)
             raise CwayAPIError(f"Failed to move files: {e}")
     
     async def delete_file(self, file_id: str) -> bool:
@@ -304,7 +304,7 @@ class MediaRepository(BaseRepository):
             return result.get("deleteFile", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete file: {e}")
+            logger.error("Failed to delete file: %s", e)
             raise CwayAPIError(f"Failed to delete file: {e}")
     
     async def delete_folder(self, folder_id: str, force: bool = False) -> bool:
@@ -323,7 +323,7 @@ class MediaRepository(BaseRepository):
             return result.get("deleteFolder", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete folder: {e}")
+            logger.error("Failed to delete folder: %s", e)
             raise CwayAPIError(f"Failed to delete folder: {e}")
     
     async def get_media_center_stats(self) -> Dict[str, Any]:
@@ -346,7 +346,7 @@ class MediaRepository(BaseRepository):
             return result.get("mediaCenterStats", {})
             
         except Exception as e:
-            logger.error(f"Failed to get media center stats: {e}")
+            logger.error("Failed to get media center stats: %s", e)
             raise CwayAPIError(f"Failed to get media center stats: {e}")
     
     async def download_folder_contents(self, folder_id: str, zip_name: Optional[str] = None) -> str:
@@ -388,7 +388,7 @@ class MediaRepository(BaseRepository):
             return result.get("createDownloadJob")
             
         except Exception as e:
-            logger.error(f"Failed to create folder download job: {e}")
+            logger.error("Failed to create folder download job: %s", e)
             raise CwayAPIError(f"Failed to create folder download job: {e}")
     
     async def download_project_media(self, project_id: str, zip_name: Optional[str] = None) -> str:
@@ -431,5 +431,5 @@ class MediaRepository(BaseRepository):
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get artwork preview: {e}")
+            logger.error("Failed to get artwork preview: %s", e)
             raise CwayAPIError(f"Failed to get artwork preview: {e}")
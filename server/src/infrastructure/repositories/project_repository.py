@@ -4,12 +4,13 @@ Project Repository - Handles project operations.
 Single Responsibility: Project data access only.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 import logging
 
 from src.domain.cway_entities import PlannerProject, ProjectState, parse_cway_date
 from src.infrastructure.graphql_client import CwayAPIError
-from .base_repository import BaseRepository
+from .base_repository import MAX_CONCURRENT_FETCHES, BaseRepository
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +52,7 @@ class ProjectRepository(BaseRepository):
             return projects
             
         except Exception as e:
-            logger.error(f"Failed to fetch planner projects: {e}")
+            logger.error("Failed to fetch planner projects: %s", e)
             raise CwayAPIError(f"Failed to fetch planner projects: {e}")
             
     async def find_project_by_id(self, project_id: str) -> Optional[PlannerProject]:
@@ -109,7 +110,7 @@ class ProjectRepository(BaseRepository):
             }
             
         except Exception as e:
-            logger.error(f"Failed to search projects: {e}")
+            logger.error("Failed to search projects: %s", e)
             raise CwayAPIError(f"Failed to search projects: {e}")
     
     async def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
@@ -192,9 +193,76 @@ class ProjectRepository(BaseRepository):
             return result.get("project")
             
         except Exception as e:
-            logger.error(f"Failed to get project: {e}")
+            logger.error("Failed to get project: %s", e)
             raise CwayAPIError(f"Failed to get project: {e}")
-    
+
+    async def get_projects_by_ids(self, project_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get preview details for several projects in one request.
+
+        The API has no id-list filter, so each project is fetched through an
+        aliased ``project`` field in a single query document.
+
+        Returns:
+            Mapping of project ID to project data; missing projects are omitted
+        """
+        unique_ids = list(dict.fromkeys(project_ids))
+        if not unique_ids:
+            return {}
+
+        variable_defs = ", ".join(f"$id{i}: UUID!" for i in range(len(unique_ids)))
+        fields = "\n".join(
+            f"p{i}: project(id: $id{i}) {{ id name status artworks {{ id }} }}"
+            for i in range(len(unique_ids))
+        )
+        query = f"query GetProjectsByIds({variable_defs}) {{\n{fields}\n}}"
+
+        try:
+            result = await self._execute_query(
+                query, {f"id{i}": pid for i, pid in enumerate(unique_ids)}
+            )
+            projects = {}
+            for i, pid in enumerate(unique_ids):
+                project = result.get(f"p{i}")
+                if project:
+                    projects[pid] = project
+            return projects
+
+        except Exception as e:
+            logger.error("Failed to get projects: %s", e)
+            raise CwayAPIError(f"Failed to get projects: {e}")
+
+    async def compare_projects(self, project_ids: List[str]) -> Dict[str, Any]:
+        """Compare multiple projects side-by-side."""
+        # Lookups are independent, so overlap them (bounded) instead of paying one round trip per project
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch_project(project_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_project_by_id(project_id)
+
+        results = await asyncio.gather(*(fetch_project(project_id) for project_id in project_ids))
+        projects = [project for project in results if project]
+
+        if not projects:
+            return {"projects": [], "comparison": {}}
+
+        comparison = {
+            "avg_progress": sum(p["progress"]["percentageDone"] for p in projects) / len(projects),
+            "total_artworks": sum(
+                p["progress"]["artworksDone"] +
+                p["progress"]["artworksInProgress"] +
+                p["progress"]["artworksUnstarted"]
+                for p in projects
+            ),
+            "states": [p["state"] for p in projects],
+            "statuses": [p["status"] for p in projects]
+        }
+
+        return {
+            "projects": projects,
+            "comparison": comparison
+        }
+
     async def create_project(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
         """Create a new project."""
         mutation = """
@@ -217,7 +285,7 @@ class ProjectRepository(BaseRepository):
             return result.get("createProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to create project: {e}")
+            logger.error("Failed to create project: %s", e)
             raise CwayAPIError(f"Failed to create project: {e}")
     
     async def update_project(self, project_id: str, name: Optional[str] = None,
@@ -247,7 +315,7 @@ class ProjectRepository(BaseRepository):
             return result.get("updateProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to update project: {e}")
+            logger.error("Failed to update project: %s", e)
             raise CwayAPIError(f"Failed to update project: {e}")
     
     async def close_projects(self, project_ids: List[str], force: bool = False) -> bool:
@@ -266,7 +334,7 @@ class ProjectRepository(BaseRepository):
             return result.get("closeProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to close projects: {e}")
+            logger.error("Failed to close projects: %s", e)
             raise CwayAPIError(f"Failed to close projects: {e}")
     
     async def reopen_projects(self, project_ids: List[str]) -> bool:
@@ -284,7 +352,7 @@ class ProjectRepository(BaseRepository):
             return result.get("reopenProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to reopen projects: {e}")
+            logger.error("Failed to reopen projects: %s", e)
             raise CwayAPIError(f"Failed to reopen projects: {e}")
     
     async def delete_projects(self, project_ids: List[str], force: bool = False) -> bool:
@@ -303,7 +371,7 @@ class ProjectRepository(BaseRepository):
             return result.get("deleteProjects", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete projects: {e}")
+            logger.error("Failed to delete projects: %s", e)
             raise CwayAPIError(f"Failed to delete projects: {e}")
     
     async def get_project_members(self, project_id: str) -> List[Dict[str, Any]]:
@@ -328,7 +396,7 @@ class ProjectRepository(BaseRepository):
             return result.get("projectMembers", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project members: {e}")
+            logger.error("Failed to get project members: %s", e)
             raise CwayAPIError(f"Failed to get project members: {e}")
     
     async def add_project_member(self, project_id: str, user_id: str, role: str = "MEMBER") -> Dict[str, Any]:
@@ -357,7 +425,7 @@ class ProjectRepository(BaseRepository):
             return result.get("addProjectMember", {})
             
         except Exception as e:
-            logger.error(f"Failed to add project member: {e}")
+            logger.error("Failed to add project member: %s", e)
             raise CwayAPIError(f"Failed to add project member: {e}")
     
     async def remove_project_member(self, project_id: str, user_id: str) -> bool:
@@ -376,7 +444,7 @@ class ProjectRepository(BaseRepository):
             return result.get("removeProjectMember", False)
             
         except Exception as e:
-            logger.error(f"Failed to remove project member: {e}")
+            logger.error("Failed to remove project member: %s", e)
             raise CwayAPIError(f"Failed to remove project member: {e}")
     
     async def update_project_member_role(self, project_id: str, user_id: str, role: str) -> Dict[str, Any]:
@@ -404,7 +472,7 @@ class ProjectRepository(BaseRepository):
             return result.get("updateProjectMemberRole", {})
             
         except Exception as e:
-            logger.error(f"Failed to update project member role: {e}")
+            logger.error("Failed to update project member role: %s", e)
             raise CwayAPIError(f"Failed to update project member role: {e}")
     
     async def get_project_comments(self, project_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -433,7 +501,7 @@ class ProjectRepository(BaseRepository):
             return result.get("projectComments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project comments: {e}")
+            logger.error("Failed to get project comments: %s", e)
             raise CwayAPIError(f"Failed to get project comments: {e}")
     
     async def add_project_comment(self, project_id: str, text: str) -> Dict[str, Any]:
@@ -462,7 +530,7 @@ class ProjectRepository(BaseRepository):
             return result.get("addProjectComment", {})
             
         except Exception as e:
-            logger.error(f"Failed to add project comment: {e}")
+            logger.error("Failed to add project comment: %s", e)
             raise CwayAPIError(f"Failed to add project comment: {e}")
     
     async def get_project_attachments(self, project_id: str) -> List[Dict[str, Any]]:
@@ -489,7 +557,7 @@ class ProjectRepository(BaseRepository):
             return result.get("projectAttachments", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project attachments: {e}")
+            logger.error("Failed to get project attachments: %s", e)
             raise CwayAPIError(f"Failed to get project attachments: {e}")
     
     async def upload_project_attachment(self, project_id: str, file_id: str, name: str) -> Dict[str, Any]:
@@ -515,5 +583,5 @@ class ProjectRepository(BaseRepository):
             return result.get("attachFileToProject", {})
             
         except Exception as e:
-            logger.error(f"Failed to upload project attachment: {e}")
+            logger.error("Failed to upload project attachment: %s", e)
             raise CwayAPIError(f"Failed to upload project attachment: {e}")
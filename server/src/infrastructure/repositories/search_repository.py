@@ -52,7 +52,7 @@ class SearchRepository(BaseRepository):
             return result.get("searchArtworks", {"artworks": [], "totalHits": 0, "page": 0})
             
         except Exception as e:
-            logger.error(f"Failed to search artworks: {e}")
+            logger.error("Failed to search artworks: %s", e)
             raise CwayAPIError(f"Failed to search artworks: {e}")
     
     async def get_project_timeline(self, project_id: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -83,7 +83,7 @@ class SearchRepository(BaseRepository):
             return result.get("projectTimeline", [])
             
         except Exception as e:
-            logger.error(f"Failed to get project timeline: {e}")
+            logger.error("Failed to get project timeline: %s", e)
             raise CwayAPIError(f"Failed to get project timeline: {e}")
     
     async def get_user_activity(self, user_id: str, days: int = 30, limit: int = 100) -> List[Dict[str, Any]]:
@@ -113,7 +113,7 @@ class SearchRepository(BaseRepository):
             return result.get("userActivity", [])
             
         except Exception as e:
-            logger.error(f"Failed to get user activity: {e}")
+            logger.error("Failed to get user activity: %s", e)
             raise CwayAPIError(f"Failed to get user activity: {e}")
     
     async def bulk_update_artwork_status(self, artwork_ids: List[str], status: str) -> Dict[str, Any]:
@@ -144,5 +144,5 @@ class SearchRepository(BaseRepository):
             return response
             
         except Exception as e:
-            logger.error(f"Failed to bulk update artwork status: {e}")
+            logger.error("Failed to bulk update artwork status: %s", e)
             raise CwayAPIError(f"Failed to bulk update artwork status: {e}")
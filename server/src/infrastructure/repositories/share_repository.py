@@ -44,7 +44,7 @@ class ShareRepository(BaseRepository):
             return shares_data.get("shares", [])
             
         except Exception as e:
-            logger.error(f"Failed to find shares: {e}")
+            logger.error("Failed to find shares: %s", e)
             raise CwayAPIError(f"Failed to find shares: {e}")
     
     async def get_share(self, share_id: str) -> Optional[Dict[str, Any]]:
@@ -74,7 +74,7 @@ class ShareRepository(BaseRepository):
             return result.get("share")
             
         except Exception as e:
-            logger.error(f"Failed to get share: {e}")
+            logger.error("Failed to get share: %s", e)
             raise CwayAPIError(f"Failed to get share: {e}")
     
     async def create_share(self, name: str, file_ids: List[str], 
@@ -112,7 +112,7 @@ class ShareRepository(BaseRepository):
             return result.get("createShare", {})
             
         except Exception as e:
-            logger.error(f"Failed to create share: {e}")
+            logger.error("Failed to create share: %s", e)
             raise CwayAPIError(f"Failed to create share: {e}")
     
     async def delete_share(self, share_id: str) -> bool:
@@ -128,5 +128,5 @@ class ShareRepository(BaseRepository):
             return result.get("deleteShare", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete share: {e}")
+            logger.error("Failed to delete share: %s", e)
             raise CwayAPIError(f"Failed to delete share: {e}")
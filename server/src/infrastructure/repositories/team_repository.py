@@ -45,7 +45,7 @@ class TeamRepository(BaseRepository):
             return project.get("team", [])
             
         except Exception as e:
-            logger.error(f"Failed to get team members: {e}")
+            logger.error("Failed to get team members: %s", e)
             raise CwayAPIError(f"Failed to get team members: {e}")
     
     async def add_team_member(self, project_id: str, user_id: str, role: Optional[str] = None) -> Dict[str, Any]:
@@ -78,7 +78,7 @@ class TeamRepository(BaseRepository):
             return team_member
             
         except Exception as e:
-            logger.error(f"Failed to add team member: {e}")
+            logger.error("Failed to add team member: %s", e)
             raise CwayAPIError(f"Failed to add team member: {e}")
     
     async def remove_team_member(self, project_id: str, user_id: str) -> Dict[str, Any]:
@@ -103,7 +103,7 @@ class TeamRepository(BaseRepository):
             return response
             
         except Exception as e:
-            logger.error(f"Failed to remove team member: {e}")
+            logger.error("Failed to remove team member: %s", e)
             raise CwayAPIError(f"Failed to remove team member: {e}")
     
     async def update_team_member_role(self, project_id: str, user_id: str, role: str) -> Dict[str, Any]:
@@ -136,7 +136,7 @@ class TeamRepository(BaseRepository):
             return team_member
             
         except Exception as e:
-            logger.error(f"Failed to update team member role: {e}")
+            logger.error("Failed to update team member role: %s", e)
             raise CwayAPIError(f"Failed to update team member role: {e}")
     
     async def get_user_roles(self) -> List[Dict[str, Any]]:
@@ -157,7 +157,7 @@ class TeamRepository(BaseRepository):
             return result.get("userRoles", [])
             
         except Exception as e:
-            logger.error(f"Failed to get user roles: {e}")
+            logger.error("Failed to get user roles: %s", e)
             raise CwayAPIError(f"Failed to get user roles: {e}")
     
     async def transfer_project_ownership(self, project_id: str, new_owner_id: str) -> Dict[str, Any]:
@@ -189,5 +189,5 @@ class TeamRepository(BaseRepository):
             return project
             
         except Exception as e:
-            logger.error(f"Failed to transfer project ownership: {e}")
+            logger.error("Failed to transfer project ownership: %s", e)
             raise CwayAPIError(f"Failed to transfer project ownership: {e}")
@@ -63,7 +63,7 @@ class UserRepository(BaseRepository):
             return users
             
         except Exception as e:
-            logger.error(f"Failed to fetch users: {e}")
+            logger.error("Failed to fetch users: %s", e)
             raise CwayAPIError(f"Failed to fetch users: {e}")
             
     async def find_user_by_id(self, user_id: str) -> Optional[CwayUser]:
@@ -82,7 +82,45 @@ class UserRepository(BaseRepository):
             if user.email.lower() == email.lower():
                 return user
         return None
-        
+
+    async def find_user_by_username(self, username: str) -> Optional[CwayUser]:
+        """Find a user by exact username."""
+        query = """
+        query GetUser($username: String) {
+            getUser(username: $username) {
+                id
+                name
+                email
+                username
+                firstName
+                lastName
+                enabled
+                isSSO
+            }
+        }
+        """
+
+        try:
+            result = await self._execute_query(query, {"username": username})
+            data = result.get("getUser")
+            if not data:
+                return None
+
+            return CwayUser(
+                id=data["id"],
+                name=data["name"],
+                email=data["email"],
+                username=data["username"],
+                firstName=data["firstName"],
+                lastName=data["lastName"],
+                enabled=data.get("enabled", True),
+                isSSO=data.get("isSSO", False)
+            )
+
+        except Exception as e:
+            logger.error("Failed to fetch user %s: %s", username, e)
+            raise CwayAPIError(f"Failed to fetch user: {e}")
+
     async def find_users_page(self, page: int = 0, size: int = 10) -> Dict[str, Any]:
         """Find users with pagination."""
         query = """
@@ -137,7 +175,7 @@ class UserRepository(BaseRepository):
             }
             
         except Exception as e:
-            logger.error(f"Failed to fetch users page: {e}")
+            logger.error("Failed to fetch users page: %s", e)
             raise CwayAPIError(f"Failed to fetch users page: {e}")
     
     async def search_users(self, query: Optional[str] = None) -> List[CwayUser]:
@@ -178,7 +216,7 @@ class UserRepository(BaseRepository):
             return users
             
         except Exception as e:
-            logger.error(f"Failed to search users: {e}")
+            logger.error("Failed to search users: %s", e)
             raise CwayAPIError(f"Failed to search users: {e}")
     
     async def create_user(self, email: str, username: str, first_name: Optional[str] = None, 
@@ -220,7 +258,7 @@ class UserRepository(BaseRepository):
             )
             
         except Exception as e:
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise CwayAPIError(f"Failed to create user: {e}")
     
     async def update_user_name(self, username: str, first_name: Optional[str] = None,
@@ -262,7 +300,7 @@ class UserRepository(BaseRepository):
             )
             
         except Exception as e:
-            logger.error(f"Failed to update user name: {e}")
+            logger.error("Failed to update user name: %s", e)
             raise CwayAPIError(f"Failed to update user name: {e}")
     
     async def delete_user(self, username: str) -> bool:
@@ -280,7 +318,7 @@ class UserRepository(BaseRepository):
             return result.get("deleteUsers", False)
             
         except Exception as e:
-            logger.error(f"Failed to delete user: {e}")
+            logger.error("Failed to delete user: %s", e)
             raise CwayAPIError(f"Failed to delete user: {e}")
     
     async def find_users_and_teams(self, search: Optional[str] = None, page: int = 0, size: int = 10) -> Dict[str, Any]:
@@ -329,7 +367,7 @@ class UserRepository(BaseRepository):
             }
             
         except Exception as e:
-            logger.error(f"Failed to search users and teams: {e}")
+            logger.error("Failed to search users and teams: %s", e)
             raise CwayAPIError(f"Failed to search users and teams: {e}")
     
     async def get_permission_groups(self) -> List[Dict[str, Any]]:
@@ -350,7 +388,7 @@ class UserRepository(BaseRepository):
             return result.get("getPermissionGroups", [])
             
         except Exception as e:
-            logger.error(f"Failed to get permission groups: {e}")
+            logger.error("Failed to get permission groups: %s", e)
             raise CwayAPIError(f"Failed to get permission groups: {e}")
     
     async def set_user_permissions(self, usernames: List[str], permission_group_id: str) -> bool:
@@ -369,5 +407,5 @@ class UserRepository(BaseRepository):
             return result.get("setPermissionGroupForUsers", False)
             
         except Exception as e:
-            logger.error(f"Failed to set user permissions: {e}")
+            logger.error("Failed to set user permissions: %s", e)
             raise CwayAPIError(f"Failed to set user permissions: {e}")
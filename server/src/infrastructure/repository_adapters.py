@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from datetime import datetime
-from ..domain.entities import Project, User
+from ..domain.entities import Project, ProjectState, TemporalMetadata, User
 from ..domain.repository_interfaces import ProjectRepository as ProjectRepositoryInterface, UserRepository as UserRepositoryInterface
 from ..infrastructure.repositories import ProjectRepository, UserRepository
 from ..domain.cway_entities import PlannerProject, CwayUser
@@ -38,9 +38,6 @@ class CwayProjectRepositoryAdapter(ProjectRepositoryInterface):
     
     def _convert_to_domain_project(self, cway_project: PlannerProject) -> Project:
         """Convert CwayProject to domain Project entity with comprehensive temporal data."""
-        from datetime import datetime
-        from ..domain.entities import TemporalMetadata, ProjectState
-        
         # Convert timestamps
         created_at = getattr(cway_project, 'createdAt', None)
         updated_at = getattr(cway_project, 'updatedAt', None)
@@ -224,9 +221,6 @@ class CwayUserRepositoryAdapter(UserRepositoryInterface):
     
     def _convert_to_domain_user(self, cway_user: CwayUser) -> User:
         """Convert CwayUser to domain User entity with temporal metadata."""
-        from datetime import datetime
-        from ..domain.entities import TemporalMetadata
-        
         # Convert timestamps
         created_at = getattr(cway_user, 'createdAt', None)
         if created_at is None:
@@ -2,15 +2,19 @@
 
 import asyncio
 import logging
-import json
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.types import (
     Resource,
     Tool,
     TextContent,
-    TextResourceContents,
     ReadResourceResult,
     ListToolsResult,
     CallToolResult,
@@ -30,6 +34,8 @@ from ..infrastructure.repositories import (
     CategoryRepository
 )
 from ..infrastructure.cway_repositories import CwaySystemRepository
+from ..infrastructure.repositories.base_repository import MAX_CONCURRENT_FETCHES
+from ..infrastructure.repository_adapters import CwayProjectRepositoryAdapter, CwayUserRepositoryAdapter
 from ..domain.cway_entities import ProjectState
 from ..application.kpi_use_cases import KPIUseCases
 from ..application.temporal_kpi_use_cases import TemporalKPICalculator
@@ -39,29 +45,228 @@ from ..domain.temporal_kpi_entities import (
     ProjectActivityTimeline,
     StagnationAlert
 )
-from ..indexing.mcp_indexing_service import get_indexing_service
+from ..indexing.mcp_indexing_service import MCPIndexingService, get_indexing_service
 from .tool_definitions import get_all_tools
+from .tool_responses import (
+    UserSummary,
+    UserProfile,
+    UserDetail,
+    UserRecord,
+    ProjectSummary,
+    ProjectListing,
+    StagnationAlertSummary,
+)
+from .tool_validation import build_validators
 from ..application.services import ConfirmationService
+from ..utils.logging_config import setup_stdio_logging
+from .json_encoding import JsonEncoder, dumps_pretty
 
 
-# Set up logging - redirect to file and stderr to avoid interfering with stdio protocol
-import sys
-from pathlib import Path
+logger = logging.getLogger(__name__)
+
+
+# Seconds to reuse slowly-changing reference data such as permission groups and roles
+_REFERENCE_DATA_TTL = 300
+
+# Most per-user lookups kept at once; the least recently used entry is dropped first
+_MAX_CACHED_USER_LOOKUPS = 256
 
-# Ensure log directory exists
-log_dir = Path(settings.log_dir)
-log_dir.mkdir(parents=True, exist_ok=True)
-log_file = log_dir / "mcp_server.log"
 
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stderr)  # Log to stderr, not stdout
-    ]
+def _tail(items: List[Any], n: int) -> Any:
+    """Iterate over the last ``n`` items of a list without copying it."""
+    return islice(items, max(0, len(items) - n), None)
+
+
+def _project_preview(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarise a project for a close/delete confirmation preview."""
+    artworks = project.get("artworks")
+    return {
+        "id": project["id"],
+        "name": project["name"],
+        "status": project.get("status", "unknown"),
+        "artwork_count": len(artworks) if artworks else 0
+    }
+
+
+# Static resource catalogue, built once instead of on every list_resources call
+_RESOURCES: List[Resource] = [
+    Resource(
+        uri="cway://projects",
+        name="Cway Projects",
+        description="Access to all Cway planner projects",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://users", 
+        name="Cway Users",
+        description="Access to all Cway users",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://projects/active",
+        name="Active Projects",
+        description="Currently active projects only",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://projects/completed",
+        name="Completed Projects", 
+        description="Completed projects only",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://system/status",
+        name="System Status",
+        description="Cway system connection status",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://kpis/dashboard",
+        name="KPI Dashboard",
+        description="Comprehensive system KPI dashboard with health scores",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://kpis/project-health",
+        name="Project Health Scores",
+        description="Health scores and metrics for all projects",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://kpis/critical-projects",
+        name="Critical Projects",
+        description="Projects requiring immediate attention",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://temporal-kpis/dashboard",
+        name="Temporal KPI Dashboard",
+        description="Comprehensive temporal analysis dashboard with velocity, stagnation, and activity metrics",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://temporal-kpis/project-timelines",
+        name="Project Activity Timelines",
+        description="Detailed activity timelines for all projects with velocity analysis",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://temporal-kpis/stagnation-alerts",
+        name="Stagnation Alerts",
+        description="Projects at risk of stagnation with actionable recommendations",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://temporal-kpis/team-metrics",
+        name="Team Temporal Metrics",
+        description="Team-wide activity patterns and productivity insights",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://indexing/targets",
+        name="Indexing Targets",
+        description="Available indexing targets and configurations",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://indexing/status",
+        name="Indexing Status",
+        description="Current indexing job status and history",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://indexing/content-stats",
+        name="Content Statistics",
+        description="Statistics about indexable content (documents and pages)",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="cway://indexing/platforms",
+        name="Supported Platforms",
+        description="List of supported indexing platforms and their capabilities",
+        mimeType="application/json"
+    )
+]
+_LIST_RESOURCES_RESULT = ListResourcesResult(resources=_RESOURCES)
+
+
+# Status indicators used when rendering KPI resources
+_HEALTH_STATUS_EMOJI = {"critical": "🔴", "warning": "🟡", "healthy": "🟢", "excellent": "⭐"}
+_ACTIVITY_LEVEL_EMOJI = {"inactive": "⚪", "low": "🔵", "moderate": "🟡", "high": "🟠", "burst": "🔴"}
+_STAGNATION_RISK_EMOJI = {"none": "🟢", "low": "🟡", "moderate": "🟠", "high": "🔴", "critical": "💀"}
+_ALERT_RISK_EMOJI = {"moderate": "🟠", "high": "🔴", "critical": "💀"}
+_DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_ACTIVITY_BARS = tuple("█" * width for width in range(21))
+_URGENCY_BARS = tuple("🔥" * width for width in range(11))
+_USER_DELETION_CONSEQUENCES = (
+    "All user data and associations will be permanently lost",
+    "User will lose access to all projects and artworks",
 )
-logger = logging.getLogger(__name__)
+_INDEXING_IDLE_STATUS = "⚙️  INDEXING STATUS\n\n🔄 ACTIVE JOBS: None\n\n📊 RECENT HISTORY (0 jobs):\n"
+
+# Tool name aliases for consistency
+_TOOL_ALIASES = {
+    "list_all_users": "list_users",
+    "get_planner_projects": "list_projects",
+    "get_project_details": "get_project_by_id",
+    "create_cway_user": "create_user",
+    "create_cway_project": "create_project",
+    "update_cway_project": "update_project",
+}
+
+# Tools whose writes make cached resource renderings or shared reference data stale
+_RESOURCE_INVALIDATING_TOOLS = frozenset({
+    "create_project",
+    "update_project",
+    "confirm_close_projects",
+    "reopen_projects",
+    "confirm_delete_projects",
+    "transfer_project_ownership",
+    "create_user",
+    "update_user_name",
+    "confirm_delete_user",
+    "set_user_permissions",
+    "update_team_member_role",
+    "create_category",
+    "create_brand",
+    "create_print_specification",
+})
+
+
+# Cacheable resource URIs, matched exactly so client-made URIs never enter the cache
+_TEMPORAL_RESOURCE_URIS = frozenset({
+    "cway://temporal-kpis/dashboard",
+    "cway://temporal-kpis/project-timelines",
+    "cway://temporal-kpis/stagnation-alerts",
+    "cway://temporal-kpis/team-metrics",
+})
+_SETTINGS_TTL_RESOURCE_URIS = frozenset({
+    "cway://projects",
+    "cway://users",
+    "cway://projects/active",
+    "cway://projects/completed",
+    "cway://kpis/dashboard",
+    "cway://kpis/project-health",
+    "cway://kpis/critical-projects",
+    "cway://indexing/content-stats",
+})
+
+
+class _ErrorRendering(str):
+    """Resource text describing a failure; served as-is but never cached."""
+    
+    __slots__ = ()
+
+
+def _resource_cache_ttl(uri: str) -> float:
+    """Get how long a rendered resource may be served from cache, 0 if never."""
+    if uri == "cway://system/status":
+        return 10
+    if uri in _TEMPORAL_RESOURCE_URIS:
+        return 300
+    if uri in _SETTINGS_TTL_RESOURCE_URIS:
+        return settings.resource_cache_ttl_seconds
+    return 0
 
 
 class CwayMCPServer:
@@ -82,15 +287,190 @@ class CwayMCPServer:
         self.system_repo: Optional[CwaySystemRepository] = None
         self.kpi_use_cases: Optional[KPIUseCases] = None
         self.temporal_kpi_calculator: Optional[TemporalKPICalculator] = None
-        self.indexing_service = get_indexing_service()
-        self.confirmation_service = ConfirmationService(
-            secret_key=settings.secret_key if hasattr(settings, 'secret_key') else None,
-            default_expiry_minutes=5
-        )
+        self._indexing_service: Optional[MCPIndexingService] = None
+        self._confirmation_service: Optional[ConfirmationService] = None
+        self._initialized = False
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._resource_cache: Dict[str, Tuple[float, str]] = {}
+        self._resource_locks: Dict[str, asyncio.Lock] = {}
+        self._shared_results: Dict[str, Tuple[float, "asyncio.Future[Any]"]] = {}
+        self._user_lookup_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # The tool set is fixed for the process, so build it once for listing and validation
+        tools = get_all_tools()
+        self._list_tools_result = ListToolsResult(tools=tools)
+        self._validators = build_validators(tools)
+        # Tool name -> handler, so calls dispatch with a single lookup
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+            "list_projects": self._tool_list_projects,
+            "get_project": self._tool_get_project,
+            "get_active_projects": self._tool_get_active_projects,
+            "get_completed_projects": self._tool_get_completed_projects,
+            "list_users": self._tool_list_users,
+            "get_user": self._tool_get_user,
+            "find_user_by_email": self._tool_find_user_by_email,
+            "get_users_page": self._tool_get_users_page,
+            "get_system_status": self._tool_get_system_status,
+            "analyze_project_velocity": self._tool_analyze_project_velocity,
+            "get_temporal_dashboard": self._tool_get_temporal_dashboard,
+            "get_stagnation_alerts": self._tool_get_stagnation_alerts,
+            "index_all_content": self._tool_index_all_content,
+            "quick_backup": self._tool_quick_backup,
+            "index_project_content": self._tool_index_project_content,
+            "configure_indexing_target": self._tool_configure_indexing_target,
+            "get_indexing_job_status": self._tool_get_indexing_job_status,
+            "get_login_info": self._tool_get_login_info,
+            "search_users": self._tool_search_users,
+            "search_projects": self._tool_search_projects,
+            "get_project_by_id": self._tool_get_project_by_id,
+            "create_user": self._tool_create_user,
+            "update_user_name": self._tool_update_user_name,
+            "prepare_delete_user": self._tool_prepare_delete_user,
+            "confirm_delete_user": self._tool_confirm_delete_user,
+            "find_users_and_teams": self._tool_find_users_and_teams,
+            "get_permission_groups": self._tool_get_permission_groups,
+            "set_user_permissions": self._tool_set_user_permissions,
+            "create_project": self._tool_create_project,
+            "update_project": self._tool_update_project,
+            # Project workflow tools with confirmation
+            "prepare_close_projects": self._tool_prepare_close_projects,
+            "confirm_close_projects": self._tool_confirm_close_projects,
+            "reopen_projects": self._tool_reopen_projects,
+            "prepare_delete_projects": self._tool_prepare_delete_projects,
+            "confirm_delete_projects": self._tool_confirm_delete_projects,
+            # Artwork tools
+            "get_artwork": self._tool_get_artwork,
+            "create_artwork": self._tool_create_artwork,
+            "approve_artwork": self._tool_approve_artwork,
+            "reject_artwork": self._tool_reject_artwork,
+            "approve_artworks": self._tool_approve_artworks,
+            "reject_artworks": self._tool_reject_artworks,
+            "get_my_artworks": self._tool_get_my_artworks,
+            "get_artworks_to_approve": self._tool_get_artworks_to_approve,
+            "get_artworks_to_upload": self._tool_get_artworks_to_upload,
+            "download_artworks": self._tool_download_artworks,
+            "get_artwork_preview": self._tool_get_artwork_preview,
+            "get_artwork_history": self._tool_get_artwork_history,
+            "analyze_artwork_ai": self._tool_analyze_artwork_ai,
+            "generate_project_summary_ai": self._tool_generate_project_summary_ai,
+            # Artwork workflow tools
+            "submit_artwork_for_review": self._tool_submit_artwork_for_review,
+            "request_artwork_changes": self._tool_request_artwork_changes,
+            "get_artwork_comments": self._tool_get_artwork_comments,
+            "add_artwork_comment": self._tool_add_artwork_comment,
+            "get_artwork_versions": self._tool_get_artwork_versions,
+            "restore_artwork_version": self._tool_restore_artwork_version,
+            "assign_artwork": self._tool_assign_artwork,
+            "duplicate_artwork": self._tool_duplicate_artwork,
+            "archive_artwork": self._tool_archive_artwork,
+            "unarchive_artwork": self._tool_unarchive_artwork,
+            # Team management tools
+            "get_team_members": self._tool_get_team_members,
+            "add_team_member": self._tool_add_team_member,
+            "remove_team_member": self._tool_remove_team_member,
+            "update_team_member_role": self._tool_update_team_member_role,
+            "get_user_roles": self._tool_get_user_roles,
+            "transfer_project_ownership": self._tool_transfer_project_ownership,
+            # Search and activity tools
+            "search_artworks": self._tool_search_artworks,
+            "get_project_timeline": self._tool_get_project_timeline,
+            "get_user_activity": self._tool_get_user_activity,
+            "bulk_update_artwork_status": self._tool_bulk_update_artwork_status,
+            # Folder tools
+            "get_folder_tree": self._tool_get_folder_tree,
+            "get_folder": self._tool_get_folder,
+            "get_folder_items": self._tool_get_folder_items,
+            # Project status tools
+            "get_project_status_summary": self._tool_get_project_status_summary,
+            "compare_projects": self._tool_compare_projects,
+            "get_project_history": self._tool_get_project_history,
+            "get_monthly_project_trends": self._tool_get_monthly_project_trends,
+            # Media center tools
+            "search_media_center": self._tool_search_media_center,
+            "get_media_center_stats": self._tool_get_media_center_stats,
+            "download_folder_contents": self._tool_download_folder_contents,
+            "download_project_media": self._tool_download_project_media,
+            # File tools
+            "get_file": self._tool_get_file,
+            # Project collaboration tools
+            "get_project_members": self._tool_get_project_members,
+            "add_project_member": self._tool_add_project_member,
+            "remove_project_member": self._tool_remove_project_member,
+            "update_project_member_role": self._tool_update_project_member_role,
+            "get_project_comments": self._tool_get_project_comments,
+            "add_project_comment": self._tool_add_project_comment,
+            "get_project_attachments": self._tool_get_project_attachments,
+            "upload_project_attachment": self._tool_upload_project_attachment,
+            # Category, brand, and specification tools
+            "get_taxonomy": self._tool_get_taxonomy,
+            "get_categories": self._tool_get_categories,
+            "get_brands": self._tool_get_brands,
+            "get_print_specifications": self._tool_get_print_specifications,
+            "create_category": self._tool_create_category,
+            "create_brand": self._tool_create_brand,
+            "create_print_specification": self._tool_create_print_specification,
+            # Share tools
+            "find_shares": self._tool_find_shares,
+            "get_share": self._tool_get_share,
+            "create_share": self._tool_create_share,
+            "delete_share": self._tool_delete_share,
+            # Media management tools
+            "create_folder": self._tool_create_folder,
+            "rename_file": self._tool_rename_file,
+            "rename_folder": self._tool_rename_folder,
+            "move_files": self._tool_move_files,
+            "delete_file": self._tool_delete_file,
+            "delete_folder": self._tool_delete_folder,
+        }
+        # Resource URI -> renderer, so reads dispatch with a single lookup
+        self._resource_renderers: Dict[str, Callable[[], Awaitable[str]]] = {
+            "cway://projects": self._render_projects,
+            "cway://users": self._render_users,
+            "cway://projects/active": self._render_active_projects,
+            "cway://projects/completed": self._render_completed_projects,
+            "cway://system/status": self._render_system_status,
+            "cway://kpis/dashboard": self._render_kpi_dashboard,
+            "cway://kpis/project-health": self._render_project_health,
+            "cway://kpis/critical-projects": self._render_critical_projects,
+            "cway://temporal-kpis/dashboard": self._render_temporal_dashboard,
+            "cway://temporal-kpis/project-timelines": self._render_project_timelines,
+            "cway://temporal-kpis/stagnation-alerts": self._render_stagnation_alerts,
+            "cway://temporal-kpis/team-metrics": self._render_team_metrics,
+            "cway://indexing/targets": self._render_indexing_targets,
+            "cway://indexing/status": self._render_indexing_status,
+            "cway://indexing/content-stats": self._render_content_stats,
+            "cway://indexing/platforms": self._render_indexing_platforms,
+        }
+        # One reusable encoder; slotted payloads are expanded item by item via the default hook
+        self._json_encoder = JsonEncoder(pretty=settings.pretty_json)
         
         # Register handlers
         self._register_handlers()
         
+    @property
+    def indexing_service(self) -> MCPIndexingService:
+        """Get the indexing service, loading it on first use."""
+        if self._indexing_service is None:
+            self._indexing_service = get_indexing_service()
+        return self._indexing_service
+    
+    @indexing_service.setter
+    def indexing_service(self, service: MCPIndexingService) -> None:
+        self._indexing_service = service
+        
+    @property
+    def confirmation_service(self) -> ConfirmationService:
+        """Get the confirmation service, creating it on first use."""
+        if self._confirmation_service is None:
+            self._confirmation_service = ConfirmationService(
+                secret_key=settings.secret_key if hasattr(settings, 'secret_key') else None,
+                default_expiry_minutes=5
+            )
+        return self._confirmation_service
+    
+    @confirmation_service.setter
+    def confirmation_service(self, service: ConfirmationService) -> None:
+        self._confirmation_service = service
+        
     def _register_handlers(self) -> None:
         """Register MCP handlers."""
         
@@ -98,1912 +478,1961 @@ class CwayMCPServer:
         async def list_resources() -> ListResourcesResult:
             """List available resources."""
             logger.info("📋 list_resources called")
-            resources = [
-                Resource(
-                    uri="cway://projects",
-                    name="Cway Projects",
-                    description="Access to all Cway planner projects",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://users", 
-                    name="Cway Users",
-                    description="Access to all Cway users",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://projects/active",
-                    name="Active Projects",
-                    description="Currently active projects only",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://projects/completed",
-                    name="Completed Projects", 
-                    description="Completed projects only",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://system/status",
-                    name="System Status",
-                    description="Cway system connection status",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://kpis/dashboard",
-                    name="KPI Dashboard",
-                    description="Comprehensive system KPI dashboard with health scores",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://kpis/project-health",
-                    name="Project Health Scores",
-                    description="Health scores and metrics for all projects",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://kpis/critical-projects",
-                    name="Critical Projects",
-                    description="Projects requiring immediate attention",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://temporal-kpis/dashboard",
-                    name="Temporal KPI Dashboard",
-                    description="Comprehensive temporal analysis dashboard with velocity, stagnation, and activity metrics",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://temporal-kpis/project-timelines",
-                    name="Project Activity Timelines",
-                    description="Detailed activity timelines for all projects with velocity analysis",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://temporal-kpis/stagnation-alerts",
-                    name="Stagnation Alerts",
-                    description="Projects at risk of stagnation with actionable recommendations",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://temporal-kpis/team-metrics",
-                    name="Team Temporal Metrics",
-                    description="Team-wide activity patterns and productivity insights",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://indexing/targets",
-                    name="Indexing Targets",
-                    description="Available indexing targets and configurations",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://indexing/status",
-                    name="Indexing Status",
-                    description="Current indexing job status and history",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://indexing/content-stats",
-                    name="Content Statistics",
-                    description="Statistics about indexable content (documents and pages)",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="cway://indexing/platforms",
-                    name="Supported Platforms",
-                    description="List of supported indexing platforms and their capabilities",
-                    mimeType="application/json"
-                )
-            ]
-            return ListResourcesResult(resources=resources)
+            return _LIST_RESOURCES_RESULT
             
         @self.server.read_resource()
-        async def read_resource(uri: str) -> list[TextResourceContents]:
+        async def read_resource(uri: Any) -> List[ReadResourceContents]:
             """Get a specific resource."""
-            logger.info(f"📖 read_resource called with URI: {uri}")
-            await self._ensure_initialized()
+            logger.info("📖 read_resource called with URI: %s", uri)
+            uri = str(uri)
+            if not self._initialized:
+                await self._ensure_initialized()
             
             try:
-                if uri == "cway://projects":
-                    projects = await self.project_repo.get_planner_projects()
-                    content = "\n".join([
-                        f"Project: {p.name} (ID: {p.id})\n"
-                        f"  State: {p.state.value}\n"
-                        f"  Progress: {p.percentageDone:.1%}\n"
-                        f"  Dates: {p.startDate} to {p.endDate}\n"
-                        for p in projects
-                    ])
-                    
-                elif uri == "cway://users":
-                    users = await self.user_repo.find_all_users()
-                    content = "\n".join([
-                        f"User: {u.full_name} (ID: {u.id})\n"
-                        f"  Email: {u.email}\n"
-                        f"  Username: {u.username}\n"
-                        f"  Enabled: {u.enabled}\n"
-                        for u in users
-                    ])
-                    
-                elif uri == "cway://projects/active":
-                    projects = await self.project_repo.get_active_projects()
-                    content = f"Active Projects ({len(projects)}):\n\n" + "\n".join([
-                        f"• {p.name} - {p.percentageDone:.1%} complete"
-                        for p in projects
-                    ])
-                    
-                elif uri == "cway://projects/completed":
-                    projects = await self.project_repo.get_completed_projects()
-                    content = f"Completed Projects ({len(projects)}):\n\n" + "\n".join([
-                        f"• {p.name} - completed"
-                        for p in projects
-                    ])
-                    
-                elif uri == "cway://system/status":
-                    is_connected = await self.system_repo.validate_connection()
-                    login_info = await self.system_repo.get_login_info()
-                    content = f"Cway System Status:\n"
-                    content += f"  Connection: {'✅ Connected' if is_connected else '❌ Disconnected'}\n"
-                    content += f"  Login Info: {json.dumps(login_info, indent=2) if login_info else 'Not available'}\n"
-                    content += f"  API URL: {settings.cway_api_url}\n"
-                    
-                elif uri == "cway://kpis/dashboard":
-                    dashboard = await self.kpi_use_cases.calculate_system_kpi_dashboard()
-                    content = f"📊 CWAY SYSTEM KPI DASHBOARD\n"
-                    content += f"Generated: {dashboard.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    
-                    # Key metrics
-                    content += f"📈 KEY METRICS:\n"
-                    content += f"  Projects: {dashboard.total_projects} | Users: {dashboard.total_users} | Revisions: {dashboard.total_revisions:,}\n\n"
-                    
-                    # Critical KPIs with status indicators
-                    kpis = [
-                        ("Project Completion Rate", dashboard.project_completion_rate),
-                        ("Stalled Project Rate", dashboard.stalled_project_rate),
-                        ("System Utilization", dashboard.system_utilization),
-                        ("Team Engagement", dashboard.team_engagement)
-                    ]
-                    
-                    content += f"🎯 CRITICAL KPIs:\n"
-                    for name, kpi in kpis:
-                        status_emoji = {"critical": "🔴", "warning": "🟡", "healthy": "🟢", "excellent": "⭐"}.get(kpi.status.value, "⚪")
-                        content += f"  {status_emoji} {name}: {kpi.value:.1f}{kpi.unit} ({kpi.status.value.title()})\n"
-                    
-                    # Health summary
-                    health_summary = dashboard.health_summary
-                    content += f"\n🏥 PROJECT HEALTH SUMMARY:\n"
-                    content += f"  🔴 Critical: {health_summary.get('critical', 0)} projects\n"
-                    content += f"  🟡 Warning: {health_summary.get('warning', 0)} projects\n"
-                    content += f"  🟢 Healthy: {health_summary.get('healthy', 0)} projects\n"
-                    content += f"  ⭐ Excellent: {health_summary.get('excellent', 0)} projects\n"
-                    
-                    # Recommendations
-                    if dashboard.recommendations:
-                        content += f"\n💡 RECOMMENDATIONS:\n"
-                        for rec in dashboard.recommendations[:3]:  # Top 3
-                            content += f"  • {rec}\n"
-                    
-                elif uri == "cway://kpis/project-health":
-                    health_scores = await self.kpi_use_cases.get_project_health_scores()
-                    content = f"🏥 PROJECT HEALTH SCORES ({len(health_scores)} projects)\n\n"
-                    
-                    for i, score in enumerate(health_scores[:10], 1):  # Top 10 worst
-                        status_emoji = {"critical": "🔴", "warning": "🟡", "healthy": "🟢", "excellent": "⭐"}.get(score.health_status.value, "⚪")
-                        content += f"{i:2d}. {status_emoji} {score.project_name}\n"
-                        content += f"    Overall Score: {score.overall_score:.1f}/100\n"
-                        content += f"    Progress: {score.progress_percentage:.1f}% | Revisions: {score.total_revisions}\n"
-                        if score.recommendations:
-                            content += f"    💡 {score.recommendations[0]}\n"
-                        content += "\n"
-                    
-                elif uri == "cway://kpis/critical-projects":
-                    critical_projects = await self.kpi_use_cases.get_critical_projects()
-                    content = f"🚨 CRITICAL PROJECTS REQUIRING ATTENTION ({len(critical_projects)} projects)\n\n"
-                    
-                    for i, score in enumerate(critical_projects, 1):
-                        status_emoji = "🔴" if score.health_status.value == "critical" else "🟡"
-                        content += f"{i}. {status_emoji} {score.project_name}\n"
-                        content += f"   Health Score: {score.overall_score:.1f}/100 ({score.health_status.value.upper()})\n"
-                        content += f"   Progress: {score.progress_percentage:.1f}% | Revisions: {score.total_revisions}\n"
-                        
-                        if score.recommendations:
-                            content += f"   🎯 Actions needed:\n"
-                            for rec in score.recommendations[:2]:  # Top 2 recommendations
-                                content += f"      • {rec}\n"
-                        content += "\n"
-                    
-                elif uri == "cway://temporal-kpis/dashboard":
-                    dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard()
-                    content = f"⏰ TEMPORAL KPI DASHBOARD\n"
-                    content += f"Generated: {dashboard.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    
-                    # Overview metrics
-                    content += f"📊 OVERVIEW ({dashboard.analysis_period_days} days analysis):\n"
-                    content += f"  Projects Analyzed: {dashboard.total_projects_analyzed}\n"
-                    content += f"  Total Revisions: {dashboard.total_revisions_in_period:,}\n"
-                    content += f"  Avg Project Velocity: {dashboard.avg_project_velocity:.1f} rev/week\n\n"
-                    
-                    # Activity distribution
-                    content += f"🚀 PROJECT ACTIVITY LEVELS:\n"
-                    for level, count in dashboard.projects_by_activity_level.items():
-                        level_emoji = {
-                            "inactive": "⚪",
-                            "low": "🔵", 
-                            "moderate": "🟡",
-                            "high": "🟠",
-                            "burst": "🔴"
-                        }.get(level.value, "⚪")
-                        content += f"  {level_emoji} {level.value.title()}: {count} projects\n"
-                    
-                    # Stagnation risks
-                    content += f"\n⚠️ STAGNATION RISK LEVELS:\n"
-                    for risk, count in dashboard.projects_by_stagnation_risk.items():
-                        risk_emoji = {
-                            "none": "🟢",
-                            "low": "🟡",
-                            "moderate": "🟠",
-                            "high": "🔴",
-                            "critical": "💀"
-                        }.get(risk.value, "⚪")
-                        content += f"  {risk_emoji} {risk.value.title()}: {count} projects\n"
-                    
-                    # Team metrics
-                    team_metrics = dashboard.team_temporal_metrics
-                    content += f"\n👥 TEAM TEMPORAL PATTERNS:\n"
-                    content += f"  Peak Activity Day: {team_metrics.peak_activity_day_of_week}\n"
-                    content += f"  Peak Activity Hour: {team_metrics.peak_activity_hour}:00\n"
-                    content += f"  Team Velocity: {team_metrics.team_velocity_revisions_per_day:.1f} rev/day\n"
-                    
-                    # Trends
-                    content += f"\n📈 VELOCITY TRENDS:\n"
-                    content += f"  Overall Trend: {dashboard.overall_velocity_trend.title()}\n"
-                    content += f"  Productivity Trend: {dashboard.productivity_trend.title()}\n"
-                    
-                    # Top projects
-                    if dashboard.most_active_projects:
-                        content += f"\n🌟 MOST ACTIVE PROJECTS:\n"
-                        for i, project in enumerate(dashboard.most_active_projects[:5], 1):
-                            content += f"  {i}. {project}\n"
-                    
-                    # Stagnant projects
-                    if dashboard.most_stagnant_projects:
-                        content += f"\n😴 MOST STAGNANT PROJECTS:\n"
-                        for i, project in enumerate(dashboard.most_stagnant_projects[:5], 1):
-                            content += f"  {i}. {project}\n"
-                    
-                    # Alerts summary
-                    if dashboard.stagnation_alerts:
-                        urgent_alerts = [a for a in dashboard.stagnation_alerts if a.urgency_score >= 8]
-                        content += f"\n🚨 URGENT ALERTS: {len(urgent_alerts)} projects need immediate attention\n"
-                    
-                    # Recommendations
-                    if dashboard.temporal_recommendations:
-                        content += f"\n💡 KEY RECOMMENDATIONS:\n"
-                        for rec in dashboard.temporal_recommendations[:3]:
-                            content += f"  • {rec}\n"
-                            
-                elif uri == "cway://temporal-kpis/project-timelines":
-                    dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard()
-                    content = f"📅 PROJECT ACTIVITY TIMELINES ({len(dashboard.project_timelines)} projects)\n\n"
-                    
-                    for timeline in dashboard.project_timelines[:15]:  # Show top 15
-                        activity_emoji = {
-                            "inactive": "⚪",
-                            "low": "🔵",
-                            "moderate": "🟡",
-                            "high": "🟠",
-                            "burst": "🔴"
-                        }.get(timeline.activity_level.value, "⚪")
-                        
-                        risk_emoji = {
-                            "none": "🟢",
-                            "low": "🟡", 
-                            "moderate": "🟠",
-                            "high": "🔴",
-                            "critical": "💀"
-                        }.get(timeline.stagnation_risk.value, "⚪")
-                        
-                        content += f"{activity_emoji} {timeline.project_name}\n"
-                        content += f"  Activity: {timeline.activity_level.value.title()} ({timeline.revisions_per_week:.1f} rev/week)\n"
-                        content += f"  Stagnation Risk: {risk_emoji} {timeline.stagnation_risk.value.title()}\n"
-                        content += f"  Last Activity: {timeline.days_since_last_activity} days ago\n"
-                        content += f"  Total Revisions: {timeline.total_revisions}\n"
-                        if timeline.estimated_completion_date:
-                            content += f"  Est. Completion: {timeline.estimated_completion_date}\n"
-                        content += "\n"
-                        
-                elif uri == "cway://temporal-kpis/stagnation-alerts":
-                    dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard()
-                    alerts = dashboard.stagnation_alerts
-                    content = f"🚨 STAGNATION ALERTS ({len(alerts)} projects at risk)\n\n"
-                    
-                    for i, alert in enumerate(alerts[:10], 1):  # Top 10 most urgent
-                        risk_emoji = {
-                            "moderate": "🟠",
-                            "high": "🔴",
-                            "critical": "💀"
-                        }.get(alert.risk_level.value, "⚪")
-                        
-                        urgency_bar = "🔥" * min(alert.urgency_score, 10)
-                        
-                        content += f"{i:2d}. {risk_emoji} {alert.project_name}\n"
-                        content += f"     Risk Level: {alert.risk_level.value.upper()}\n"
-                        content += f"     Urgency: {urgency_bar} ({alert.urgency_score}/10)\n"
-                        content += f"     Stagnant for: {alert.days_since_activity} days\n"
-                        content += f"     Last Activity: {alert.last_activity_date.strftime('%Y-%m-%d') if alert.last_activity_date else 'Unknown'}\n"
-                        
-                        if alert.recommended_actions:
-                            content += f"     🎯 Recommended Actions:\n"
-                            for action in alert.recommended_actions[:2]:
-                                content += f"        • {action}\n"
-                        content += "\n"
-                        
-                elif uri == "cway://temporal-kpis/team-metrics":
-                    dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard()
-                    team_metrics = dashboard.team_temporal_metrics
-                    content = f"👥 TEAM TEMPORAL METRICS\n\n"
-                    
-                    # Activity patterns
-                    content += f"🗓️ ACTIVITY PATTERNS:\n"
-                    content += f"  Peak Day: {team_metrics.peak_activity_day_of_week}\n"
-                    content += f"  Peak Hour: {team_metrics.peak_activity_hour}:00\n"
-                    content += f"  Total Active Days: {team_metrics.total_active_days}\n\n"
-                    
-                    # Velocity metrics
-                    content += f"⚡ TEAM VELOCITY:\n"
-                    content += f"  Revisions/Day: {team_metrics.team_velocity_revisions_per_day:.2f}\n"
-                    content += f"  Projects/Month: {team_metrics.team_velocity_projects_per_month}\n"
-                    content += f"  Concurrent Projects: {team_metrics.concurrent_project_activity}\n"
-                    content += f"  Projects/Active Day: {team_metrics.avg_projects_per_active_day:.1f}\n\n"
-                    
-                    # Day of week breakdown
-                    if team_metrics.activity_by_day_of_week:
-                        content += f"📊 ACTIVITY BY DAY OF WEEK:\n"
-                        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                        for day in days_order:
-                            count = team_metrics.activity_by_day_of_week.get(day, 0)
-                            bar = "█" * min(count // 10, 20) if count > 0 else ""
-                            content += f"  {day:10s}: {count:3d} {bar}\n"
-                    
-                    # Monthly trends
-                    if team_metrics.monthly_activity_trend:
-                        content += f"\n📈 MONTHLY ACTIVITY TREND:\n"
-                        sorted_months = sorted(team_metrics.monthly_activity_trend.items())
-                        for month, count in sorted_months[-6:]:  # Last 6 months
-                            bar = "█" * min(count // 50, 20) if count > 0 else ""
-                            content += f"  {month}: {count:4d} {bar}\n"
-                    
-                elif uri == "cway://indexing/targets":
-                    targets = self.indexing_service.get_targets()
-                    content = f"📇 INDEXING TARGETS ({len(targets)} configured)\n\n"
-                    
-                    for target in targets:
-                        status_emoji = "✅" if target["enabled"] else "❌"
-                        content += f"{status_emoji} {target['name']} ({target['platform']})\n"
-                        content += f"   {target['description']}\n"
-                        content += f"   Config: {'✓' if target['has_config'] else '⚠️  Missing'}\n\n"
-                    
-                elif uri == "cway://indexing/status":
-                    active_jobs = self.indexing_service.get_active_jobs()
-                    recent_history = self.indexing_service.get_job_history(limit=10)
-                    
-                    content = f"⚙️  INDEXING STATUS\n\n"
-                    
-                    if active_jobs:
-                        content += f"🔄 ACTIVE JOBS ({len(active_jobs)}):\n"
-                        for job in active_jobs:
-                            content += f"  • {job['job_id']}: {job['message']}\n"
-                            content += f"    Running for: {job['duration_seconds']:.1f}s\n\n"
-                    else:
-                        content += f"🔄 ACTIVE JOBS: None\n\n"
-                    
-                    content += f"📊 RECENT HISTORY ({len(recent_history)} jobs):\n"
-                    for job in recent_history:
-                        status_emoji = "✅" if job["success"] else "❌"
-                        content += f"{status_emoji} {job['job_id']}\n"
-                        content += f"   {job['message']}\n"
-                        content += f"   Indexed: {job['documents_indexed']} docs | Duration: {job['duration_seconds']:.1f}s\n"
-                        content += f"   Targets: {job['targets_completed']} ✅, {job['targets_failed']} ❌\n\n"
-                    
-                elif uri == "cway://indexing/content-stats":
-                    stats = await self.indexing_service.get_indexable_content_stats()
-                    
-                    if "error" in stats:
-                        content = f"❌ Error getting content stats: {stats['error']}"
-                    else:
-                        content = f"📊 INDEXABLE CONTENT STATISTICS\n\n"
-                        content += f"📄 Total Documents: {stats['total_documents']:,}\n"
-                        content += f"📁 Projects: {stats['projects']:,}\n"
-                        content += f"👥 Users: {stats['users']:,}\n"
-                        content += f"📈 KPI Documents: {stats['kpi_documents']:,}\n"
-                        content += f"⏰ Temporal KPI Documents: {stats['temporal_kpi_documents']:,}\n\n"
-                        
-                        total = stats['total_documents']
-                        if total > 0:
-                            content += f"📊 DISTRIBUTION:\n"
-                            content += f"  Projects: {stats['projects']/total*100:.1f}%\n"
-                            content += f"  Users: {stats['users']/total*100:.1f}%\n"
-                            content += f"  KPIs: {stats['kpi_documents']/total*100:.1f}%\n"
-                            content += f"  Temporal KPIs: {stats['temporal_kpi_documents']/total*100:.1f}%\n"
-                    
-                elif uri == "cway://indexing/platforms":
-                    platforms = self.indexing_service.get_supported_platforms()
-                    content = f"🔌 SUPPORTED INDEXING PLATFORMS ({len(platforms)} available)\n\n"
-                    
-                    for platform in platforms:
-                        content += f"📦 {platform['name']} ({platform['platform']})\n"
-                        content += f"   {platform['description']}\n"
-                        content += f"   Config fields: {', '.join(platform['config_fields'])}\n"
-                        content += f"   Best for: {platform['suitable_for']}\n\n"
-                    
-                else:
-                    content = f"Resource not found: {uri}"
-                    
-                return [TextResourceContents(uri=uri, text=content, mimeType="text/plain")]
+                content = await self._read_resource_cached(uri)
+                # The framework builds the protocol contents from this, so the body is not copied twice
+                return [ReadResourceContents(content=content, mime_type="text/plain")]
                 
             except Exception as e:
-                logger.error(f"Error reading resource {uri}: {e}")
-                return [TextResourceContents(uri=uri, text=f"Error: {e}", mimeType="text/plain")]
+                logger.error("Error reading resource %s: %s", uri, e)
+                return [ReadResourceContents(content=f"Error: {e}", mime_type="text/plain")]
                 
         @self.server.list_tools()
         async def list_tools() -> ListToolsResult:
             """List available tools."""
             logger.info("🔧 list_tools called")
-            # Use modular tool definitions from tool_definitions.py
-            tools = get_all_tools()
-            return ListToolsResult(tools=tools)
+            return self._list_tools_result
             
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=False)
         async def call_tool(name: str, arguments: Optional[Dict[str, Any]] = None) -> CallToolResult:
             """Call a specific tool."""
-            logger.info(f"🛠️  call_tool invoked: {name} with arguments: {arguments}")
-            await self._ensure_initialized()
+            logger.info("🛠️  call_tool invoked: %s with arguments: %s", name, arguments)
+            if not self._initialized:
+                await self._ensure_initialized()
             
             if arguments is None:
                 arguments = {}
+            # Resolve aliases once so they share the target tool's schema and cache invalidation
+            name = _TOOL_ALIASES.get(name, name)
                 
             try:
+                validator = self._validators.get(name)
+                if validator is not None:
+                    arguments = validator(arguments)
                 result = await self._execute_tool(name, arguments)
+                if name in _RESOURCE_INVALIDATING_TOOLS:
+                    self._resource_cache.clear()
+                    self._shared_results.clear()
+                    self._user_lookup_cache.clear()
                 return CallToolResult(
-                    content=[TextContent(type="text", text=json.dumps(result, indent=2, default=str))],
+                    content=[TextContent(type="text", text=self._encode_result(result))],
                     isError=False
                 )
                 
             except Exception as e:
-                logger.error(f"Error calling tool {name}: {e}")
+                logger.error("Error calling tool %s: %s", name, e)
                 return CallToolResult(
                     content=[TextContent(type="text", text=f"Error: {e}")],
                     isError=True
                 )
                 
-    async def _ensure_initialized(self) -> None:
-        """Ensure the server is initialized with all dependencies."""
-        if not self.graphql_client:
-            self.graphql_client = CwayGraphQLClient()
-            await self.graphql_client.connect()
+    def _encode_result(self, result: Any) -> str:
+        """Encode a tool result as JSON, using orjson when it is installed."""
+        return self._json_encoder.encode(result)
+        
+    async def _read_resource_cached(self, uri: str) -> str:
+        """Render a resource, reusing a recent rendering while its TTL holds."""
+        ttl = _resource_cache_ttl(uri)
+        if ttl <= 0:
+            return await self._render_resource(uri)
+        
+        cached = self._resource_cache.get(uri)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        # Coalesce concurrent misses so each URI is rendered once at a time
+        lock = self._resource_locks.get(uri)
+        if lock is None:
+            lock = self._resource_locks[uri] = asyncio.Lock()
+        async with lock:
+            cached = self._resource_cache.get(uri)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
             
-            # Initialize repositories
-            self.user_repo = UserRepository(self.graphql_client)
-            self.project_repo = ProjectRepository(self.graphql_client)
-            self.artwork_repo = ArtworkRepository(self.graphql_client)
-            self.media_repo = MediaRepository(self.graphql_client)
-            self.share_repo = ShareRepository(self.graphql_client)
-            self.team_repo = TeamRepository(self.graphql_client)
-            self.search_repo = SearchRepository(self.graphql_client)
-            self.category_repo = CategoryRepository(self.graphql_client)
-            self.system_repo = CwaySystemRepository(self.graphql_client)
+            content = await self._render_resource(uri)
+            if not isinstance(content, _ErrorRendering):
+                self._resource_cache[uri] = (time.monotonic(), content)
+            return content
             
-            # Initialize KPI use cases
-            self.kpi_use_cases = KPIUseCases(
-                self.user_repo,
-                self.project_repo,
-                self.graphql_client
-            )
-            
-            # Initialize temporal KPI calculator
-            # Convert repositories to domain interfaces
-            from ..infrastructure.repository_adapters import CwayProjectRepositoryAdapter, CwayUserRepositoryAdapter
-            project_repo_adapter = CwayProjectRepositoryAdapter(self.project_repo)
-            user_repo_adapter = CwayUserRepositoryAdapter(self.user_repo)
-            
-            self.temporal_kpi_calculator = TemporalKPICalculator(
-                project_repo_adapter,
-                user_repo_adapter
-            )
-            
-    async def _execute_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
-        """Execute a specific tool."""
-        # Tool name aliases for consistency
-        if name == "list_all_users":
-            name = "list_users"
-        elif name == "get_planner_projects":
-            name = "list_projects"
-        elif name == "get_project_details":
-            name = "get_project_by_id"
-        elif name == "create_cway_user":
-            name = "create_user"
-        elif name == "create_cway_project":
-            name = "create_project"
-        elif name == "update_cway_project":
-            name = "update_project"
-        
-        if name == "list_projects":
-            projects = await self.project_repo.get_planner_projects()
-            return {
-                "projects": [
-                    {
-                        "id": p.id,
-                        "name": p.name,
-                        "state": p.state.value,
-                        "percentageDone": p.percentageDone,
-                        "startDate": str(p.startDate) if p.startDate else None,
-                        "endDate": str(p.endDate) if p.endDate else None,
-                        "isActive": p.is_active,
-                        "isCompleted": p.is_completed
-                    }
-                    for p in projects
-                ]
-            }
-            
-        elif name == "get_project":
-            project = await self.project_repo.find_project_by_id(arguments["project_id"])
-            if project:
-                return {
-                    "project": {
-                        "id": project.id,
-                        "name": project.name,
-                        "state": project.state.value,
-                        "percentageDone": project.percentageDone,
-                        "startDate": str(project.startDate) if project.startDate else None,
-                        "endDate": str(project.endDate) if project.endDate else None,
-                        "isActive": project.is_active,
-                        "isCompleted": project.is_completed
-                    }
-                }
-            return {"project": None, "message": "Project not found"}
-            
-        elif name == "get_active_projects":
-            projects = await self.project_repo.get_active_projects()
-            return {
-                "projects": [
-                    {
-                        "id": p.id,
-                        "name": p.name,
-                        "state": p.state.value,
-                        "percentageDone": p.percentageDone,
-                        "startDate": str(p.startDate) if p.startDate else None,
-                        "endDate": str(p.endDate) if p.endDate else None
-                    }
-                    for p in projects
-                ]
-            }
-            
-        elif name == "get_completed_projects":
-            projects = await self.project_repo.get_completed_projects()
-            return {
-                "projects": [
-                    {
-                        "id": p.id,
-                        "name": p.name,
-                        "state": p.state.value,
-                        "percentageDone": p.percentageDone,
-                        "startDate": str(p.startDate) if p.startDate else None,
-                        "endDate": str(p.endDate) if p.endDate else None
-                    }
-                    for p in projects
-                ]
-            }
-            
-        elif name == "list_users":
-            users = await self.user_repo.find_all_users()
-            return {
-                "users": [
-                    {
-                        "id": u.id,
-                        "name": u.name,
-                        "fullName": u.full_name,
-                        "email": u.email,
-                        "username": u.username,
-                        "firstName": u.firstName,
-                        "lastName": u.lastName,
-                        "enabled": u.enabled,
-                        "avatar": u.avatar,
-                        "isSSO": u.isSSO
-                    }
-                    for u in users
-                ]
-            }
-            
-        elif name == "get_user":
-            user = await self.user_repo.find_user_by_id(arguments["user_id"])
-            if user:
-                return {
-                    "user": {
-                        "id": user.id,
-                        "name": user.name,
-                        "fullName": user.full_name,
-                        "email": user.email,
-                        "username": user.username,
-                        "firstName": user.firstName,
-                        "lastName": user.lastName,
-                        "enabled": user.enabled,
-                        "avatar": user.avatar,
-                        "isSSO": user.isSSO,
-                        "acceptedTerms": user.acceptedTerms,
-                        "earlyAccessProgram": user.earlyAccessProgram
-                    }
-                }
-            return {"user": None, "message": "User not found"}
-            
-        elif name == "find_user_by_email":
-            user = await self.user_repo.find_user_by_email(arguments["email"])
-            if user:
-                return {
-                    "user": {
-                        "id": user.id,
-                        "name": user.name,
-                        "fullName": user.full_name,
-                        "email": user.email,
-                        "username": user.username,
-                        "enabled": user.enabled
-                    }
-                }
-            return {"user": None, "message": "User not found"}
-            
-        elif name == "get_users_page":
-            page_data = await self.user_repo.find_users_page(
-                page=arguments.get("page", 0),
-                size=arguments.get("size", 10)
-            )
-            return {
-                "users": [
-                    {
-                        "id": u.id,
-                        "name": u.name,
-                        "fullName": u.full_name,
-                        "email": u.email,
-                        "username": u.username,
-                        "enabled": u.enabled
-                    }
-                    for u in page_data["users"]
-                ],
-                "page": page_data["page"],
-                "totalHits": page_data["totalHits"]
-            }
-            
-        elif name == "get_system_status":
-            is_connected = await self.system_repo.validate_connection()
-            login_info = await self.system_repo.get_login_info()
-            
-            return {
-                "connected": is_connected,
-                "status": "online" if is_connected else "offline",
-                "api_url": settings.cway_api_url,
-                "login_info": login_info
-            }
-            
-        elif name == "analyze_project_velocity":
-            project_id = arguments["project_id"]
-            project = await self.project_repo.find_project_by_id(project_id)
-            if not project:
-                return {"error": "Project not found"}
-                
-            # Convert to domain project for analysis
-            from ..infrastructure.repository_adapters import CwayProjectRepositoryAdapter
-            adapter = CwayProjectRepositoryAdapter(self.project_repo)
-            domain_project = await adapter.get_project_by_id(project_id)
-            
-            if domain_project:
-                velocity_analysis = await self.temporal_kpi_calculator.analyze_project_velocity(domain_project)
-                return {
-                    "project_velocity_analysis": {
-                        "project_id": velocity_analysis.project_id,
-                        "project_name": velocity_analysis.project_name,
-                        "velocity_trend": velocity_analysis.velocity_trend,
-                        "velocity_consistency_score": velocity_analysis.velocity_consistency_score,
-                        "daily_velocities": [(str(date), count) for date, count in velocity_analysis.daily_velocities[-30:]],  # Last 30 days
-                        "weekly_velocities": velocity_analysis.weekly_velocities[-12:],  # Last 12 weeks
-                        "monthly_velocities": velocity_analysis.monthly_velocities[-6:],  # Last 6 months
-                        "activity_sprints": velocity_analysis.activity_sprints,
-                        "idle_periods": velocity_analysis.idle_periods,
-                        "velocity_forecast_next_week": velocity_analysis.velocity_forecast_next_week,
-                        "velocity_forecast_next_month": velocity_analysis.velocity_forecast_next_month
-                    }
-                }
-            return {"error": "Could not analyze project velocity"}
-            
-        elif name == "get_temporal_dashboard":
-            analysis_period = arguments.get("analysis_period_days", 90)
-            dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard(analysis_period)
-            
-            return {
-                "temporal_kpi_dashboard": {
-                    "generated_at": dashboard.generated_at.isoformat(),
-                    "analysis_period_days": dashboard.analysis_period_days,
-                    "total_projects_analyzed": dashboard.total_projects_analyzed,
-                    "total_revisions_in_period": dashboard.total_revisions_in_period,
-                    "avg_project_velocity": dashboard.avg_project_velocity,
-                    "projects_by_activity_level": {level.value: count for level, count in dashboard.projects_by_activity_level.items()},
-                    "projects_by_stagnation_risk": {risk.value: count for risk, count in dashboard.projects_by_stagnation_risk.items()},
-                    "team_temporal_metrics": {
-                        "total_active_days": dashboard.team_temporal_metrics.total_active_days,
-                        "peak_activity_day_of_week": dashboard.team_temporal_metrics.peak_activity_day_of_week,
-                        "peak_activity_hour": dashboard.team_temporal_metrics.peak_activity_hour,
-                        "team_velocity_revisions_per_day": dashboard.team_temporal_metrics.team_velocity_revisions_per_day,
-                        "team_velocity_projects_per_month": dashboard.team_temporal_metrics.team_velocity_projects_per_month,
-                        "concurrent_project_activity": dashboard.team_temporal_metrics.concurrent_project_activity
-                    },
-                    "overall_velocity_trend": dashboard.overall_velocity_trend,
-                    "productivity_trend": dashboard.productivity_trend,
-                    "most_active_projects": dashboard.most_active_projects,
-                    "most_stagnant_projects": dashboard.most_stagnant_projects,
-                    "projects_needing_attention": dashboard.projects_needing_attention,
-                    "temporal_recommendations": dashboard.temporal_recommendations,
-                    "stagnation_alerts_count": len(dashboard.stagnation_alerts)
-                }
-            }
-            
-        elif name == "get_stagnation_alerts":
-            min_urgency = arguments.get("min_urgency_score", 5)
-            dashboard = await self.temporal_kpi_calculator.generate_temporal_kpi_dashboard()
-            
-            filtered_alerts = [
-                alert for alert in dashboard.stagnation_alerts 
-                if alert.urgency_score >= min_urgency
-            ]
-            
-            return {
-                "stagnation_alerts": [
-                    {
-                        "project_id": alert.project_id,
-                        "project_name": alert.project_name,
-                        "risk_level": alert.risk_level.value,
-                        "days_since_activity": alert.days_since_activity,
-                        "last_activity_date": alert.last_activity_date.isoformat() if alert.last_activity_date else None,
-                        "previous_activity_level": alert.previous_activity_level.value,
-                        "expected_activity_level": alert.expected_activity_level.value,
-                        "urgency_score": alert.urgency_score,
-                        "recommended_actions": alert.recommended_actions
-                    }
-                    for alert in filtered_alerts
-                ],
-                "total_alerts": len(filtered_alerts),
-                "min_urgency_filter": min_urgency
-            }
-            
-        elif name == "index_all_content":
-            targets = arguments.get("targets")
-            result = await self.indexing_service.index_all_content(targets=targets)
-            return {
-                "indexing_result": {
-                    "job_id": result.job_id,
-                    "success": result.success,
-                    "message": result.message,
-                    "documents_indexed": result.documents_indexed,
-                    "duration_seconds": result.duration_seconds,
-                    "targets_completed": result.targets_completed,
-                    "targets_failed": result.targets_failed,
-                    "started_at": result.started_at.isoformat(),
-                    "completed_at": result.completed_at.isoformat() if result.completed_at else None
-                }
-            }
-            
-        elif name == "quick_backup":
-            result = await self.indexing_service.quick_backup()
-            return {
-                "backup_result": {
-                    "job_id": result.job_id,
-                    "success": result.success,
-                    "message": result.message,
-                    "documents_indexed": result.documents_indexed,
-                    "duration_seconds": result.duration_seconds,
-                    "started_at": result.started_at.isoformat(),
-                    "completed_at": result.completed_at.isoformat() if result.completed_at else None
-                }
-            }
-            
-        elif name == "index_project_content":
-            project_id = arguments["project_id"]
-            targets = arguments.get("targets")
-            result = await self.indexing_service.index_project_documents(project_id, targets=targets)
-            return {
-                "project_indexing_result": {
-                    "job_id": result.job_id,
-                    "success": result.success,
-                    "message": result.message,
-                    "documents_indexed": result.documents_indexed,
-                    "duration_seconds": result.duration_seconds,
-                    "targets_completed": result.targets_completed,
-                    "targets_failed": result.targets_failed,
-                    "started_at": result.started_at.isoformat(),
-                    "completed_at": result.completed_at.isoformat() if result.completed_at else None
-                }
-            }
-            
-        elif name == "configure_indexing_target":
-            name_arg = arguments["name"]
-            platform = arguments["platform"]
-            description = arguments["description"]
-            config = arguments.get("config")
-            enabled = arguments.get("enabled", True)
-            
-            success = self.indexing_service.add_target(
-                name=name_arg,
-                platform=platform,
-                description=description,
-                config=config,
-                enabled=enabled
-            )
-            
-            if not success:
-                # Try updating existing target
-                success = self.indexing_service.update_target(
-                    name=name_arg,
-                    description=description,
-                    config=config,
-                    enabled=enabled
-                )
-                action = "updated" if success else "failed to update"
-            else:
-                action = "created"
-            
-            return {
-                "configuration_result": {
-                    "success": success,
-                    "action": action,
-                    "target_name": name_arg,
-                    "platform": platform
-                }
-            }
-            
-        elif name == "get_indexing_job_status":
-            job_id = arguments["job_id"]
-            status = self.indexing_service.get_job_status(job_id)
+    async def _shared_result(
+        self,
+        key: str,
+        ttl: float,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Share one in-flight or recent computation between callers for ``ttl`` seconds."""
+        now = time.monotonic()
+        entry = self._shared_results.get(key)
+        if entry is None or now >= entry[0]:
+            # Drop expired entries so one-off keys do not keep their results alive
+            expired = [k for k, (expiry, _) in self._shared_results.items() if now >= expiry]
+            for expired_key in expired:
+                del self._shared_results[expired_key]
+            future = asyncio.ensure_future(compute())
+            entry = (now + ttl, future)
+            self._shared_results[key] = entry
+        
+        future = entry[1]
+        try:
+            # Shield so one cancelled caller does not cancel the shared computation
+            return await asyncio.shield(future)
+        except Exception:
+            if self._shared_results.get(key) is entry:
+                del self._shared_results[key]
+            raise
             
-            if status:
-                return {"job_status": status}
-            else:
-                return {"job_status": None, "message": "Job not found"}
-        
-        elif name == "get_login_info":
-            login_info = await self.system_repo.get_login_info()
-            if login_info:
-                return {"login_info": login_info}
-            return {"login_info": None, "message": "Login info not available"}
-        
-        elif name == "search_users":
-            query = arguments.get("query")
-            users = await self.user_repo.search_users(query)
-            return {
-                "users": [
-                    {
-                        "id": u.id,
-                        "name": u.name,
-                        "username": u.username,
-                        "email": u.email,
-                        "firstName": u.firstName,
-                        "lastName": u.lastName,
-                        "enabled": u.enabled
-                    }
-                    for u in users
-                ]
-            }
+    async def _get_temporal_dashboard(self, analysis_period_days: int = 90) -> TemporalKPIDashboard:
+        """Get the temporal KPI dashboard shared by the temporal resources and tools."""
+        return await self._shared_result(
+            f"temporal_dashboard:{analysis_period_days}",
+            _resource_cache_ttl("cway://temporal-kpis/dashboard"),
+            partial(self.temporal_kpi_calculator.generate_temporal_kpi_dashboard, analysis_period_days)
+        )
         
-        elif name == "search_projects":
-            query = arguments.get("query")
-            limit = arguments.get("limit", 10)
-            result = await self.project_repo.search_projects(query, limit)
-            return {
-                "projects": result.get("projects", []),
-                "total_hits": result.get("total_hits", 0)
-            }
+    async def _get_kpi_dashboard(self) -> SystemKPIDashboard:
+        """Get the system KPI dashboard shared by the KPI resources."""
+        return await self._shared_result(
+            "kpi_dashboard",
+            _resource_cache_ttl("cway://kpis/dashboard"),
+            self.kpi_use_cases.calculate_system_kpi_dashboard
+        )
         
-        elif name == "get_project_by_id":
-            project_id = arguments["project_id"]
-            project = await self.project_repo.get_project_by_id(project_id)
-            if project:
-                return {"project": project}
-            return {"project": None, "message": "Project not found"}
-        
-        elif name == "create_user":
-            email = arguments["email"]
-            username = arguments["username"]
-            first_name = arguments.get("first_name") or arguments.get("firstName")
-            last_name = arguments.get("last_name") or arguments.get("lastName")
-            user = await self.user_repo.create_user(email, username, first_name, last_name)
-            return {
-                "user": {
-                    "id": user.id,
-                    "name": user.name,
-                    "username": user.username,
-                    "email": user.email,
-                    "firstName": user.firstName,
-                    "lastName": user.lastName,
-                    "enabled": user.enabled
-                },
-                "message": "User created successfully"
-            }
+    async def _render_resource(self, uri: str) -> str:
+        """Render the text content of a resource."""
+        renderer = self._resource_renderers.get(uri)
+        if renderer is None:
+            return f"Resource not found: {uri}"
+        return await renderer()
+        
+    async def _render_projects(self) -> str:
+        """Render the planner project listing."""
+        projects = await self.project_repo.get_planner_projects()
+        return "\n".join([
+            f"Project: {p.name} (ID: {p.id})\n"
+            f"  State: {p.state.value}\n"
+            f"  Progress: {p.percentageDone:.1%}\n"
+            f"  Dates: {p.startDate} to {p.endDate}\n"
+            for p in projects
+        ])
+        
+    async def _render_users(self) -> str:
+        """Render the user listing."""
+        users = await self.user_repo.find_all_users()
+        return "\n".join([
+            f"User: {u.full_name} (ID: {u.id})\n"
+            f"  Email: {u.email}\n"
+            f"  Username: {u.username}\n"
+            f"  Enabled: {u.enabled}\n"
+            for u in users
+        ])
+        
+    async def _render_active_projects(self) -> str:
+        """Render the active project listing."""
+        projects = await self.project_repo.get_active_projects()
+        return f"Active Projects ({len(projects)}):\n\n" + "\n".join([
+            f"• {p.name} - {p.percentageDone:.1%} complete"
+            for p in projects
+        ])
+        
+    async def _render_completed_projects(self) -> str:
+        """Render the completed project listing."""
+        projects = await self.project_repo.get_completed_projects()
+        return f"Completed Projects ({len(projects)}):\n\n" + "\n".join([
+            f"• {p.name} - completed"
+            for p in projects
+        ])
+        
+    async def _render_system_status(self) -> str:
+        """Render the API connection status."""
+        is_connected, login_info = await asyncio.gather(
+            self.system_repo.validate_connection(),
+            self.system_repo.get_login_info()
+        )
+        return "".join([
+            "Cway System Status:\n",
+            f"  Connection: {'✅ Connected' if is_connected else '❌ Disconnected'}\n",
+            f"  Login Info: {dumps_pretty(login_info) if login_info else 'Not available'}\n",
+            f"  API URL: {settings.cway_api_url}\n",
+        ])
+        
+    async def _render_kpi_dashboard(self) -> str:
+        """Render the system KPI dashboard."""
+        dashboard = await self._get_kpi_dashboard()
+        parts = [
+            "📊 CWAY SYSTEM KPI DASHBOARD\n",
+            f"Generated: {dashboard.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            # Key metrics
+            "📈 KEY METRICS:\n",
+            f"  Projects: {dashboard.total_projects} | Users: {dashboard.total_users} | Revisions: {dashboard.total_revisions:,}\n\n",
+        ]
+        
+        # Critical KPIs with status indicators
+        kpis = [
+            ("Project Completion Rate", dashboard.project_completion_rate),
+            ("Stalled Project Rate", dashboard.stalled_project_rate),
+            ("System Utilization", dashboard.system_utilization),
+            ("Team Engagement", dashboard.team_engagement)
+        ]
+        
+        parts.append("🎯 CRITICAL KPIs:\n")
+        parts.extend(
+            f"  {_HEALTH_STATUS_EMOJI.get(kpi.status.value, '⚪')} {name}: {kpi.value:.1f}{kpi.unit} ({kpi.status.value.title()})\n"
+            for name, kpi in kpis
+        )
         
-        elif name == "update_user_name":
-            username = arguments["username"]
-            first_name = arguments.get("first_name") or arguments.get("firstName")
-            last_name = arguments.get("last_name") or arguments.get("lastName")
-            user = await self.user_repo.update_user_name(username, first_name, last_name)
-            if user:
-                return {
-                    "user": {
-                        "id": user.id,
-                        "username": user.username,
-                        "firstName": user.firstName,
-                        "lastName": user.lastName,
-                        "name": user.name,
-                        "email": user.email,
-                        "enabled": user.enabled
-                    },
-                    "message": "User updated successfully"
-                }
-            return {"user": None, "message": "User not found"}
-        
-        elif name == "prepare_delete_user":
-            username = arguments["username"]
-            
-            # Fetch user details for preview
-            users = await self.user_repo.search_users(username)
-            user = None
-            for u in users:
-                if u.username == username:
-                    user = u
-                    break
-            
-            if not user:
-                return {
-                    "action": "error",
-                    "message": f"User '{username}' not found",
-                    "warnings": [f"User '{username}' does not exist"]
-                }
-            
-            user_info = {
-                "username": user.username,
-                "name": user.name,
-                "email": user.email,
-                "enabled": user.enabled,
-                "is_sso": user.isSSO if hasattr(user, 'isSSO') else False
-            }
-            
-            # Generate warnings
-            warnings = [
-                f"⚠️ DESTRUCTIVE ACTION: Will permanently delete user '{username}'",
-                "🚨 THIS ACTION CANNOT BE UNDONE",
-                f"User email: {user.email}",
-                "All user data and associations will be permanently lost",
-                "User will lose access to all projects and artworks"
-            ]
-            
-            if user.isSSO if hasattr(user, 'isSSO') else False:
-                warnings.append("⚠️ This is an SSO user - deletion may affect external authentication")
-            
-            # Generate confirmation token
-            token_info = self.confirmation_service.generate_token(
-                action="delete_user",
-                data={"username": username}
+        # Health summary
+        health_summary = dashboard.health_summary
+        parts += [
+            "\n🏥 PROJECT HEALTH SUMMARY:\n",
+            f"  🔴 Critical: {health_summary.get('critical', 0)} projects\n",
+            f"  🟡 Warning: {health_summary.get('warning', 0)} projects\n",
+            f"  🟢 Healthy: {health_summary.get('healthy', 0)} projects\n",
+            f"  ⭐ Excellent: {health_summary.get('excellent', 0)} projects\n",
+        ]
+        
+        # Recommendations
+        if dashboard.recommendations:
+            parts.append("\n💡 RECOMMENDATIONS:\n")
+            parts.extend(f"  • {rec}\n" for rec in dashboard.recommendations[:3])  # Top 3
+        return "".join(parts)
+        
+    async def _render_project_health(self) -> str:
+        """Render the worst project health scores."""
+        health_scores = await self.kpi_use_cases.get_project_health_scores()
+        parts = [f"🏥 PROJECT HEALTH SCORES ({len(health_scores)} projects)\n\n"]
+        
+        for i, score in enumerate(health_scores[:10], 1):  # Top 10 worst
+            status_emoji = _HEALTH_STATUS_EMOJI.get(score.health_status.value, "⚪")
+            parts.append(
+                f"{i:2d}. {status_emoji} {score.project_name}\n"
+                f"    Overall Score: {score.overall_score:.1f}/100\n"
+                f"    Progress: {score.progress_percentage:.1f}% | Revisions: {score.total_revisions}\n"
             )
-            
-            return self.confirmation_service.create_preview_response(
-                action="delete",
-                items=[user_info],
-                item_type="user",
-                warnings=warnings,
-                token_info=token_info
+            if score.recommendations:
+                parts.append(f"    💡 {score.recommendations[0]}\n")
+            parts.append("\n")
+        return "".join(parts)
+        
+    async def _render_critical_projects(self) -> str:
+        """Render the projects needing attention."""
+        critical_projects = await self.kpi_use_cases.get_critical_projects()
+        parts = [f"🚨 CRITICAL PROJECTS REQUIRING ATTENTION ({len(critical_projects)} projects)\n\n"]
+        
+        for i, score in enumerate(critical_projects, 1):
+            status_emoji = "🔴" if score.health_status.value == "critical" else "🟡"
+            parts.append(
+                f"{i}. {status_emoji} {score.project_name}\n"
+                f"   Health Score: {score.overall_score:.1f}/100 ({score.health_status.value.upper()})\n"
+                f"   Progress: {score.progress_percentage:.1f}% | Revisions: {score.total_revisions}\n"
             )
-        
-        elif name == "confirm_delete_user":
-            confirmation_token = arguments["confirmation_token"]
             
-            try:
-                # Validate token and extract data
-                validated = self.confirmation_service.validate_token(confirmation_token)
-                if validated["action"] != "delete_user":
-                    return {
-                        "success": False,
-                        "message": "Invalid token: wrong action type"
-                    }
-                
-                username = validated["data"]["username"]
-                
-                # Execute the delete operation
-                success = await self.user_repo.delete_user(username)
-                
-                return {
-                    "success": success,
-                    "action": "deleted",
-                    "username": username,
-                    "message": f"User '{username}' deleted successfully" if success else f"Failed to delete user '{username}'"
-                }
-            except ValueError as e:
-                return {
-                    "success": False,
-                    "message": f"Confirmation failed: {str(e)}"
-                }
-        
-        elif name == "find_users_and_teams":
-            search = arguments.get("search")
-            page = arguments.get("page", 0)
-            size = arguments.get("size", 10)
-            result = await self.user_repo.find_users_and_teams(search, page, size)
-            return {
-                "items": result["items"],
-                "page": result["page"],
-                "total_hits": result["totalHits"],
-                "message": f"Found {result['totalHits']} users and teams"
-            }
-        
-        elif name == "get_permission_groups":
-            groups = await self.user_repo.get_permission_groups()
-            return {
-                "permission_groups": groups,
-                "count": len(groups),
-                "message": f"Retrieved {len(groups)} permission groups"
-            }
+            if score.recommendations:
+                parts.append("   🎯 Actions needed:\n")
+                parts.extend(f"      • {rec}\n" for rec in score.recommendations[:2])  # Top 2 recommendations
+            parts.append("\n")
+        return "".join(parts)
+        
+    async def _render_temporal_dashboard(self) -> str:
+        """Render the temporal KPI dashboard."""
+        dashboard = await self._get_temporal_dashboard()
+        parts = [
+            "⏰ TEMPORAL KPI DASHBOARD\n",
+            f"Generated: {dashboard.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            # Overview metrics
+            f"📊 OVERVIEW ({dashboard.analysis_period_days} days analysis):\n",
+            f"  Projects Analyzed: {dashboard.total_projects_analyzed}\n",
+            f"  Total Revisions: {dashboard.total_revisions_in_period:,}\n",
+            f"  Avg Project Velocity: {dashboard.avg_project_velocity:.1f} rev/week\n\n",
+        ]
+        
+        # Activity distribution
+        parts.append("🚀 PROJECT ACTIVITY LEVELS:\n")
+        parts.extend(
+            f"  {_ACTIVITY_LEVEL_EMOJI.get(level.value, '⚪')} {level.value.title()}: {count} projects\n"
+            for level, count in dashboard.projects_by_activity_level.items()
+        )
         
-        elif name == "set_user_permissions":
-            usernames = arguments["usernames"]
-            permission_group_id = arguments["permission_group_id"]
-            success = await self.user_repo.set_user_permissions(usernames, permission_group_id)
-            return {
-                "success": success,
-                "users_updated": len(usernames) if success else 0,
-                "message": f"Updated permissions for {len(usernames)} users" if success else "Failed to update permissions"
-            }
+        # Stagnation risks
+        parts.append("\n⚠️ STAGNATION RISK LEVELS:\n")
+        parts.extend(
+            f"  {_STAGNATION_RISK_EMOJI.get(risk.value, '⚪')} {risk.value.title()}: {count} projects\n"
+            for risk, count in dashboard.projects_by_stagnation_risk.items()
+        )
         
-        elif name == "create_project":
-            name_val = arguments["name"]
-            description = arguments.get("description")
-            project = await self.project_repo.create_project(name_val, description)
-            return {"project": project, "message": "Project created successfully"}
-        
-        elif name == "update_project":
-            project_id = arguments["project_id"]
-            name_val = arguments.get("name")
-            description = arguments.get("description")
-            project = await self.project_repo.update_project(project_id, name_val, description)
-            return {"project": project, "message": "Project updated successfully"}
-        
-        # Project workflow tools with confirmation
-        elif name == "prepare_close_projects":
-            project_ids = arguments["project_ids"]
-            force = arguments.get("force", False)
-            
-            # Fetch project details for preview
-            projects = []
-            warnings = []
-            for pid in project_ids:
-                project = await self.project_repo.get_project_by_id(pid)
-                if project:
-                    projects.append({
-                        "id": project["id"],
-                        "name": project["name"],
-                        "status": project.get("status", "unknown"),
-                        "artwork_count": len(project.get("artworks", [])) if "artworks" in project else 0
-                    })
-                else:
-                    warnings.append(f"Project {pid} not found")
-            
-            if not projects:
-                return {
-                    "action": "error",
-                    "message": "No valid projects found to close",
-                    "warnings": warnings
-                }
-            
-            # Generate warnings
-            warnings.append(f"Will close {len(projects)} project(s)")
-            if not force:
-                warnings.append("Artworks must be complete or approved to close")
-            else:
-                warnings.append("⚠️ Force close enabled - will close even with incomplete artworks")
-            warnings.append("This action can be reversed using reopen_projects")
-            
-            # Generate confirmation token
-            token_info = self.confirmation_service.generate_token(
-                action="close_projects",
-                data={"project_ids": project_ids, "force": force}
-            )
-            
-            return self.confirmation_service.create_preview_response(
-                action="close",
-                items=projects,
-                item_type="projects",
-                warnings=warnings,
-                token_info=token_info
+        # Team metrics
+        team_metrics = dashboard.team_temporal_metrics
+        parts += [
+            "\n👥 TEAM TEMPORAL PATTERNS:\n",
+            f"  Peak Activity Day: {team_metrics.peak_activity_day_of_week}\n",
+            f"  Peak Activity Hour: {team_metrics.peak_activity_hour}:00\n",
+            f"  Team Velocity: {team_metrics.team_velocity_revisions_per_day:.1f} rev/day\n",
+            # Trends
+            "\n📈 VELOCITY TRENDS:\n",
+            f"  Overall Trend: {dashboard.overall_velocity_trend.title()}\n",
+            f"  Productivity Trend: {dashboard.productivity_trend.title()}\n",
+        ]
+        
+        # Top projects
+        if dashboard.most_active_projects:
+            parts.append("\n🌟 MOST ACTIVE PROJECTS:\n")
+            parts.extend(
+                f"  {i}. {project}\n"
+                for i, project in enumerate(dashboard.most_active_projects[:5], 1)
             )
         
-        elif name == "confirm_close_projects":
-            confirmation_token = arguments["confirmation_token"]
-            
-            try:
-                # Validate token and extract data
-                validated = self.confirmation_service.validate_token(confirmation_token)
-                if validated["action"] != "close_projects":
-                    return {
-                        "success": False,
-                        "message": "Invalid token: wrong action type"
-                    }
-                
-                project_ids = validated["data"]["project_ids"]
-                force = validated["data"]["force"]
-                
-                # Execute the close operation
-                success = await self.project_repo.close_projects(project_ids, force)
-                
-                return {
-                    "success": success,
-                    "action": "closed",
-                    "closed_count": len(project_ids) if success else 0,
-                    "project_ids": project_ids,
-                    "message": f"Successfully closed {len(project_ids)} project(s)" if success else "Failed to close projects"
-                }
-            except ValueError as e:
-                return {
-                    "success": False,
-                    "message": f"Confirmation failed: {str(e)}"
-                }
-        
-        elif name == "reopen_projects":
-            project_ids = arguments["project_ids"]
-            success = await self.project_repo.reopen_projects(project_ids)
-            return {
-                "success": success,
-                "reopened_count": len(project_ids) if success else 0,
-                "message": f"Successfully reopened {len(project_ids)} projects" if success else "Failed to reopen projects"
-            }
+        # Stagnant projects
+        if dashboard.most_stagnant_projects:
+            parts.append("\n😴 MOST STAGNANT PROJECTS:\n")
+            parts.extend(
+                f"  {i}. {project}\n"
+                for i, project in enumerate(dashboard.most_stagnant_projects[:5], 1)
+            )
         
-        elif name == "prepare_delete_projects":
-            project_ids = arguments["project_ids"]
-            force = arguments.get("force", False)
-            
-            # Fetch project details for preview
-            projects = []
-            warnings = []
-            for pid in project_ids:
-                project = await self.project_repo.get_project_by_id(pid)
-                if project:
-                    projects.append({
-                        "id": project["id"],
-                        "name": project["name"],
-                        "status": project.get("status", "unknown"),
-                        "artwork_count": len(project.get("artworks", [])) if "artworks" in project else 0
-                    })
-                else:
-                    warnings.append(f"Project {pid} not found")
-            
-            if not projects:
-                return {
-                    "action": "error",
-                    "message": "No valid projects found to delete",
-                    "warnings": warnings
-                }
+        # Alerts summary
+        if dashboard.stagnation_alerts:
+            urgent_alerts = [a for a in dashboard.stagnation_alerts if a.urgency_score >= 8]
+            parts.append(f"\n🚨 URGENT ALERTS: {len(urgent_alerts)} projects need immediate attention\n")
+        
+        # Recommendations
+        if dashboard.temporal_recommendations:
+            parts.append("\n💡 KEY RECOMMENDATIONS:\n")
+            parts.extend(f"  • {rec}\n" for rec in dashboard.temporal_recommendations[:3])
+        return "".join(parts)
+        
+    async def _render_project_timelines(self) -> str:
+        """Render the project activity timelines."""
+        dashboard = await self._get_temporal_dashboard()
+        parts = [f"📅 PROJECT ACTIVITY TIMELINES ({len(dashboard.project_timelines)} projects)\n\n"]
+        
+        for timeline in dashboard.project_timelines[:15]:  # Show top 15
+            activity_emoji = _ACTIVITY_LEVEL_EMOJI.get(timeline.activity_level.value, "⚪")
+            risk_emoji = _STAGNATION_RISK_EMOJI.get(timeline.stagnation_risk.value, "⚪")
             
-            # Generate warnings
-            warnings.append(f"⚠️ DESTRUCTIVE ACTION: Will permanently delete {len(projects)} project(s)")
-            warnings.append("🚨 THIS ACTION CANNOT BE UNDONE")
-            if not force:
-                warnings.append("Projects must be empty (no artworks) to delete")
-            else:
-                warnings.append("⚠️ Force delete enabled - will delete even if projects are not empty")
-            warnings.append("All associated artworks and data will be permanently lost")
+            parts.append(
+                f"{activity_emoji} {timeline.project_name}\n"
+                f"  Activity: {timeline.activity_level.value.title()} ({timeline.revisions_per_week:.1f} rev/week)\n"
+                f"  Stagnation Risk: {risk_emoji} {timeline.stagnation_risk.value.title()}\n"
+                f"  Last Activity: {timeline.days_since_last_activity} days ago\n"
+                f"  Total Revisions: {timeline.total_revisions}\n"
+            )
+            if timeline.estimated_completion_date:
+                parts.append(f"  Est. Completion: {timeline.estimated_completion_date}\n")
+            parts.append("\n")
+        return "".join(parts)
+        
+    async def _render_stagnation_alerts(self) -> str:
+        """Render the most urgent stagnation alerts."""
+        dashboard = await self._get_temporal_dashboard()
+        alerts = dashboard.stagnation_alerts
+        parts = [f"🚨 STAGNATION ALERTS ({len(alerts)} projects at risk)\n\n"]
+        
+        for i, alert in enumerate(alerts[:10], 1):  # Top 10 most urgent
+            risk_emoji = _ALERT_RISK_EMOJI.get(alert.risk_level.value, "⚪")
+            urgency_bar = _URGENCY_BARS[max(0, min(alert.urgency_score, 10))]
             
-            # Generate confirmation token
-            token_info = self.confirmation_service.generate_token(
-                action="delete_projects",
-                data={"project_ids": project_ids, "force": force}
+            parts.append(
+                f"{i:2d}. {risk_emoji} {alert.project_name}\n"
+                f"     Risk Level: {alert.risk_level.value.upper()}\n"
+                f"     Urgency: {urgency_bar} ({alert.urgency_score}/10)\n"
+                f"     Stagnant for: {alert.days_since_activity} days\n"
+                f"     Last Activity: {alert.last_activity_date.strftime('%Y-%m-%d') if alert.last_activity_date else 'Unknown'}\n"
             )
             
-            return self.confirmation_service.create_preview_response(
-                action="delete",
-                items=projects,
-                item_type="projects",
-                warnings=warnings,
-                token_info=token_info
+            if alert.recommended_actions:
+                parts.append("     🎯 Recommended Actions:\n")
+                parts.extend(f"        • {action}\n" for action in alert.recommended_actions[:2])
+            parts.append("\n")
+        return "".join(parts)
+        
+    async def _render_team_metrics(self) -> str:
+        """Render the team temporal metrics."""
+        dashboard = await self._get_temporal_dashboard()
+        team_metrics = dashboard.team_temporal_metrics
+        parts = [
+            "👥 TEAM TEMPORAL METRICS\n\n",
+            # Activity patterns
+            "🗓️ ACTIVITY PATTERNS:\n",
+            f"  Peak Day: {team_metrics.peak_activity_day_of_week}\n",
+            f"  Peak Hour: {team_metrics.peak_activity_hour}:00\n",
+            f"  Total Active Days: {team_metrics.total_active_days}\n\n",
+            # Velocity metrics
+            "⚡ TEAM VELOCITY:\n",
+            f"  Revisions/Day: {team_metrics.team_velocity_revisions_per_day:.2f}\n",
+            f"  Projects/Month: {team_metrics.team_velocity_projects_per_month}\n",
+            f"  Concurrent Projects: {team_metrics.concurrent_project_activity}\n",
+            f"  Projects/Active Day: {team_metrics.avg_projects_per_active_day:.1f}\n\n",
+        ]
+        
+        # Day of week breakdown
+        if team_metrics.activity_by_day_of_week:
+            parts.append("📊 ACTIVITY BY DAY OF WEEK:\n")
+            for day in _DAYS_OF_WEEK:
+                count = team_metrics.activity_by_day_of_week.get(day, 0)
+                bar = _ACTIVITY_BARS[min(count // 10, 20)] if count > 0 else ""
+                parts.append(f"  {day:10s}: {count:3d} {bar}\n")
+        
+        # Monthly trends
+        if team_metrics.monthly_activity_trend:
+            parts.append("\n📈 MONTHLY ACTIVITY TREND:\n")
+            for month, count in team_metrics.sorted_monthly_activity_trend[-6:]:  # Last 6 months
+                bar = _ACTIVITY_BARS[min(count // 50, 20)] if count > 0 else ""
+                parts.append(f"  {month}: {count:4d} {bar}\n")
+        return "".join(parts)
+        
+    async def _render_indexing_targets(self) -> str:
+        """Render the configured indexing targets."""
+        targets = self.indexing_service.get_targets()
+        parts = [f"📇 INDEXING TARGETS ({len(targets)} configured)\n\n"]
+        
+        for target in targets:
+            status_emoji = "✅" if target["enabled"] else "❌"
+            parts.append(
+                f"{status_emoji} {target['name']} ({target['platform']})\n"
+                f"   {target['description']}\n"
+                f"   Config: {'✓' if target['has_config'] else '⚠️  Missing'}\n\n"
+            )
+        return "".join(parts)
+        
+    async def _render_indexing_status(self) -> str:
+        """Render active and recent indexing jobs."""
+        active_jobs = self.indexing_service.get_active_jobs()
+        recent_history = self.indexing_service.get_job_history(limit=10)
+        if not active_jobs and not recent_history:
+            return _INDEXING_IDLE_STATUS
+        
+        parts = ["⚙️  INDEXING STATUS\n\n"]
+        
+        if active_jobs:
+            parts.append(f"🔄 ACTIVE JOBS ({len(active_jobs)}):\n")
+            for job in active_jobs:
+                parts.append(
+                    f"  • {job['job_id']}: {job['message']}\n"
+                    f"    Running for: {job['duration_seconds']:.1f}s\n\n"
+                )
+        else:
+            parts.append("🔄 ACTIVE JOBS: None\n\n")
+        
+        parts.append(f"📊 RECENT HISTORY ({len(recent_history)} jobs):\n")
+        for job in recent_history:
+            status_emoji = "✅" if job["success"] else "❌"
+            parts.append(
+                f"{status_emoji} {job['job_id']}\n"
+                f"   {job['message']}\n"
+                f"   Indexed: {job['documents_indexed']} docs | Duration: {job['duration_seconds']:.1f}s\n"
+                f"   Targets: {job['targets_completed']} ✅, {job['targets_failed']} ❌\n\n"
+            )
+        return "".join(parts)
+        
+    async def _render_content_stats(self) -> str:
+        """Render the indexable content statistics."""
+        stats = await self.indexing_service.get_indexable_content_stats()
+        
+        if "error" in stats:
+            return _ErrorRendering(f"❌ Error getting content stats: {stats['error']}")
+        
+        parts = [
+            "📊 INDEXABLE CONTENT STATISTICS\n\n",
+            f"📄 Total Documents: {stats['total_documents']:,}\n",
+            f"📁 Projects: {stats['projects']:,}\n",
+            f"👥 Users: {stats['users']:,}\n",
+            f"📈 KPI Documents: {stats['kpi_documents']:,}\n",
+            f"⏰ Temporal KPI Documents: {stats['temporal_kpi_documents']:,}\n\n",
+        ]
+        
+        total = stats['total_documents']
+        if total > 0:
+            parts += [
+                "📊 DISTRIBUTION:\n",
+                f"  Projects: {stats['projects']/total*100:.1f}%\n",
+                f"  Users: {stats['users']/total*100:.1f}%\n",
+                f"  KPIs: {stats['kpi_documents']/total*100:.1f}%\n",
+                f"  Temporal KPIs: {stats['temporal_kpi_documents']/total*100:.1f}%\n",
+            ]
+        return "".join(parts)
+        
+    async def _render_indexing_platforms(self) -> str:
+        """Render the supported indexing platforms."""
+        platforms = self.indexing_service.get_supported_platforms()
+        parts = [f"🔌 SUPPORTED INDEXING PLATFORMS ({len(platforms)} available)\n\n"]
+        
+        for platform in platforms:
+            parts.append(
+                f"📦 {platform['name']} ({platform['platform']})\n"
+                f"   {platform['description']}\n"
+                f"   Config fields: {', '.join(platform['config_fields'])}\n"
+                f"   Best for: {platform['suitable_for']}\n\n"
             )
+        return "".join(parts)
+
+    async def _ensure_initialized(self) -> None:
+        """Ensure the server is initialized with all dependencies."""
+        if self._initialized:
+            return
         
-        elif name == "confirm_delete_projects":
-            confirmation_token = arguments["confirmation_token"]
+        # Created lazily so the lock binds to the running event loop
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        
+        async with self._init_lock:
+            if self._initialized:
+                return
             
-            try:
-                # Validate token and extract data
-                validated = self.confirmation_service.validate_token(confirmation_token)
-                if validated["action"] != "delete_projects":
-                    return {
-                        "success": False,
-                        "message": "Invalid token: wrong action type"
-                    }
+            if not self.graphql_client:
+                self.graphql_client = CwayGraphQLClient()
+                await self.graphql_client.connect()
                 
-                project_ids = validated["data"]["project_ids"]
-                force = validated["data"]["force"]
+                # Initialize repositories
+                self.user_repo = UserRepository(self.graphql_client)
+                self.project_repo = ProjectRepository(self.graphql_client)
+                self.artwork_repo = ArtworkRepository(self.graphql_client)
+                self.media_repo = MediaRepository(self.graphql_client)
+                self.share_repo = ShareRepository(self.graphql_client)
+                self.team_repo = TeamRepository(self.graphql_client)
+                self.search_repo = SearchRepository(self.graphql_client)
+                self.category_repo = CategoryRepository(self.graphql_client)
+                self.system_repo = CwaySystemRepository(self.graphql_client)
                 
-                # Execute the delete operation
-                success = await self.project_repo.delete_projects(project_ids, force)
+                # Initialize KPI use cases
+                self.kpi_use_cases = KPIUseCases(
+                    self.user_repo,
+                    self.project_repo,
+                    self.graphql_client
+                )
                 
-                return {
-                    "success": success,
-                    "action": "deleted",
-                    "deleted_count": len(project_ids) if success else 0,
-                    "project_ids": project_ids,
-                    "message": f"Successfully deleted {len(project_ids)} project(s)" if success else "Failed to delete projects"
-                }
-            except ValueError as e:
-                return {
-                    "success": False,
-                    "message": f"Confirmation failed: {str(e)}"
-                }
-        
-        # Artwork tools
-        elif name == "get_artwork":
-            artwork_id = arguments["artwork_id"]
-            artwork = await self.project_repo.get_artwork(artwork_id)
-            if artwork:
-                return {"artwork": artwork}
-            return {"artwork": None, "message": "Artwork not found"}
-        
-        elif name == "create_artwork":
-            project_id = arguments["project_id"]
-            artwork_name = arguments["name"]
-            description = arguments.get("description")
-            artwork = await self.project_repo.create_artwork(project_id, artwork_name, description)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Artwork created successfully"
-            }
-        
-        elif name == "approve_artwork":
-            artwork_id = arguments["artwork_id"]
-            artwork = await self.project_repo.approve_artwork(artwork_id)
-            return {
-                "artwork": artwork,
-                "success": artwork is not None,
-                "message": "Artwork approved successfully" if artwork else "Failed to approve artwork"
-            }
-        
-        elif name == "reject_artwork":
-            artwork_id = arguments["artwork_id"]
-            reason = arguments.get("reason")
-            artwork = await self.project_repo.reject_artwork(artwork_id, reason)
-            return {
-                "artwork": artwork,
-                "success": artwork is not None,
-                "message": "Artwork rejected successfully" if artwork else "Failed to reject artwork"
-            }
-        
-        elif name == "get_my_artworks":
-            result = await self.project_repo.get_my_artworks()
-            return {
-                "artworks": result,
-                "message": f"Found {result['total_count']} artworks requiring action"
-            }
-        
-        elif name == "get_artworks_to_approve":
-            artworks = await self.project_repo.get_artworks_to_approve()
-            return {
-                "artworks": artworks,
-                "count": len(artworks),
-                "message": f"Found {len(artworks)} artworks awaiting approval"
-            }
-        
-        elif name == "get_artworks_to_upload":
-            artworks = await self.project_repo.get_artworks_to_upload()
-            return {
-                "artworks": artworks,
-                "count": len(artworks),
-                "message": f"Found {len(artworks)} artworks requiring upload"
-            }
-        
-        elif name == "download_artworks":
-            artwork_ids = arguments["artwork_ids"]
-            zip_name = arguments.get("zip_name")
-            job_id = await self.project_repo.create_artwork_download_job(artwork_ids, zip_name)
-            return {
-                "job_id": job_id,
-                "artwork_count": len(artwork_ids),
-                "success": True,
-                "message": f"Download job created for {len(artwork_ids)} artworks. Job ID: {job_id}"
-            }
-        
-        elif name == "get_artwork_preview":
-            artwork_id = arguments["artwork_id"]
-            preview = await self.project_repo.get_artwork_preview(artwork_id)
-            if preview:
-                return {
-                    "preview": preview,
-                    "message": "Preview file retrieved successfully"
-                }
-            return {
-                "preview": None,
-                "message": "No preview available for this artwork"
-            }
-        
-        elif name == "get_artwork_history":
-            artwork_id = arguments["artwork_id"]
-            history = await self.project_repo.get_artwork_history(artwork_id)
-            return {
-                "history": history,
-                "event_count": len(history),
-                "message": f"Retrieved {len(history)} artwork events"
-            }
-        
-        elif name == "analyze_artwork_ai":
-            artwork_id = arguments["artwork_id"]
-            thread_id = await self.project_repo.analyze_artwork_ai(artwork_id)
-            return {
-                "thread_id": thread_id,
-                "success": True,
-                "message": f"AI analysis started. Thread ID: {thread_id}"
-            }
-        
-        elif name == "generate_project_summary_ai":
-            project_id = arguments["project_id"]
-            audience = arguments.get("audience", "PROJECT_MANAGER")
-            summary = await self.project_repo.generate_project_summary_ai(project_id, audience)
-            return {
-                "summary": summary,
-                "audience": audience,
-                "success": True,
-                "message": "AI summary generated successfully"
-            }
-        
-        # Artwork workflow tools
-        elif name == "submit_artwork_for_review":
-            artwork_id = arguments["artwork_id"]
-            artwork = await self.project_repo.submit_artwork_for_review(artwork_id)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Artwork submitted for review"
-            }
-        
-        elif name == "request_artwork_changes":
-            artwork_id = arguments["artwork_id"]
-            reason = arguments["reason"]
-            artwork = await self.project_repo.request_artwork_changes(artwork_id, reason)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Changes requested on artwork"
-            }
-        
-        elif name == "get_artwork_comments":
-            artwork_id = arguments["artwork_id"]
-            limit = arguments.get("limit", 50)
-            comments = await self.project_repo.get_artwork_comments(artwork_id, limit)
-            return {
-                "comments": comments,
-                "comment_count": len(comments),
-                "message": f"Retrieved {len(comments)} comments"
-            }
-        
-        elif name == "add_artwork_comment":
-            artwork_id = arguments["artwork_id"]
-            text = arguments["text"]
-            comment = await self.project_repo.add_artwork_comment(artwork_id, text)
-            return {
-                "comment": comment,
-                "success": True,
-                "message": "Comment added to artwork"
-            }
-        
-        elif name == "get_artwork_versions":
-            artwork_id = arguments["artwork_id"]
-            versions = await self.project_repo.get_artwork_versions(artwork_id)
-            return {
-                "versions": versions,
-                "version_count": len(versions),
-                "message": f"Retrieved {len(versions)} versions"
-            }
-        
-        elif name == "restore_artwork_version":
-            artwork_id = arguments["artwork_id"]
-            version_id = arguments["version_id"]
-            artwork = await self.project_repo.restore_artwork_version(artwork_id, version_id)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Artwork rolled back to previous version"
-            }
-        
-        elif name == "assign_artwork":
-            artwork_id = arguments["artwork_id"]
-            user_id = arguments["user_id"]
-            artwork = await self.project_repo.assign_artwork(artwork_id, user_id)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": f"Artwork assigned to user {user_id}"
-            }
-        
-        elif name == "duplicate_artwork":
-            artwork_id = arguments["artwork_id"]
-            new_name = arguments.get("new_name")
-            artwork = await self.project_repo.duplicate_artwork(artwork_id, new_name)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": f"Artwork duplicated successfully. New ID: {artwork.get('id')}"
-            }
-        
-        elif name == "archive_artwork":
-            artwork_id = arguments["artwork_id"]
-            artwork = await self.project_repo.archive_artwork(artwork_id)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Artwork archived successfully"
-            }
-        
-        elif name == "unarchive_artwork":
-            artwork_id = arguments["artwork_id"]
-            artwork = await self.project_repo.unarchive_artwork(artwork_id)
-            return {
-                "artwork": artwork,
-                "success": True,
-                "message": "Artwork unarchived successfully"
-            }
-        
-        # Team management tools
-        elif name == "get_team_members":
-            project_id = arguments["project_id"]
-            team_members = await self.project_repo.get_team_members(project_id)
-            return {
-                "team_members": team_members,
-                "member_count": len(team_members),
-                "message": f"Retrieved {len(team_members)} team members"
-            }
-        
-        elif name == "add_team_member":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            role = arguments.get("role")
-            team_member = await self.project_repo.add_team_member(project_id, user_id, role)
-            return {
-                "team_member": team_member,
-                "success": True,
-                "message": f"User added to team with role: {team_member.get('role', 'Member')}"
-            }
-        
-        elif name == "remove_team_member":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            result = await self.project_repo.remove_team_member(project_id, user_id)
-            return {
-                "success": result.get("success", False),
-                "message": result.get("message", "Team member removed successfully")
-            }
-        
-        elif name == "update_team_member_role":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            role = arguments["role"]
-            team_member = await self.project_repo.update_team_member_role(project_id, user_id, role)
-            return {
-                "team_member": team_member,
-                "success": True,
-                "message": f"Team member role updated to: {role}"
-            }
-        
-        elif name == "get_user_roles":
-            roles = await self.project_repo.get_user_roles()
-            return {
-                "roles": roles,
-                "role_count": len(roles),
-                "message": f"Retrieved {len(roles)} user roles"
-            }
-        
-        elif name == "transfer_project_ownership":
-            project_id = arguments["project_id"]
-            new_owner_id = arguments["new_owner_id"]
-            project = await self.project_repo.transfer_project_ownership(project_id, new_owner_id)
-            return {
-                "project": project,
-                "success": True,
-                "message": f"Project ownership transferred to user {new_owner_id}"
-            }
-        
-        # Search and activity tools
-        elif name == "search_artworks":
-            query = arguments.get("query")
-            project_id = arguments.get("project_id")
-            status = arguments.get("status")
-            limit = arguments.get("limit", 50)
-            page = arguments.get("page", 0)
-            result = await self.project_repo.search_artworks(query, project_id, status, limit, page)
-            return {
-                "artworks": result.get("artworks", []),
-                "total_hits": result.get("totalHits", 0),
-                "page": result.get("page", 0),
-                "message": f"Found {result.get('totalHits', 0)} artworks matching criteria"
-            }
-        
-        elif name == "get_project_timeline":
-            project_id = arguments["project_id"]
-            limit = arguments.get("limit", 100)
-            timeline = await self.project_repo.get_project_timeline(project_id, limit)
-            return {
-                "timeline": timeline,
-                "event_count": len(timeline),
-                "message": f"Retrieved {len(timeline)} timeline events"
-            }
-        
-        elif name == "get_user_activity":
-            user_id = arguments["user_id"]
-            days = arguments.get("days", 30)
-            limit = arguments.get("limit", 100)
-            activities = await self.project_repo.get_user_activity(user_id, days, limit)
-            return {
-                "activities": activities,
-                "activity_count": len(activities),
-                "message": f"Retrieved {len(activities)} user activities from last {days} days"
-            }
-        
-        elif name == "bulk_update_artwork_status":
-            artwork_ids = arguments["artwork_ids"]
-            status = arguments["status"]
-            result = await self.project_repo.bulk_update_artwork_status(artwork_ids, status)
-            return {
-                "updated_artworks": result.get("updatedArtworks", []),
-                "success_count": result.get("successCount", 0),
-                "failed_count": result.get("failedCount", 0),
-                "success": True,
-                "message": f"Updated {result.get('successCount', 0)} artworks to status: {status}"
-            }
-        
-        # Folder tools
-        elif name == "get_folder_tree":
-            folders = await self.project_repo.get_folder_tree()
-            return {"folders": folders}
-        
-        elif name == "get_folder":
-            folder_id = arguments["folder_id"]
-            folder = await self.project_repo.get_folder(folder_id)
-            if folder:
-                return {"folder": folder}
-            return {"folder": None, "message": "Folder not found"}
-        
-        elif name == "get_folder_items":
-            folder_id = arguments["folder_id"]
-            page = arguments.get("page", 0)
-            size = arguments.get("size", 20)
-            result = await self.project_repo.get_folder_items(folder_id, page, size)
-            return {
-                "items": result.get("items", []),
-                "total_hits": result.get("totalHits", 0),
-                "page": result.get("page", 0)
-            }
-        
-        # Project status tools
-        elif name == "get_project_status_summary":
-            summary = await self.project_repo.get_project_status_summary()
-            return {
-                "summary": summary,
-                "message": f"Analyzed {summary['total']} projects"
-            }
-        
-        elif name == "compare_projects":
-            project_ids = arguments["project_ids"]
-            comparison = await self.project_repo.compare_projects(project_ids)
-            return {
-                "comparison": comparison,
-                "project_count": len(comparison['projects']),
-                "message": f"Compared {len(comparison['projects'])} projects"
-            }
-        
-        elif name == "get_project_history":
-            project_id = arguments["project_id"]
-            history = await self.project_repo.get_project_history(project_id)
-            return {
-                "history": history,
-                "event_count": len(history),
-                "message": f"Retrieved {len(history)} events"
-            }
-        
-        elif name == "get_monthly_project_trends":
-            trends = await self.project_repo.get_monthly_project_trends()
-            return {
-                "trends": trends,
-                "month_count": len(trends),
-                "message": f"Retrieved {len(trends)} months of project data"
+                # Initialize temporal KPI calculator
+                # Convert repositories to domain interfaces
+                project_repo_adapter = CwayProjectRepositoryAdapter(self.project_repo)
+                user_repo_adapter = CwayUserRepositoryAdapter(self.user_repo)
+                
+                self.temporal_kpi_calculator = TemporalKPICalculator(
+                    project_repo_adapter,
+                    user_repo_adapter
+                )
+                
+            self._initialized = True
+            
+    async def _execute_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Execute a specific tool."""
+        name = _TOOL_ALIASES.get(name, name)
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
+        
+    async def _tool_list_projects(self, arguments: Dict[str, Any]) -> Any:
+        """List all Cway planner projects."""
+        projects = await self.project_repo.get_planner_projects()
+        return {"projects": [ProjectSummary.from_project(p) for p in projects]}
+        
+    async def _tool_get_project(self, arguments: Dict[str, Any]) -> Any:
+        """Get a specific Cway planner project by ID."""
+        project = await self.project_repo.find_project_by_id(arguments["project_id"])
+        if project:
+            return {"project": ProjectSummary.from_project(project)}
+        return {"project": None, "message": "Project not found"}
+        
+    async def _tool_get_active_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Get all active (in progress) projects."""
+        projects = await self.project_repo.get_active_projects()
+        return {"projects": [ProjectListing.from_project(p) for p in projects]}
+        
+    async def _tool_get_completed_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Get all completed projects."""
+        projects = await self.project_repo.get_completed_projects()
+        return {"projects": [ProjectListing.from_project(p) for p in projects]}
+        
+    async def _tool_list_users(self, arguments: Dict[str, Any]) -> Any:
+        """List all Cway users."""
+        users = await self.user_repo.find_all_users()
+        return {"users": [UserProfile.from_user(u) for u in users]}
+        
+    async def _tool_get_user(self, arguments: Dict[str, Any]) -> Any:
+        """Get a specific Cway user by ID."""
+        user = await self.user_repo.find_user_by_id(arguments["user_id"])
+        if user:
+            return {"user": UserDetail.from_user(user)}
+        return {"user": None, "message": "User not found"}
+        
+    async def _tool_find_user_by_email(self, arguments: Dict[str, Any]) -> Any:
+        """Find a Cway user by email address."""
+        email = arguments["email"].strip().lower()
+        # Agents often re-resolve the same address; user writes clear this via _RESOURCE_INVALIDATING_TOOLS
+        cached = self._user_lookup_cache.get(email)
+        if cached and time.monotonic() < cached[0]:
+            self._user_lookup_cache.move_to_end(email)
+            user = cached[1]
+        else:
+            user = await self.user_repo.find_user_by_email(email)
+            if user:
+                self._cache_user_lookup(email, user)
+        if user:
+            return {"user": UserSummary.from_user(user)}
+        return {"user": None, "message": "User not found"}
+        
+    def _cache_user_lookup(self, key: str, user: Any) -> None:
+        """Remember a user lookup for the resource TTL, evicting the oldest entry when full."""
+        self._user_lookup_cache[key] = (time.monotonic() + settings.resource_cache_ttl_seconds, user)
+        self._user_lookup_cache.move_to_end(key)
+        if len(self._user_lookup_cache) > _MAX_CACHED_USER_LOOKUPS:
+            self._user_lookup_cache.popitem(last=False)
+        
+    async def _tool_get_users_page(self, arguments: Dict[str, Any]) -> Any:
+        """Get users with pagination."""
+        page = arguments.get("page", 0)
+        size = arguments.get("size", 10)
+        pages = arguments.get("pages", 1)
+        
+        if pages <= 1:
+            page_data = await self.user_repo.find_users_page(page=page, size=size)
+            return {
+                "users": [UserSummary.from_user(u) for u in page_data["users"]],
+                "page": page_data["page"],
+                "totalHits": page_data["totalHits"]
             }
         
-        # Media center tools
-        elif name == "search_media_center":
-            query = arguments.get("query")
-            folder_id = arguments.get("folder_id")
-            limit = arguments.get("limit", 50)
-            result = await self.project_repo.search_media_center(query, folder_id, limit=limit)
-            return {
-                "results": result,
-                "message": f"Found {result['total_hits']} items matching search"
-            }
+        # Fetch consecutive pages concurrently, bounded to avoid hammering the API
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
         
-        elif name == "get_media_center_stats":
-            stats = await self.project_repo.get_media_center_stats()
-            return {
-                "stats": stats,
-                "message": "Media center statistics retrieved"
-            }
+        async def fetch_page(page_number: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.user_repo.find_users_page(page=page_number, size=size)
         
-        elif name == "download_folder_contents":
-            folder_id = arguments["folder_id"]
-            zip_name = arguments.get("zip_name")
-            job_id = await self.project_repo.download_folder_contents(folder_id, zip_name)
-            return {
-                "job_id": job_id,
-                "success": True,
-                "message": f"Download job created for folder. Job ID: {job_id}"
-            }
+        results = await asyncio.gather(*(fetch_page(p) for p in range(page, page + pages)))
+        return {
+            "users": [UserSummary.from_user(u) for page_data in results for u in page_data["users"]],
+            "page": page,
+            "pages": len(results),
+            "totalHits": results[0]["totalHits"]
+        }
         
-        elif name == "download_project_media":
-            project_id = arguments["project_id"]
-            zip_name = arguments.get("zip_name")
-            job_id = await self.project_repo.download_project_media(project_id, zip_name)
-            return {
-                "job_id": job_id,
-                "success": True,
-                "message": f"Download job created for project media. Job ID: {job_id}"
-            }
-        
-        # File tools
-        elif name == "get_file":
-            file_id = arguments["file_id"]
-            file = await self.project_repo.get_file(file_id)
-            if file:
-                return {"file": file}
-            return {"file": None, "message": "File not found"}
-        
-        # Project collaboration tools
-        elif name == "get_project_members":
-            project_id = arguments["project_id"]
-            members = await self.project_repo.get_project_members(project_id)
-            return {
-                "members": members,
-                "member_count": len(members),
-                "message": f"Retrieved {len(members)} team members"
-            }
+    async def _tool_get_system_status(self, arguments: Dict[str, Any]) -> Any:
+        """Get Cway system connection status."""
+        is_connected, login_info = await asyncio.gather(
+            self.system_repo.validate_connection(),
+            self.system_repo.get_login_info()
+        )
         
-        elif name == "add_project_member":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            role = arguments.get("role", "MEMBER")
-            result = await self.project_repo.add_project_member(project_id, user_id, role)
-            return {
-                "member": result,
-                "success": True,
-                "message": f"User added to project with role: {role}"
-            }
+        return {
+            "connected": is_connected,
+            "status": "online" if is_connected else "offline",
+            "api_url": settings.cway_api_url,
+            "login_info": login_info
+        }
+        
+    async def _tool_analyze_project_velocity(self, arguments: Dict[str, Any]) -> Any:
+        """Analyze velocity trends and patterns for a specific project."""
+        project_id = arguments["project_id"]
+        
+        # The adapter fetches and converts in one lookup, so the project is only requested once
+        adapter = CwayProjectRepositoryAdapter(self.project_repo)
+        domain_project = await adapter.get_project_by_id(project_id)
+        if not domain_project:
+            return {"error": "Project not found"}
+        
+        velocity_analysis = await self.temporal_kpi_calculator.analyze_project_velocity(domain_project)
+        return {
+            "project_velocity_analysis": {
+                "project_id": velocity_analysis.project_id,
+                "project_name": velocity_analysis.project_name,
+                "velocity_trend": velocity_analysis.velocity_trend,
+                "velocity_consistency_score": velocity_analysis.velocity_consistency_score,
+                "daily_velocities": [(day.isoformat(), count) for day, count in _tail(velocity_analysis.daily_velocities, 30)],  # Last 30 days
+                "weekly_velocities": list(_tail(velocity_analysis.weekly_velocities, 12)),  # Last 12 weeks
+                "monthly_velocities": list(_tail(velocity_analysis.monthly_velocities, 6)),  # Last 6 months
+                "activity_sprints": velocity_analysis.activity_sprints,
+                "idle_periods": velocity_analysis.idle_periods,
+                "velocity_forecast_next_week": velocity_analysis.velocity_forecast_next_week,
+                "velocity_forecast_next_month": velocity_analysis.velocity_forecast_next_month
+            }
+        }
+        
+    async def _tool_get_temporal_dashboard(self, arguments: Dict[str, Any]) -> Any:
+        """Get comprehensive temporal KPI dashboard with velocity and stagnation analysis."""
+        analysis_period = arguments.get("analysis_period_days", 90)
+        dashboard = await self._get_temporal_dashboard(analysis_period)
+        team_metrics = dashboard.team_temporal_metrics
+        
+        return {
+            "temporal_kpi_dashboard": {
+                "generated_at": dashboard.generated_at.isoformat(),
+                "analysis_period_days": dashboard.analysis_period_days,
+                "total_projects_analyzed": dashboard.total_projects_analyzed,
+                "total_revisions_in_period": dashboard.total_revisions_in_period,
+                "avg_project_velocity": dashboard.avg_project_velocity,
+                "projects_by_activity_level": {level.value: count for level, count in dashboard.projects_by_activity_level.items()},
+                "projects_by_stagnation_risk": {risk.value: count for risk, count in dashboard.projects_by_stagnation_risk.items()},
+                "team_temporal_metrics": {
+                    "total_active_days": team_metrics.total_active_days,
+                    "peak_activity_day_of_week": team_metrics.peak_activity_day_of_week,
+                    "peak_activity_hour": team_metrics.peak_activity_hour,
+                    "team_velocity_revisions_per_day": team_metrics.team_velocity_revisions_per_day,
+                    "team_velocity_projects_per_month": team_metrics.team_velocity_projects_per_month,
+                    "concurrent_project_activity": team_metrics.concurrent_project_activity
+                },
+                "overall_velocity_trend": dashboard.overall_velocity_trend,
+                "productivity_trend": dashboard.productivity_trend,
+                "most_active_projects": dashboard.most_active_projects,
+                "most_stagnant_projects": dashboard.most_stagnant_projects,
+                "projects_needing_attention": dashboard.projects_needing_attention,
+                "temporal_recommendations": dashboard.temporal_recommendations,
+                "stagnation_alerts_count": len(dashboard.stagnation_alerts)
+            }
+        }
+        
+    async def _tool_get_stagnation_alerts(self, arguments: Dict[str, Any]) -> Any:
+        """Get projects at risk of stagnation with urgency scores and recommendations."""
+        min_urgency = arguments.get("min_urgency_score", 5)
+        dashboard = await self._get_temporal_dashboard()
+        
+        filtered_alerts = [
+            alert for alert in dashboard.stagnation_alerts 
+            if alert.urgency_score >= min_urgency
+        ]
+        
+        return {
+            "stagnation_alerts": [StagnationAlertSummary.from_alert(alert) for alert in filtered_alerts],
+            "total_alerts": len(filtered_alerts),
+            "min_urgency_filter": min_urgency
+        }
+        
+    async def _tool_index_all_content(self, arguments: Dict[str, Any]) -> Any:
+        """Index all documents and site pages to configured targets."""
+        targets = arguments.get("targets")
+        result = await self.indexing_service.index_all_content(targets=targets)
+        return {
+            "indexing_result": {
+                "job_id": result.job_id,
+                "success": result.success,
+                "message": result.message,
+                "documents_indexed": result.documents_indexed,
+                "duration_seconds": result.duration_seconds,
+                "targets_completed": result.targets_completed,
+                "targets_failed": result.targets_failed,
+                "started_at": result.started_at.isoformat(),
+                "completed_at": result.completed_at.isoformat() if result.completed_at else None
+            }
+        }
+        
+    async def _tool_quick_backup(self, arguments: Dict[str, Any]) -> Any:
+        """Quick backup of all content to local files."""
+        result = await self.indexing_service.quick_backup()
+        return {
+            "backup_result": {
+                "job_id": result.job_id,
+                "success": result.success,
+                "message": result.message,
+                "documents_indexed": result.documents_indexed,
+                "duration_seconds": result.duration_seconds,
+                "started_at": result.started_at.isoformat(),
+                "completed_at": result.completed_at.isoformat() if result.completed_at else None
+            }
+        }
+        
+    async def _tool_index_project_content(self, arguments: Dict[str, Any]) -> Any:
+        """Index documents and pages for a specific project."""
+        project_id = arguments["project_id"]
+        targets = arguments.get("targets")
+        result = await self.indexing_service.index_project_documents(project_id, targets=targets)
+        return {
+            "project_indexing_result": {
+                "job_id": result.job_id,
+                "success": result.success,
+                "message": result.message,
+                "documents_indexed": result.documents_indexed,
+                "duration_seconds": result.duration_seconds,
+                "targets_completed": result.targets_completed,
+                "targets_failed": result.targets_failed,
+                "started_at": result.started_at.isoformat(),
+                "completed_at": result.completed_at.isoformat() if result.completed_at else None
+            }
+        }
+        
+    async def _tool_configure_indexing_target(self, arguments: Dict[str, Any]) -> Any:
+        """Add or update an indexing target configuration."""
+        name_arg = arguments["name"]
+        platform = arguments["platform"]
+        description = arguments["description"]
+        config = arguments.get("config")
+        enabled = arguments.get("enabled", True)
+        
+        # Target changes are persisted to the config file; keep that off the event loop
+        if self.indexing_service.has_target(name_arg):
+            success = await asyncio.to_thread(
+                self.indexing_service.update_target,
+                name=name_arg,
+                description=description,
+                config=config,
+                enabled=enabled
+            )
+            action = "updated" if success else "failed to update"
+        else:
+            success = await asyncio.to_thread(
+                self.indexing_service.add_target,
+                name=name_arg,
+                platform=platform,
+                description=description,
+                config=config,
+                enabled=enabled
+            )
+            action = "created" if success else "failed to create"
         
-        elif name == "remove_project_member":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            success = await self.project_repo.remove_project_member(project_id, user_id)
-            return {
+        return {
+            "configuration_result": {
                 "success": success,
-                "message": "User removed from project" if success else "Failed to remove user"
+                "action": action,
+                "target_name": name_arg,
+                "platform": platform
             }
+        }
         
-        elif name == "update_project_member_role":
-            project_id = arguments["project_id"]
-            user_id = arguments["user_id"]
-            role = arguments["role"]
-            result = await self.project_repo.update_project_member_role(project_id, user_id, role)
-            return {
-                "member": result,
-                "success": True,
-                "message": f"User role updated to: {role}"
-            }
+    async def _tool_get_indexing_job_status(self, arguments: Dict[str, Any]) -> Any:
+        """Get status of a specific indexing job."""
+        job_id = arguments["job_id"]
+        status = self.indexing_service.get_job_status(job_id)
         
-        elif name == "get_project_comments":
-            project_id = arguments["project_id"]
-            limit = arguments.get("limit", 50)
-            comments = await self.project_repo.get_project_comments(project_id, limit)
-            return {
-                "comments": comments,
-                "comment_count": len(comments),
-                "message": f"Retrieved {len(comments)} comments"
-            }
+        if status:
+            return {"job_status": status}
+        else:
+            return {"job_status": None, "message": "Job not found"}
+        
+    async def _tool_get_login_info(self, arguments: Dict[str, Any]) -> Any:
+        """Get current user login information."""
+        login_info = await self.system_repo.get_login_info()
+        if login_info:
+            return {"login_info": login_info}
+        return {"login_info": None, "message": "Login info not available"}
+        
+    async def _tool_search_users(self, arguments: Dict[str, Any]) -> Any:
+        """Search for users by username."""
+        query = arguments.get("query")
+        users = await self.user_repo.search_users(query)
+        return {"users": [UserRecord.from_user(u) for u in users]}
+        
+    async def _tool_search_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Search for projects with optional query and limit."""
+        query = arguments.get("query")
+        limit = arguments.get("limit", 10)
+        result = await self.project_repo.search_projects(query, limit)
+        return {
+            "projects": result.get("projects", []),
+            "total_hits": result.get("total_hits", 0)
+        }
+        
+    async def _tool_get_project_by_id(self, arguments: Dict[str, Any]) -> Any:
+        """Get a regular project by ID (not planner project)."""
+        project_id = arguments["project_id"]
+        project = await self.project_repo.get_project_by_id(project_id)
+        if project:
+            return {"project": project}
+        return {"project": None, "message": "Project not found"}
+        
+    async def _tool_create_user(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new user."""
+        email = arguments["email"]
+        username = arguments["username"]
+        first_name = arguments.get("first_name") or arguments.get("firstName")
+        last_name = arguments.get("last_name") or arguments.get("lastName")
+        user = await self.user_repo.create_user(email, username, first_name, last_name)
+        return {
+            "user": UserRecord.from_user(user),
+            "message": "User created successfully"
+        }
+        
+    async def _tool_update_user_name(self, arguments: Dict[str, Any]) -> Any:
+        """Update user's real name."""
+        username = arguments["username"]
+        first_name = arguments.get("first_name") or arguments.get("firstName")
+        last_name = arguments.get("last_name") or arguments.get("lastName")
+        user = await self.user_repo.update_user_name(username, first_name, last_name)
+        if user:
+            return {
+                "user": UserRecord.from_user(user),
+                "message": "User updated successfully"
+            }
+        return {"user": None, "message": "User not found"}
+        
+    async def _tool_prepare_delete_user(self, arguments: Dict[str, Any]) -> Any:
+        """Preview user before deletion."""
+        username = arguments["username"]
+        
+        # Fetch user details for preview
+        user = await self.user_repo.find_user_by_username(username)
+
+        if not user:
+            return {
+                "action": "error",
+                "message": f"User '{username}' not found",
+                "warnings": [f"User '{username}' does not exist"]
+            }
+        
+        is_sso = getattr(user, 'isSSO', False)
+        user_info = {
+            "username": user.username,
+            "name": user.name,
+            "email": user.email,
+            "enabled": user.enabled,
+            "is_sso": is_sso
+        }
+        
+        # Generate warnings
+        warnings = [
+            f"⚠️ DESTRUCTIVE ACTION: Will permanently delete user '{username}'",
+            "🚨 THIS ACTION CANNOT BE UNDONE",
+            f"User email: {user.email}",
+            *_USER_DELETION_CONSEQUENCES
+        ]
+        
+        if is_sso:
+            warnings.append("⚠️ This is an SSO user - deletion may affect external authentication")
+        
+        # Sign the confirmation token and build the preview
+        return self.confirmation_service.generate_preview_with_token(
+            token_action="delete_user",
+            data={"username": username},
+            action="delete",
+            items=[user_info],
+            item_type="user",
+            warnings=warnings
+        )
         
-        elif name == "add_project_comment":
-            project_id = arguments["project_id"]
-            text = arguments["text"]
-            comment = await self.project_repo.add_project_comment(project_id, text)
-            return {
-                "comment": comment,
-                "success": True,
-                "message": "Comment added to project"
-            }
+    async def _tool_confirm_delete_user(self, arguments: Dict[str, Any]) -> Any:
+        """Execute user deletion after confirmation."""
+        confirmation_token = arguments["confirmation_token"]
         
-        elif name == "get_project_attachments":
-            project_id = arguments["project_id"]
-            attachments = await self.project_repo.get_project_attachments(project_id)
+        try:
+            # Validate token and extract data
+            validated = self.confirmation_service.validate_token(confirmation_token, expected_action="delete_user")
+            
+            username = validated["data"]["username"]
+            
+            # Execute the delete operation
+            success = await self.user_repo.delete_user(username)
+            
             return {
-                "attachments": attachments,
-                "attachment_count": len(attachments),
-                "message": f"Retrieved {len(attachments)} attachments"
-            }
+                "success": success,
+                "action": "deleted",
+                "username": username,
+                "message": f"User '{username}' deleted successfully" if success else f"Failed to delete user '{username}'"
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "message": f"Confirmation failed: {str(e)}"
+            }
+        
+    async def _tool_find_users_and_teams(self, arguments: Dict[str, Any]) -> Any:
+        """Search for both users and teams with pagination."""
+        search = arguments.get("search")
+        page = arguments.get("page", 0)
+        size = arguments.get("size", 10)
+        result = await self.user_repo.find_users_and_teams(search, page, size)
+        return {
+            "items": result["items"],
+            "page": result["page"],
+            "total_hits": result["totalHits"],
+            "message": f"Found {result['totalHits']} users and teams"
+        }
+        
+    async def _tool_get_permission_groups(self, arguments: Dict[str, Any]) -> Any:
+        """Get all available permission groups for the current organisation."""
+        groups = await self._shared_result("permission_groups", _REFERENCE_DATA_TTL, self.user_repo.get_permission_groups)
+        count = len(groups)
+        return {
+            "permission_groups": groups,
+            "count": count,
+            "message": f"Retrieved {count} permission groups"
+        }
+        
+    async def _tool_set_user_permissions(self, arguments: Dict[str, Any]) -> Any:
+        """Set permission group for multiple users."""
+        usernames = arguments["usernames"]
+        permission_group_id = arguments["permission_group_id"]
+        if not usernames:
+            return {"success": True, "users_updated": 0, "message": "No users supplied"}
+        success = await self.user_repo.set_user_permissions(usernames, permission_group_id)
+        count = len(usernames)
+        return {
+            "success": success,
+            "users_updated": count if success else 0,
+            "message": f"Updated permissions for {count} users" if success else "Failed to update permissions"
+        }
+        
+    async def _tool_create_project(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new project."""
+        name_val = arguments["name"]
+        description = arguments.get("description")
+        project = await self.project_repo.create_project(name_val, description)
+        return {"project": project, "message": "Project created successfully"}
+        
+    async def _tool_update_project(self, arguments: Dict[str, Any]) -> Any:
+        """Update an existing project."""
+        project_id = arguments["project_id"]
+        name_val = arguments.get("name")
+        description = arguments.get("description")
+        project = await self.project_repo.update_project(project_id, name_val, description)
+        return {"project": project, "message": "Project updated successfully"}
+        
+    async def _collect_project_previews(
+        self,
+        requested_ids: List[str]
+    ) -> Tuple[List[str], List[Dict[str, Any]], List[str]]:
+        """Fetch previews for the requested projects, returning unique IDs, previews and warnings."""
+        # Drop repeated IDs (keeping order) so each project is previewed once
+        project_ids = list(dict.fromkeys(requested_ids))
+        
+        # Fetch project details for preview in a single request
+        found = await self.project_repo.get_projects_by_ids(project_ids)
+        projects = []
+        warnings = []
+        duplicate_count = len(requested_ids) - len(project_ids)
+        if duplicate_count:
+            warnings.append(f"Ignored {duplicate_count} duplicate project id(s)")
+        for pid in project_ids:
+            project = found.get(pid)
+            if project:
+                projects.append(_project_preview(project))
+            else:
+                warnings.append(f"Project {pid} not found")
+        return project_ids, projects, warnings
         
-        elif name == "upload_project_attachment":
-            project_id = arguments["project_id"]
-            file_id = arguments["file_id"]
-            name = arguments["name"]
-            attachment = await self.project_repo.upload_project_attachment(project_id, file_id, name)
-            return {
-                "attachment": attachment,
-                "success": True,
-                "message": f"File '{name}' attached to project"
-            }
+    async def _tool_prepare_close_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Preview projects before closing."""
+        force = arguments.get("force", False)
+        project_ids, projects, warnings = await self._collect_project_previews(arguments["project_ids"])
         
-        # Category, brand, and specification tools
-        elif name == "get_categories":
-            categories = await self.category_repo.get_categories()
+        if not projects:
             return {
-                "categories": categories,
-                "count": len(categories),
-                "message": f"Retrieved {len(categories)} categories"
+                "action": "error",
+                "message": "No valid projects found to close",
+                "warnings": warnings
             }
         
-        elif name == "get_brands":
-            brands = await self.category_repo.get_brands()
-            return {
-                "brands": brands,
-                "count": len(brands),
-                "message": f"Retrieved {len(brands)} brands"
-            }
+        # Generate warnings
+        warnings.append(f"Will close {len(projects)} project(s)")
+        if not force:
+            warnings.append("Artworks must be complete or approved to close")
+        else:
+            warnings.append("⚠️ Force close enabled - will close even with incomplete artworks")
+        warnings.append("This action can be reversed using reopen_projects")
+        
+        # Sign the confirmation token and build the preview
+        return self.confirmation_service.generate_preview_with_token(
+            token_action="close_projects",
+            data={"project_ids": project_ids, "force": force},
+            action="close",
+            items=projects,
+            item_type="projects",
+            warnings=warnings
+        )
         
-        elif name == "get_print_specifications":
-            specs = await self.category_repo.get_print_specifications()
-            return {
-                "specifications": specs,
-                "count": len(specs),
-                "message": f"Retrieved {len(specs)} print specifications"
-            }
+    async def _tool_confirm_close_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Execute project closure after confirmation."""
+        confirmation_token = arguments["confirmation_token"]
         
-        elif name == "create_category":
-            name_arg = arguments["name"]
-            description = arguments.get("description")
-            color = arguments.get("color")
-            category = await self.category_repo.create_category(name_arg, description, color)
+        try:
+            # Validate token and extract data
+            validated = self.confirmation_service.validate_token(confirmation_token, expected_action="close_projects")
+            
+            project_ids = validated["data"]["project_ids"]
+            force = validated["data"]["force"]
+            
+            # Execute the close operation
+            success = await self.project_repo.close_projects(project_ids, force)
+            
+            count = len(project_ids)
             return {
-                "category": category,
-                "success": True,
-                "message": f"Category '{name_arg}' created successfully"
-            }
+                "success": success,
+                "action": "closed",
+                "closed_count": count if success else 0,
+                "project_ids": project_ids,
+                "message": f"Successfully closed {count} project(s)" if success else "Failed to close projects"
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "message": f"Confirmation failed: {str(e)}"
+            }
+        
+    async def _tool_reopen_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Reopen closed projects."""
+        project_ids = arguments["project_ids"]
+        if not project_ids:
+            return {"success": True, "reopened_count": 0, "message": "No projects supplied"}
+        success = await self.project_repo.reopen_projects(project_ids)
+        count = len(project_ids)
+        return {
+            "success": success,
+            "reopened_count": count if success else 0,
+            "message": f"Successfully reopened {count} projects" if success else "Failed to reopen projects"
+        }
+        
+    async def _tool_prepare_delete_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Preview projects before deletion."""
+        force = arguments.get("force", False)
+        project_ids, projects, warnings = await self._collect_project_previews(arguments["project_ids"])
+        
+        if not projects:
+            return {
+                "action": "error",
+                "message": "No valid projects found to delete",
+                "warnings": warnings
+            }
+        
+        # Generate warnings
+        warnings.append(f"⚠️ DESTRUCTIVE ACTION: Will permanently delete {len(projects)} project(s)")
+        warnings.append("🚨 THIS ACTION CANNOT BE UNDONE")
+        if not force:
+            warnings.append("Projects must be empty (no artworks) to delete")
+        else:
+            warnings.append("⚠️ Force delete enabled - will delete even if projects are not empty")
+        warnings.append("All associated artworks and data will be permanently lost")
+        
+        # Sign the confirmation token and build the preview
+        return self.confirmation_service.generate_preview_with_token(
+            token_action="delete_projects",
+            data={"project_ids": project_ids, "force": force},
+            action="delete",
+            items=projects,
+            item_type="projects",
+            warnings=warnings
+        )
         
-        elif name == "create_brand":
-            name_arg = arguments["name"]
-            description = arguments.get("description")
-            brand = await self.category_repo.create_brand(name_arg, description)
-            return {
-                "brand": brand,
-                "success": True,
-                "message": f"Brand '{name_arg}' created successfully"
-            }
+    async def _tool_confirm_delete_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Execute project deletion after confirmation."""
+        confirmation_token = arguments["confirmation_token"]
         
-        elif name == "create_print_specification":
-            name_arg = arguments["name"]
-            width = arguments["width"]
-            height = arguments["height"]
-            unit = arguments.get("unit", "mm")
-            description = arguments.get("description")
-            spec = await self.category_repo.create_print_specification(name_arg, width, height, unit, description)
+        try:
+            # Validate token and extract data
+            validated = self.confirmation_service.validate_token(confirmation_token, expected_action="delete_projects")
+            
+            project_ids = validated["data"]["project_ids"]
+            force = validated["data"]["force"]
+            
+            # Execute the delete operation
+            success = await self.project_repo.delete_projects(project_ids, force)
+            
+            count = len(project_ids)
             return {
-                "specification": spec,
+                "success": success,
+                "action": "deleted",
+                "deleted_count": count if success else 0,
+                "project_ids": project_ids,
+                "message": f"Successfully deleted {count} project(s)" if success else "Failed to delete projects"
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "message": f"Confirmation failed: {str(e)}"
+            }
+        
+    async def _tool_get_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Get a single artwork by ID."""
+        artwork_id = arguments["artwork_id"]
+        artwork = await self.project_repo.get_artwork(artwork_id)
+        if artwork:
+            return {"artwork": artwork}
+        return {"artwork": None, "message": "Artwork not found"}
+        
+    async def _tool_create_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new artwork in a project."""
+        project_id = arguments["project_id"]
+        artwork_name = arguments["name"]
+        description = arguments.get("description")
+        artwork = await self.project_repo.create_artwork(project_id, artwork_name, description)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Artwork created successfully"
+        }
+        
+    async def _tool_approve_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Approve an artwork."""
+        artwork_id = arguments["artwork_id"]
+        artwork = await self.project_repo.approve_artwork(artwork_id)
+        return {
+            "artwork": artwork,
+            "success": artwork is not None,
+            "message": "Artwork approved successfully" if artwork else "Failed to approve artwork"
+        }
+        
+    async def _tool_reject_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Reject an artwork with optional reason."""
+        artwork_id = arguments["artwork_id"]
+        reason = arguments.get("reason")
+        artwork = await self.project_repo.reject_artwork(artwork_id, reason)
+        return {
+            "artwork": artwork,
+            "success": artwork is not None,
+            "message": "Artwork rejected successfully" if artwork else "Failed to reject artwork"
+        }
+        
+    async def _tool_approve_artworks(self, arguments: Dict[str, Any]) -> Any:
+        """Approve several artworks in one project."""
+        artwork_ids = arguments["artwork_ids"]
+        if not artwork_ids:
+            return {"success": True, "approved_count": 0, "message": "No artworks supplied"}
+        success = await self.artwork_repo.approve_artworks(arguments["project_id"], artwork_ids)
+        count = len(artwork_ids)
+        return {
+            "success": success,
+            "approved_count": count if success else 0,
+            "message": f"Approved {count} artworks" if success else "Failed to approve artworks"
+        }
+        
+    async def _tool_reject_artworks(self, arguments: Dict[str, Any]) -> Any:
+        """Reject several artworks in one project."""
+        artwork_ids = arguments["artwork_ids"]
+        if not artwork_ids:
+            return {"success": True, "rejected_count": 0, "message": "No artworks supplied"}
+        success = await self.artwork_repo.reject_artworks(arguments["project_id"], artwork_ids)
+        count = len(artwork_ids)
+        return {
+            "success": success,
+            "rejected_count": count if success else 0,
+            "message": f"Rejected {count} artworks" if success else "Failed to reject artworks"
+        }
+        
+    async def _tool_get_my_artworks(self, arguments: Dict[str, Any]) -> Any:
+        """Get all artworks relevant to the current user (artworks to approve, artworks to upload)."""
+        result = await self.project_repo.get_my_artworks()
+        return {
+            "artworks": result,
+            "message": f"Found {result['total_count']} artworks requiring action"
+        }
+        
+    async def _tool_get_artworks_to_approve(self, arguments: Dict[str, Any]) -> Any:
+        """Get all artworks awaiting approval by the current user."""
+        artworks = await self.project_repo.get_artworks_to_approve()
+        count = len(artworks)
+        return {
+            "artworks": artworks,
+            "count": count,
+            "message": f"Found {count} artworks awaiting approval"
+        }
+        
+    async def _tool_get_artworks_to_upload(self, arguments: Dict[str, Any]) -> Any:
+        """Get all artworks where the current user needs to upload a revision."""
+        artworks = await self.project_repo.get_artworks_to_upload()
+        count = len(artworks)
+        return {
+            "artworks": artworks,
+            "count": count,
+            "message": f"Found {count} artworks requiring upload"
+        }
+        
+    async def _tool_download_artworks(self, arguments: Dict[str, Any]) -> Any:
+        """Create a download job for artwork files (latest revisions)."""
+        artwork_ids = arguments["artwork_ids"]
+        zip_name = arguments.get("zip_name")
+        if not artwork_ids:
+            return {
+                "job_id": None,
+                "artwork_count": 0,
+                "success": False,
+                "message": "No artworks supplied"
+            }
+        job_id = await self.artwork_repo.create_artwork_download_job(artwork_ids, zip_name)
+        count = len(artwork_ids)
+        return {
+            "job_id": job_id,
+            "artwork_count": count,
+            "success": True,
+            "message": f"Download job created for {count} artworks. Job ID: {job_id}"
+        }
+        
+    async def _tool_get_artwork_preview(self, arguments: Dict[str, Any]) -> Any:
+        """Get artwork preview file information including URL for display."""
+        artwork_id = arguments["artwork_id"]
+        preview = await self.project_repo.get_artwork_preview(artwork_id)
+        if preview:
+            return {
+                "preview": preview,
+                "message": "Preview file retrieved successfully"
+            }
+        return {
+            "preview": None,
+            "message": "No preview available for this artwork"
+        }
+        
+    async def _tool_get_artwork_history(self, arguments: Dict[str, Any]) -> Any:
+        """Get artwork revision history and state changes."""
+        artwork_id = arguments["artwork_id"]
+        history = await self.project_repo.get_artwork_history(artwork_id)
+        count = len(history)
+        return {
+            "history": history,
+            "event_count": count,
+            "message": f"Retrieved {count} artwork events"
+        }
+        
+    async def _tool_analyze_artwork_ai(self, arguments: Dict[str, Any]) -> Any:
+        """Trigger AI analysis on an artwork."""
+        artwork_id = arguments["artwork_id"]
+        thread_id = await self.project_repo.analyze_artwork_ai(artwork_id)
+        return {
+            "thread_id": thread_id,
+            "success": True,
+            "message": f"AI analysis started. Thread ID: {thread_id}"
+        }
+        
+    async def _tool_generate_project_summary_ai(self, arguments: Dict[str, Any]) -> Any:
+        """Generate AI summary for a project tailored to specific audience."""
+        project_id = arguments["project_id"]
+        audience = arguments.get("audience", "PROJECT_MANAGER")
+        summary = await self.project_repo.generate_project_summary_ai(project_id, audience)
+        return {
+            "summary": summary,
+            "audience": audience,
+            "success": True,
+            "message": "AI summary generated successfully"
+        }
+        
+    async def _tool_submit_artwork_for_review(self, arguments: Dict[str, Any]) -> Any:
+        """Submit artwork for approval review."""
+        artwork_id = arguments["artwork_id"]
+        artwork = await self.project_repo.submit_artwork_for_review(artwork_id)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Artwork submitted for review"
+        }
+        
+    async def _tool_request_artwork_changes(self, arguments: Dict[str, Any]) -> Any:
+        """Request changes/revisions on an artwork."""
+        artwork_id = arguments["artwork_id"]
+        reason = arguments["reason"]
+        artwork = await self.project_repo.request_artwork_changes(artwork_id, reason)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Changes requested on artwork"
+        }
+        
+    async def _tool_get_artwork_comments(self, arguments: Dict[str, Any]) -> Any:
+        """Get artwork feedback thread."""
+        artwork_id = arguments["artwork_id"]
+        limit = arguments.get("limit", 50)
+        comments = await self.project_repo.get_artwork_comments(artwork_id, limit)
+        count = len(comments)
+        return {
+            "comments": comments,
+            "comment_count": count,
+            "message": f"Retrieved {count} comments"
+        }
+        
+    async def _tool_add_artwork_comment(self, arguments: Dict[str, Any]) -> Any:
+        """Comment on artwork."""
+        artwork_id = arguments["artwork_id"]
+        text = arguments["text"]
+        comment = await self.project_repo.add_artwork_comment(artwork_id, text)
+        return {
+            "comment": comment,
+            "success": True,
+            "message": "Comment added to artwork"
+        }
+        
+    async def _tool_get_artwork_versions(self, arguments: Dict[str, Any]) -> Any:
+        """Get all revisions of artwork."""
+        artwork_id = arguments["artwork_id"]
+        versions = await self.project_repo.get_artwork_versions(artwork_id)
+        count = len(versions)
+        return {
+            "versions": versions,
+            "version_count": count,
+            "message": f"Retrieved {count} versions"
+        }
+        
+    async def _tool_restore_artwork_version(self, arguments: Dict[str, Any]) -> Any:
+        """Rollback to previous version."""
+        artwork_id = arguments["artwork_id"]
+        version_id = arguments["version_id"]
+        artwork = await self.project_repo.restore_artwork_version(artwork_id, version_id)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Artwork rolled back to previous version"
+        }
+        
+    async def _tool_assign_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Assign artwork to a user."""
+        artwork_id = arguments["artwork_id"]
+        user_id = arguments["user_id"]
+        artwork = await self.project_repo.assign_artwork(artwork_id, user_id)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": f"Artwork assigned to user {user_id}"
+        }
+        
+    async def _tool_duplicate_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Duplicate an artwork with optional new name."""
+        artwork_id = arguments["artwork_id"]
+        new_name = arguments.get("new_name")
+        artwork = await self.project_repo.duplicate_artwork(artwork_id, new_name)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": f"Artwork duplicated successfully. New ID: {artwork.get('id')}"
+        }
+        
+    async def _tool_archive_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Archive an artwork."""
+        artwork_id = arguments["artwork_id"]
+        artwork = await self.project_repo.archive_artwork(artwork_id)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Artwork archived successfully"
+        }
+        
+    async def _tool_unarchive_artwork(self, arguments: Dict[str, Any]) -> Any:
+        """Unarchive an artwork."""
+        artwork_id = arguments["artwork_id"]
+        artwork = await self.project_repo.unarchive_artwork(artwork_id)
+        return {
+            "artwork": artwork,
+            "success": True,
+            "message": "Artwork unarchived successfully"
+        }
+        
+    async def _tool_get_team_members(self, arguments: Dict[str, Any]) -> Any:
+        """Get all team members for a project."""
+        project_id = arguments["project_id"]
+        team_members = await self.project_repo.get_team_members(project_id)
+        count = len(team_members)
+        return {
+            "team_members": team_members,
+            "member_count": count,
+            "message": f"Retrieved {count} team members"
+        }
+        
+    async def _tool_add_team_member(self, arguments: Dict[str, Any]) -> Any:
+        """Add a user to project team."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        role = arguments.get("role")
+        team_member = await self.project_repo.add_team_member(project_id, user_id, role)
+        return {
+            "team_member": team_member,
+            "success": True,
+            "message": f"User added to team with role: {team_member.get('role', 'Member')}"
+        }
+        
+    async def _tool_remove_team_member(self, arguments: Dict[str, Any]) -> Any:
+        """Remove a user from project team."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        result = await self.project_repo.remove_team_member(project_id, user_id)
+        return {
+            "success": result.get("success", False),
+            "message": result.get("message", "Team member removed successfully")
+        }
+        
+    async def _tool_update_team_member_role(self, arguments: Dict[str, Any]) -> Any:
+        """Update a team member's role in project."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        role = arguments["role"]
+        team_member = await self.project_repo.update_team_member_role(project_id, user_id, role)
+        return {
+            "team_member": team_member,
+            "success": True,
+            "message": f"Team member role updated to: {role}"
+        }
+        
+    async def _tool_get_user_roles(self, arguments: Dict[str, Any]) -> Any:
+        """Get all available user roles and their permissions."""
+        roles = await self._shared_result("user_roles", _REFERENCE_DATA_TTL, self.project_repo.get_user_roles)
+        count = len(roles)
+        return {
+            "roles": roles,
+            "role_count": count,
+            "message": f"Retrieved {count} user roles"
+        }
+        
+    async def _tool_transfer_project_ownership(self, arguments: Dict[str, Any]) -> Any:
+        """Transfer project ownership to another user."""
+        project_id = arguments["project_id"]
+        new_owner_id = arguments["new_owner_id"]
+        project = await self.project_repo.transfer_project_ownership(project_id, new_owner_id)
+        return {
+            "project": project,
+            "success": True,
+            "message": f"Project ownership transferred to user {new_owner_id}"
+        }
+        
+    async def _tool_search_artworks(self, arguments: Dict[str, Any]) -> Any:
+        """Search artworks with filters and pagination."""
+        query = arguments.get("query")
+        project_id = arguments.get("project_id")
+        status = arguments.get("status")
+        limit = arguments.get("limit", 50)
+        page = arguments.get("page", 0)
+        result = await self.project_repo.search_artworks(query, project_id, status, limit, page)
+        return {
+            "artworks": result.get("artworks", []),
+            "total_hits": result.get("totalHits", 0),
+            "page": result.get("page", 0),
+            "message": f"Found {result.get('totalHits', 0)} artworks matching criteria"
+        }
+        
+    async def _tool_get_project_timeline(self, arguments: Dict[str, Any]) -> Any:
+        """Get chronological event timeline for a project."""
+        project_id = arguments["project_id"]
+        limit = arguments.get("limit", 100)
+        timeline = await self.project_repo.get_project_timeline(project_id, limit)
+        count = len(timeline)
+        return {
+            "timeline": timeline,
+            "event_count": count,
+            "message": f"Retrieved {count} timeline events"
+        }
+        
+    async def _tool_get_user_activity(self, arguments: Dict[str, Any]) -> Any:
+        """Get user activity history."""
+        user_id = arguments["user_id"]
+        days = arguments.get("days", 30)
+        limit = arguments.get("limit", 100)
+        activities = await self.project_repo.get_user_activity(user_id, days, limit)
+        count = len(activities)
+        return {
+            "activities": activities,
+            "activity_count": count,
+            "message": f"Retrieved {count} user activities from last {days} days"
+        }
+        
+    async def _tool_bulk_update_artwork_status(self, arguments: Dict[str, Any]) -> Any:
+        """Batch update status for multiple artworks."""
+        artwork_ids = arguments["artwork_ids"]
+        status = arguments["status"]
+        if not artwork_ids:
+            return {
+                "updated_artworks": [],
+                "success_count": 0,
+                "failed_count": 0,
                 "success": True,
-                "message": f"Print specification '{name_arg}' created successfully"
-            }
-        
-        # Share tools
-        elif name == "find_shares":
-            limit = arguments.get("limit", 50)
-            shares = await self.project_repo.find_shares(limit)
-            return {
-                "shares": shares,
-                "count": len(shares),
-                "message": f"Retrieved {len(shares)} shares"
-            }
-        
-        elif name == "get_share":
-            share_id = arguments["share_id"]
-            share = await self.project_repo.get_share(share_id)
-            if share:
-                return {
-                    "share": share,
-                    "message": "Share retrieved successfully"
-                }
-            return {"share": None, "message": "Share not found"}
-        
-        elif name == "create_share":
-            name_arg = arguments["name"]
-            file_ids = arguments["file_ids"]
-            description = arguments.get("description")
-            expires_at = arguments.get("expires_at")
-            max_downloads = arguments.get("max_downloads")
-            password = arguments.get("password")
-            share = await self.project_repo.create_share(
-                name_arg, file_ids, description, expires_at, max_downloads, password
+                "message": "No artworks supplied"
+            }
+        result = await self.project_repo.bulk_update_artwork_status(artwork_ids, status)
+        return {
+            "updated_artworks": result.get("updatedArtworks", []),
+            "success_count": result.get("successCount", 0),
+            "failed_count": result.get("failedCount", 0),
+            "success": True,
+            "message": f"Updated {result.get('successCount', 0)} artworks to status: {status}"
+        }
+        
+    async def _tool_get_folder_tree(self, arguments: Dict[str, Any]) -> Any:
+        """Get the complete folder tree structure."""
+        folders = await self.project_repo.get_folder_tree()
+        return {"folders": folders}
+        
+    async def _tool_get_folder(self, arguments: Dict[str, Any]) -> Any:
+        """Get a specific folder by ID."""
+        folder_id = arguments["folder_id"]
+        folder = await self.project_repo.get_folder(folder_id)
+        if folder:
+            return {"folder": folder}
+        return {"folder": None, "message": "Folder not found"}
+        
+    async def _tool_get_folder_items(self, arguments: Dict[str, Any]) -> Any:
+        """Get items in a specific folder with pagination."""
+        folder_id = arguments["folder_id"]
+        page = arguments.get("page", 0)
+        size = arguments.get("size", 20)
+        result = await self.project_repo.get_folder_items(folder_id, page, size)
+        return {
+            "items": result.get("items", []),
+            "total_hits": result.get("totalHits", 0),
+            "page": result.get("page", 0)
+        }
+        
+    async def _tool_get_project_status_summary(self, arguments: Dict[str, Any]) -> Any:
+        """Get aggregate project statistics and status distribution across all projects."""
+        summary = await self.project_repo.get_project_status_summary()
+        return {
+            "summary": summary,
+            "message": f"Analyzed {summary['total']} projects"
+        }
+        
+    async def _tool_compare_projects(self, arguments: Dict[str, Any]) -> Any:
+        """Compare multiple projects side-by-side with normalized metrics."""
+        project_ids = arguments["project_ids"]
+        comparison = await self.project_repo.compare_projects(project_ids)
+        count = len(comparison['projects'])
+        return {
+            "comparison": comparison,
+            "project_count": count,
+            "message": f"Compared {count} projects"
+        }
+        
+    async def _tool_get_project_history(self, arguments: Dict[str, Any]) -> Any:
+        """Get detailed event history timeline for a project."""
+        project_id = arguments["project_id"]
+        history = await self.project_repo.get_project_history(project_id)
+        count = len(history)
+        return {
+            "history": history,
+            "event_count": count,
+            "message": f"Retrieved {count} events"
+        }
+        
+    async def _tool_get_monthly_project_trends(self, arguments: Dict[str, Any]) -> Any:
+        """Get month-over-month project statistics and trends."""
+        trends = await self.project_repo.get_monthly_project_trends()
+        count = len(trends)
+        return {
+            "trends": trends,
+            "month_count": count,
+            "message": f"Retrieved {count} months of project data"
+        }
+        
+    async def _tool_search_media_center(self, arguments: Dict[str, Any]) -> Any:
+        """Search media center with full-text search and filters."""
+        query = arguments.get("query")
+        folder_id = arguments.get("folder_id")
+        limit = arguments.get("limit", 50)
+        result = await self.project_repo.search_media_center(query, folder_id, limit=limit)
+        return {
+            "results": result,
+            "message": f"Found {result['total_hits']} items matching search"
+        }
+        
+    async def _tool_get_media_center_stats(self, arguments: Dict[str, Any]) -> Any:
+        """Get media center storage and usage statistics."""
+        stats = await self.project_repo.get_media_center_stats()
+        return {
+            "stats": stats,
+            "message": "Media center statistics retrieved"
+        }
+        
+    async def _tool_download_folder_contents(self, arguments: Dict[str, Any]) -> Any:
+        """Download all files in a folder as a zip archive."""
+        folder_id = arguments["folder_id"]
+        zip_name = arguments.get("zip_name")
+        job_id = await self.project_repo.download_folder_contents(folder_id, zip_name)
+        return {
+            "job_id": job_id,
+            "success": True,
+            "message": f"Download job created for folder. Job ID: {job_id}"
+        }
+        
+    async def _tool_download_project_media(self, arguments: Dict[str, Any]) -> Any:
+        """Download all media files associated with a project."""
+        project_id = arguments["project_id"]
+        zip_name = arguments.get("zip_name")
+        job_id = await self.project_repo.download_project_media(project_id, zip_name)
+        return {
+            "job_id": job_id,
+            "success": True,
+            "message": f"Download job created for project media. Job ID: {job_id}"
+        }
+        
+    async def _tool_get_file(self, arguments: Dict[str, Any]) -> Any:
+        """Get a file by UUID."""
+        file_id = arguments["file_id"]
+        file = await self.project_repo.get_file(file_id)
+        if file:
+            return {"file": file}
+        return {"file": None, "message": "File not found"}
+        
+    async def _tool_get_project_members(self, arguments: Dict[str, Any]) -> Any:
+        """List project team members."""
+        project_id = arguments["project_id"]
+        members = await self.project_repo.get_project_members(project_id)
+        count = len(members)
+        return {
+            "members": members,
+            "member_count": count,
+            "message": f"Retrieved {count} team members"
+        }
+        
+    async def _tool_add_project_member(self, arguments: Dict[str, Any]) -> Any:
+        """Add user to project team."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        role = arguments.get("role", "MEMBER")
+        result = await self.project_repo.add_project_member(project_id, user_id, role)
+        return {
+            "member": result,
+            "success": True,
+            "message": f"User added to project with role: {role}"
+        }
+        
+    async def _tool_remove_project_member(self, arguments: Dict[str, Any]) -> Any:
+        """Remove user from project team."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        success = await self.project_repo.remove_project_member(project_id, user_id)
+        return {
+            "success": success,
+            "message": "User removed from project" if success else "Failed to remove user"
+        }
+        
+    async def _tool_update_project_member_role(self, arguments: Dict[str, Any]) -> Any:
+        """Change member permissions in project."""
+        project_id = arguments["project_id"]
+        user_id = arguments["user_id"]
+        role = arguments["role"]
+        result = await self.project_repo.update_project_member_role(project_id, user_id, role)
+        return {
+            "member": result,
+            "success": True,
+            "message": f"User role updated to: {role}"
+        }
+        
+    async def _tool_get_project_comments(self, arguments: Dict[str, Any]) -> Any:
+        """Get project discussions and comments."""
+        project_id = arguments["project_id"]
+        limit = arguments.get("limit", 50)
+        comments = await self.project_repo.get_project_comments(project_id, limit)
+        count = len(comments)
+        return {
+            "comments": comments,
+            "comment_count": count,
+            "message": f"Retrieved {count} comments"
+        }
+        
+    async def _tool_add_project_comment(self, arguments: Dict[str, Any]) -> Any:
+        """Post comment to project."""
+        project_id = arguments["project_id"]
+        text = arguments["text"]
+        comment = await self.project_repo.add_project_comment(project_id, text)
+        return {
+            "comment": comment,
+            "success": True,
+            "message": "Comment added to project"
+        }
+        
+    async def _tool_get_project_attachments(self, arguments: Dict[str, Any]) -> Any:
+        """List project file attachments."""
+        project_id = arguments["project_id"]
+        attachments = await self.project_repo.get_project_attachments(project_id)
+        count = len(attachments)
+        return {
+            "attachments": attachments,
+            "attachment_count": count,
+            "message": f"Retrieved {count} attachments"
+        }
+        
+    async def _tool_upload_project_attachment(self, arguments: Dict[str, Any]) -> Any:
+        """Attach file to project."""
+        project_id = arguments["project_id"]
+        file_id = arguments["file_id"]
+        name = arguments["name"]
+        attachment = await self.project_repo.upload_project_attachment(project_id, file_id, name)
+        return {
+            "attachment": attachment,
+            "success": True,
+            "message": f"File '{name}' attached to project"
+        }
+        
+    async def _get_taxonomy(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get categories, brands and print specifications, fetched together and briefly reused."""
+        return await self._shared_result("taxonomy", _REFERENCE_DATA_TTL, self.category_repo.get_taxonomy)
+        
+    async def _tool_get_taxonomy(self, arguments: Dict[str, Any]) -> Any:
+        """Get all categories, brands and print specifications in one call."""
+        taxonomy = await self._get_taxonomy()
+        return {
+            "categories": taxonomy["categories"],
+            "brands": taxonomy["brands"],
+            "specifications": taxonomy["specifications"],
+            "message": (
+                f"Retrieved {len(taxonomy['categories'])} categories, {len(taxonomy['brands'])} brands "
+                f"and {len(taxonomy['specifications'])} print specifications"
             )
+        }
+        
+    async def _tool_get_categories(self, arguments: Dict[str, Any]) -> Any:
+        """Get all artwork categories."""
+        categories = (await self._get_taxonomy())["categories"]
+        count = len(categories)
+        return {
+            "categories": categories,
+            "count": count,
+            "message": f"Retrieved {count} categories"
+        }
+        
+    async def _tool_get_brands(self, arguments: Dict[str, Any]) -> Any:
+        """Get all brands."""
+        brands = (await self._get_taxonomy())["brands"]
+        count = len(brands)
+        return {
+            "brands": brands,
+            "count": count,
+            "message": f"Retrieved {count} brands"
+        }
+        
+    async def _tool_get_print_specifications(self, arguments: Dict[str, Any]) -> Any:
+        """Get all print specifications."""
+        specs = (await self._get_taxonomy())["specifications"]
+        count = len(specs)
+        return {
+            "specifications": specs,
+            "count": count,
+            "message": f"Retrieved {count} print specifications"
+        }
+        
+    async def _tool_create_category(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new category."""
+        name_arg = arguments["name"]
+        description = arguments.get("description")
+        color = arguments.get("color")
+        category = await self.category_repo.create_category(name_arg, description, color)
+        return {
+            "category": category,
+            "success": True,
+            "message": f"Category '{name_arg}' created successfully"
+        }
+        
+    async def _tool_create_brand(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new brand."""
+        name_arg = arguments["name"]
+        description = arguments.get("description")
+        brand = await self.category_repo.create_brand(name_arg, description)
+        return {
+            "brand": brand,
+            "success": True,
+            "message": f"Brand '{name_arg}' created successfully"
+        }
+        
+    async def _tool_create_print_specification(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new print specification."""
+        name_arg = arguments["name"]
+        width = arguments["width"]
+        height = arguments["height"]
+        unit = arguments.get("unit", "mm")
+        description = arguments.get("description")
+        spec = await self.category_repo.create_print_specification(name_arg, width, height, unit, description)
+        return {
+            "specification": spec,
+            "success": True,
+            "message": f"Print specification '{name_arg}' created successfully"
+        }
+        
+    async def _tool_find_shares(self, arguments: Dict[str, Any]) -> Any:
+        """Find all file shares."""
+        limit = arguments.get("limit", 50)
+        shares = await self.project_repo.find_shares(limit)
+        count = len(shares)
+        return {
+            "shares": shares,
+            "count": count,
+            "message": f"Retrieved {count} shares"
+        }
+        
+    async def _tool_get_share(self, arguments: Dict[str, Any]) -> Any:
+        """Get a specific share by ID."""
+        share_id = arguments["share_id"]
+        share = await self.project_repo.get_share(share_id)
+        if share:
             return {
                 "share": share,
-                "success": True,
-                "message": f"Share '{name_arg}' created with {len(file_ids)} files"
-            }
-        
-        elif name == "delete_share":
-            share_id = arguments["share_id"]
-            success = await self.project_repo.delete_share(share_id)
-            return {
-                "success": success,
-                "message": "Share deleted successfully" if success else "Failed to delete share"
-            }
-        
-        # Media management tools
-        elif name == "create_folder":
-            name_arg = arguments["name"]
-            parent_folder_id = arguments.get("parent_folder_id")
-            description = arguments.get("description")
-            folder = await self.project_repo.create_folder(name_arg, parent_folder_id, description)
-            return {
-                "folder": folder,
-                "success": True,
-                "message": f"Folder '{name_arg}' created successfully"
-            }
-        
-        elif name == "rename_file":
-            file_id = arguments["file_id"]
-            new_name = arguments["new_name"]
-            file = await self.project_repo.rename_file(file_id, new_name)
-            return {
-                "file": file,
-                "success": True,
-                "message": f"File renamed to '{new_name}'"
-            }
-        
-        elif name == "rename_folder":
-            folder_id = arguments["folder_id"]
-            new_name = arguments["new_name"]
-            folder = await self.project_repo.rename_folder(folder_id, new_name)
-            return {
-                "folder": folder,
-                "success": True,
-                "message": f"Folder renamed to '{new_name}'"
-            }
-        
-        elif name == "move_files":
-            file_ids = arguments["file_ids"]
-            target_folder_id = arguments["target_folder_id"]
-            result = await self.project_repo.move_files(file_ids, target_folder_id)
-            return {
-                "success": result.get("success", False),
-                "moved_count": result.get("movedCount", 0),
-                "message": f"Moved {result.get('movedCount', 0)} files" if result.get("success") else "Failed to move files"
-            }
-        
-        elif name == "delete_file":
-            file_id = arguments["file_id"]
-            success = await self.project_repo.delete_file(file_id)
-            return {
-                "success": success,
-                "message": "File deleted successfully" if success else "Failed to delete file"
-            }
+                "message": "Share retrieved successfully"
+            }
+        return {"share": None, "message": "Share not found"}
+        
+    async def _tool_create_share(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new file share."""
+        name_arg = arguments["name"]
+        file_ids = arguments["file_ids"]
+        description = arguments.get("description")
+        expires_at = arguments.get("expires_at")
+        max_downloads = arguments.get("max_downloads")
+        password = arguments.get("password")
+        share = await self.project_repo.create_share(
+            name_arg, file_ids, description, expires_at, max_downloads, password
+        )
+        return {
+            "share": share,
+            "success": True,
+            "message": f"Share '{name_arg}' created with {len(file_ids)} files"
+        }
+        
+    async def _tool_delete_share(self, arguments: Dict[str, Any]) -> Any:
+        """Delete a share."""
+        share_id = arguments["share_id"]
+        success = await self.project_repo.delete_share(share_id)
+        return {
+            "success": success,
+            "message": "Share deleted successfully" if success else "Failed to delete share"
+        }
+        
+    async def _tool_create_folder(self, arguments: Dict[str, Any]) -> Any:
+        """Create a new folder in media center."""
+        name_arg = arguments["name"]
+        parent_folder_id = arguments.get("parent_folder_id")
+        description = arguments.get("description")
+        folder = await self.project_repo.create_folder(name_arg, parent_folder_id, description)
+        return {
+            "folder": folder,
+            "success": True,
+            "message": f"Folder '{name_arg}' created successfully"
+        }
+        
+    async def _tool_rename_file(self, arguments: Dict[str, Any]) -> Any:
+        """Rename a file in media center."""
+        file_id = arguments["file_id"]
+        new_name = arguments["new_name"]
+        file = await self.project_repo.rename_file(file_id, new_name)
+        return {
+            "file": file,
+            "success": True,
+            "message": f"File renamed to '{new_name}'"
+        }
+        
+    async def _tool_rename_folder(self, arguments: Dict[str, Any]) -> Any:
+        """Rename a folder in media center."""
+        folder_id = arguments["folder_id"]
+        new_name = arguments["new_name"]
+        folder = await self.project_repo.rename_folder(folder_id, new_name)
+        return {
+            "folder": folder,
+            "success": True,
+            "message": f"Folder renamed to '{new_name}'"
+        }
+        
+    async def _tool_move_files(self, arguments: Dict[str, Any]) -> Any:
+        """Move files to a different folder."""
+        file_ids = arguments["file_ids"]
+        target_folder_id = arguments["target_folder_id"]
+        result = await self.project_repo.move_files(file_ids, target_folder_id)
+        return {
+            "success": result.get("success", False),
+            "moved_count": result.get("movedCount", 0),
+            "message": f"Moved {result.get('movedCount', 0)} files" if result.get("success") else "Failed to move files"
+        }
+        
+    async def _tool_delete_file(self, arguments: Dict[str, Any]) -> Any:
+        """Delete a file from media center."""
+        file_id = arguments["file_id"]
+        success = await self.project_repo.delete_file(file_id)
+        return {
+            "success": success,
+            "message": "File deleted successfully" if success else "Failed to delete file"
+        }
+        
+    async def _tool_delete_folder(self, arguments: Dict[str, Any]) -> Any:
+        """Delete a folder from media center."""
+        folder_id = arguments["folder_id"]
+        force = arguments.get("force", False)
+        success = await self.project_repo.delete_folder(folder_id, force)
+        return {
+            "success": success,
+            "message": "Folder deleted successfully" if success else "Failed to delete folder"
+        }
         
-        elif name == "delete_folder":
-            folder_id = arguments["folder_id"]
-            force = arguments.get("force", False)
-            success = await self.project_repo.delete_folder(folder_id, force)
-            return {
-                "success": success,
-                "message": "Folder deleted successfully" if success else "Failed to delete folder"
-            }
-            
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-            
     async def run_stdio(self) -> None:
         """Run the MCP server with stdio transport."""
         from mcp.server.stdio import stdio_server
@@ -2012,8 +2441,8 @@ class CwayMCPServer:
         
         try:
             await self._ensure_initialized()
-            logger.info(f"Server initialized and ready")
-            logger.info(f"Connected to Cway API at {settings.cway_api_url}")
+            logger.info("Server initialized and ready")
+            logger.info("Connected to Cway API at %s", settings.cway_api_url)
             
             # Run the MCP server with stdio transport
             async with stdio_server() as (read_stream, write_stream):
@@ -2024,7 +2453,7 @@ class CwayMCPServer:
                 )
                 
         except Exception as e:
-            logger.error(f"Server error: {e}")
+            logger.error("Server error: %s", e)
             raise
         finally:
             await self._cleanup()
@@ -2034,10 +2463,26 @@ class CwayMCPServer:
         if self.graphql_client:
             await self.graphql_client.disconnect()
             logger.info("GraphQL client disconnected")
+        self._initialized = False
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for the event loop when enabled and installed."""
+    if not settings.use_uvloop or sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available, using default event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop enabled")
 
 
 def main() -> None:
     """Main entry point for stdio mode."""
+    setup_stdio_logging()
+    _install_uvloop()
     server = CwayMCPServer()
     asyncio.run(server.run_stdio())
 
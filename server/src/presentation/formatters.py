@@ -13,18 +13,13 @@ class ResourceFormatter:
         if not projects:
             return "No projects found."
         
-        content_parts = []
-        for project in projects:
-            status_display = project.status.value if isinstance(project.status, ProjectState) else project.status
-            part = (
-                f"Project: {project.name} (ID: {project.id})\n"
-                f"  Status: {status_display}\n"
-                f"  Description: {project.description or 'N/A'}\n"
-                f"  Created: {project.created_at}\n"
-            )
-            content_parts.append(part)
-        
-        return "\n".join(content_parts)
+        return "\n".join([
+            f"Project: {project.name} (ID: {project.id})\n"
+            f"  Status: {project.status.value if isinstance(project.status, ProjectState) else project.status}\n"
+            f"  Description: {project.description or 'N/A'}\n"
+            f"  Created: {project.created_at}\n"
+            for project in projects
+        ])
     
     @staticmethod
     def format_users(users: List[User]) -> str:
@@ -32,17 +27,13 @@ class ResourceFormatter:
         if not users:
             return "No users found."
         
-        content_parts = []
-        for user in users:
-            part = (
-                f"User: {user.name or user.email} (ID: {user.id})\n"
-                f"  Email: {user.email}\n"
-                f"  Role: {user.role}\n"
-                f"  Created: {user.created_at}\n"
-            )
-            content_parts.append(part)
-        
-        return "\n".join(content_parts)
+        return "\n".join([
+            f"User: {user.name or user.email} (ID: {user.id})\n"
+            f"  Email: {user.email}\n"
+            f"  Role: {user.role}\n"
+            f"  Created: {user.created_at}\n"
+            for user in users
+        ])
     
     @staticmethod
     def format_schema(schema: str) -> str:
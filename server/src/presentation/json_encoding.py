@@ -0,0 +1,69 @@
+"""JSON encoding shared by the MCP servers, using orjson when it is installed."""
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from .tool_responses import ToolResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "perf" extra
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode slotted tool payloads as objects, enums by value and anything else as a string."""
+    if isinstance(obj, ToolResponse):
+        return obj.to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _json_default_iso(obj: Any) -> Any:
+    """Like ``_json_default``, but write datetimes in ISO 8601 form as orjson does natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return _json_default(obj)
+
+
+class JsonEncoder:
+    """Reusable JSON encoder that gives the same output with or without orjson."""
+
+    def __init__(self, pretty: bool = False, iso_datetimes: bool = False) -> None:
+        """
+        Initialize the encoder.
+
+        Args:
+            pretty: Indent output by two spaces instead of writing compact JSON
+            iso_datetimes: Write datetimes with ``isoformat()`` instead of ``str()``
+        """
+        self._default = _json_default_iso if iso_datetimes else _json_default
+        self._encoder = json.JSONEncoder(
+            indent=2 if pretty else None,
+            separators=None if pretty else (",", ":"),
+            ensure_ascii=False,
+            default=self._default
+        )
+        # Dataclasses (and datetimes unless ISO output is wanted) go through the default hook
+        # so orjson matches the stdlib output
+        self._orjson_options = (
+            orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+            | (0 if iso_datetimes else orjson.OPT_PASSTHROUGH_DATETIME)
+            | (orjson.OPT_INDENT_2 if pretty else 0)
+        ) if orjson is not None else 0
+
+    def encode(self, obj: Any) -> str:
+        """Encode an object as JSON."""
+        if orjson is not None:
+            return orjson.dumps(obj, default=self._default, option=self._orjson_options).decode()
+        return self._encoder.encode(obj)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Encode an object as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -462,6 +462,13 @@ def get_user_tools() -> List[Tool]:
                         "type": "integer",
                         "description": "Page size",
                         "default": 10
+                    },
+                    "pages": {
+                        "type": "integer",
+                        "description": "Number of consecutive pages to fetch concurrently, starting at page",
+                        "default": 1,
+                        "minimum": 1,
+                        "maximum": 20
                     }
                 },
                 "required": []
@@ -683,6 +690,44 @@ def get_artwork_tools() -> List[Tool]:
                 "required": ["artwork_id"]
             }
         ),
+        Tool(
+            name="approve_artworks",
+            description="Approve several artworks in one project with a single request",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The UUID of the project the artworks belong to"
+                    },
+                    "artwork_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of artwork UUIDs to approve"
+                    }
+                },
+                "required": ["project_id", "artwork_ids"]
+            }
+        ),
+        Tool(
+            name="reject_artworks",
+            description="Reject several artworks in one project with a single request",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The UUID of the project the artworks belong to"
+                    },
+                    "artwork_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of artwork UUIDs to reject"
+                    }
+                },
+                "required": ["project_id", "artwork_ids"]
+            }
+        ),
         Tool(
             name="get_my_artworks",
             description="Get all artworks relevant to the current user (artworks to approve, artworks to upload)",
@@ -1187,6 +1232,15 @@ def get_share_tools() -> List[Tool]:
 def get_category_tools() -> List[Tool]:
     """Get all category, brand, and specification tool definitions."""
     return [
+        Tool(
+            name="get_taxonomy",
+            description="Get all artwork categories, brands and print specifications in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
         Tool(
             name="get_categories",
             description="Get all artwork categories",
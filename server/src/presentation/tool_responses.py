@@ -0,0 +1,256 @@
+"""Fixed-shape response payloads for MCP tool handlers.
+
+List-style tools return hundreds of entities that always share the same keys.
+Storing them in ``__slots__`` instead of a per-instance dict keeps large pages
+compact; the JSON encoder in the server converts them with ``to_dict()``.
+
+Because the field set of each payload is fixed, ``to_dict()`` is generated per
+class as a single dict literal (the same technique ``dataclasses`` uses for
+``__init__``) rather than looping over the slots for every entity.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..domain.cway_entities import CwayUser, PlannerProject
+from ..domain.temporal_kpi_entities import StagnationAlert
+
+
+def _build_to_dict(fields: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a straight-line ``to_dict`` for a fixed set of slot names."""
+    items = ", ".join(f"{name!r}: self.{name}" for name in fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    return namespace["to_dict"]
+
+
+class ToolResponse:
+    """Base class for slotted tool payloads with read-only mapping access."""
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate a specialized ``to_dict`` for each payload class that does not define one."""
+        super().__init_subclass__(**kwargs)
+        if "__slots__" in cls.__dict__ and "to_dict" not in cls.__dict__:
+            to_dict = _build_to_dict(cls.__slots__)
+            to_dict.__doc__ = ToolResponse.to_dict.__doc__
+            to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+            cls.to_dict = to_dict
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow ``payload["field"]`` access like the dicts these replace."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a field exists on the payload."""
+        return key in self.__slots__
+
+    def keys(self) -> tuple:
+        """Get the payload field names in serialization order."""
+        return self.__slots__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the payload to a plain dict for JSON encoding."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+@dataclass
+class UserSummary(ToolResponse):
+    """Compact user payload used by lookup and paginated user tools."""
+
+    __slots__ = ("id", "name", "fullName", "email", "username", "enabled")
+
+    id: str
+    name: str
+    fullName: str
+    email: str
+    username: str
+    enabled: bool
+
+    @classmethod
+    def from_user(cls, user: CwayUser) -> "UserSummary":
+        """Build the payload from a Cway user entity."""
+        return cls(user.id, user.name, user.full_name, user.email, user.username, user.enabled)
+
+
+@dataclass
+class UserProfile(ToolResponse):
+    """User payload returned by ``list_users``."""
+
+    __slots__ = (
+        "id", "name", "fullName", "email", "username",
+        "firstName", "lastName", "enabled", "avatar", "isSSO",
+    )
+
+    id: str
+    name: str
+    fullName: str
+    email: str
+    username: str
+    firstName: str
+    lastName: str
+    enabled: bool
+    avatar: bool
+    isSSO: bool
+
+    @classmethod
+    def from_user(cls, user: CwayUser) -> "UserProfile":
+        """Build the payload from a Cway user entity."""
+        return cls(
+            user.id, user.name, user.full_name, user.email, user.username,
+            user.firstName, user.lastName, user.enabled, user.avatar, user.isSSO,
+        )
+
+
+@dataclass
+class UserDetail(ToolResponse):
+    """Full user payload returned by ``get_user``."""
+
+    __slots__ = (
+        "id", "name", "fullName", "email", "username", "firstName", "lastName",
+        "enabled", "avatar", "isSSO", "acceptedTerms", "earlyAccessProgram",
+    )
+
+    id: str
+    name: str
+    fullName: str
+    email: str
+    username: str
+    firstName: str
+    lastName: str
+    enabled: bool
+    avatar: bool
+    isSSO: bool
+    acceptedTerms: bool
+    earlyAccessProgram: bool
+
+    @classmethod
+    def from_user(cls, user: CwayUser) -> "UserDetail":
+        """Build the payload from a Cway user entity."""
+        return cls(
+            user.id, user.name, user.full_name, user.email, user.username,
+            user.firstName, user.lastName, user.enabled, user.avatar, user.isSSO,
+            user.acceptedTerms, user.earlyAccessProgram,
+        )
+
+
+@dataclass
+class UserRecord(ToolResponse):
+    """User payload returned by ``search_users`` and the user write tools."""
+
+    __slots__ = ("id", "name", "username", "email", "firstName", "lastName", "enabled")
+
+    id: str
+    name: str
+    username: str
+    email: str
+    firstName: str
+    lastName: str
+    enabled: bool
+
+    @classmethod
+    def from_user(cls, user: CwayUser) -> "UserRecord":
+        """Build the payload from a Cway user entity."""
+        return cls(
+            user.id, user.name, user.username, user.email,
+            user.firstName, user.lastName, user.enabled,
+        )
+
+
+@dataclass
+class ProjectListing(ToolResponse):
+    """Planner project payload returned by state-filtered project lists."""
+
+    __slots__ = ("id", "name", "state", "percentageDone", "startDate", "endDate")
+
+    id: str
+    name: str
+    state: str
+    percentageDone: float
+    startDate: Optional[str]
+    endDate: Optional[str]
+
+    @classmethod
+    def from_project(cls, project: PlannerProject) -> "ProjectListing":
+        """Build the payload from a planner project entity."""
+        return cls(
+            project.id,
+            project.name,
+            project.state.value,
+            project.percentageDone,
+            str(project.startDate) if project.startDate else None,
+            str(project.endDate) if project.endDate else None,
+        )
+
+
+@dataclass
+class ProjectSummary(ToolResponse):
+    """Planner project payload returned by ``list_projects`` and ``get_project``."""
+
+    __slots__ = (
+        "id", "name", "state", "percentageDone",
+        "startDate", "endDate", "isActive", "isCompleted",
+    )
+
+    id: str
+    name: str
+    state: str
+    percentageDone: float
+    startDate: Optional[str]
+    endDate: Optional[str]
+    isActive: bool
+    isCompleted: bool
+
+    @classmethod
+    def from_project(cls, project: PlannerProject) -> "ProjectSummary":
+        """Build the payload from a planner project entity."""
+        return cls(
+            project.id,
+            project.name,
+            project.state.value,
+            project.percentageDone,
+            str(project.startDate) if project.startDate else None,
+            str(project.endDate) if project.endDate else None,
+            project.is_active,
+            project.is_completed,
+        )
+
+
+@dataclass
+class StagnationAlertSummary(ToolResponse):
+    """Stagnation alert payload returned by ``get_stagnation_alerts``."""
+
+    __slots__ = (
+        "project_id", "project_name", "risk_level", "days_since_activity",
+        "last_activity_date", "previous_activity_level", "expected_activity_level",
+        "urgency_score", "recommended_actions",
+    )
+
+    project_id: str
+    project_name: str
+    risk_level: str
+    days_since_activity: int
+    last_activity_date: Optional[str]
+    previous_activity_level: str
+    expected_activity_level: str
+    urgency_score: int
+    recommended_actions: List[str]
+
+    @classmethod
+    def from_alert(cls, alert: StagnationAlert) -> "StagnationAlertSummary":
+        """Build the payload from a stagnation alert entity."""
+        last_activity = alert.last_activity_date
+        return cls(
+            alert.project_id,
+            alert.project_name,
+            alert.risk_level.value,
+            alert.days_since_activity,
+            last_activity.isoformat() if last_activity else None,
+            alert.previous_activity_level.value,
+            alert.expected_activity_level.value,
+            alert.urgency_score,
+            alert.recommended_actions,
+        )
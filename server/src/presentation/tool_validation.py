@@ -0,0 +1,54 @@
+"""Precompiled argument validation for MCP tool calls.
+
+Each tool's ``inputSchema`` is checked and compiled into a validator once at
+startup. ``call_tool`` validates incoming arguments against it and fills in
+schema defaults, so handlers receive complete input and bad calls fail before
+they reach the repository layer.
+"""
+
+from typing import Any, Dict, Iterable
+
+from jsonschema import validators
+from jsonschema.exceptions import best_match
+from mcp.types import Tool
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema."""
+
+
+class ToolArgumentValidator:
+    """Compiled validator for a single tool's input schema."""
+
+    __slots__ = ("tool_name", "_validator", "_defaults")
+
+    def __init__(self, tool_name: str, schema: Dict[str, Any]):
+        validator_class = validators.validator_for(schema)
+        validator_class.check_schema(schema)
+
+        self.tool_name = tool_name
+        self._validator = validator_class(schema)
+        self._defaults = {
+            key: spec["default"]
+            for key, spec in schema.get("properties", {}).items()
+            if "default" in spec
+        }
+
+    def __call__(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate arguments and return them with schema defaults applied."""
+        error = best_match(self._validator.iter_errors(arguments))
+        if error is not None:
+            location = ".".join(str(part) for part in error.absolute_path)
+            prefix = f"{location}: " if location else ""
+            raise ToolArgumentError(
+                f"Invalid arguments for {self.tool_name}: {prefix}{error.message}"
+            )
+
+        if not self._defaults:
+            return arguments
+        return {**self._defaults, **arguments}
+
+
+def build_validators(tools: Iterable[Tool]) -> Dict[str, ToolArgumentValidator]:
+    """Compile a validator for every tool, keyed by tool name."""
+    return {tool.name: ToolArgumentValidator(tool.name, tool.inputSchema) for tool in tools}
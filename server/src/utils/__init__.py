@@ -1,11 +1,19 @@
 """Utility modules for the Cway MCP server."""
 
-from .logging_config import initialize_logging, get_request_filter, log_api_call, log_performance, log_request_flow
+from .logging_config import (
+    initialize_logging,
+    get_request_filter,
+    log_api_call,
+    log_performance,
+    log_request_flow,
+    setup_stdio_logging,
+)
 
 __all__ = [
     "initialize_logging",
     "get_request_filter", 
     "log_api_call",
     "log_performance",
-    "log_request_flow"
+    "log_request_flow",
+    "setup_stdio_logging"
 ]
\ No newline at end of file
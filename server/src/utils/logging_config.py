@@ -1,7 +1,9 @@
 """Comprehensive logging configuration for the Cway MCP server."""
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -157,6 +159,39 @@ def setup_logging() -> RequestTrackingFilter:
     return request_filter
 
 
+def setup_stdio_logging(log_file_name: str = "mcp_server.log") -> None:
+    """
+    Send logs to a file and stderr, keeping stdout free for the MCP stdio protocol.
+    
+    Handlers run on a listener thread so file writes never block the event loop.
+    Does nothing if the entry point has already configured the root logger.
+    
+    Args:
+        log_file_name: Name of the log file inside ``settings.log_dir``
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    log_dir = Path(settings.log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Records are formatted by the QueueHandler, so the sink handlers only emit the message
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler(log_dir / log_file_name, delay=True),
+        logging.StreamHandler(sys.stderr)  # Log to stderr, not stdout
+    )
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def log_api_call(operation: str, query: str, variables: dict = None, response_size: int = 0, duration_ms: float = 0) -> None:
     """Log API call details."""
     api_logger = logging.getLogger("cway.api")
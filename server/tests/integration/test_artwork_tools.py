@@ -3,6 +3,7 @@ Integration tests for artwork MCP tools following TDD approach.
 """
 import pytest
 from unittest.mock import AsyncMock
+from src.infrastructure.repositories.artwork_repository import ArtworkRepository
 from src.presentation.cway_mcp_server import CwayMCPServer
 
 
@@ -21,6 +22,7 @@ async def mcp_server(mock_graphql_client):
     server = CwayMCPServer()
     # Mock repositories
     server.project_repo = AsyncMock()
+    server.artwork_repo = AsyncMock(spec=ArtworkRepository)
     server.user_repo = AsyncMock()
     server.system_repo = AsyncMock()
     server.indexing_service = AsyncMock()
@@ -169,6 +171,58 @@ class TestApproveArtwork:
         assert result["success"] is False
 
 
+class TestBulkArtworkReview:
+    """Test approve_artworks and reject_artworks tools."""
+    
+    @pytest.mark.asyncio
+    async def test_approve_artworks(self, mcp_server, mock_graphql_client):
+        """Test approving several artworks with one repository call."""
+        # Arrange
+        artwork_ids = ["artwork-1", "artwork-2"]
+        mcp_server.artwork_repo.approve_artworks.return_value = True
+        
+        # Act
+        result = await mcp_server._execute_tool("approve_artworks", {
+            "project_id": "project-1",
+            "artwork_ids": artwork_ids
+        })
+        
+        # Assert
+        assert result["success"] is True
+        assert result["approved_count"] == 2
+        mcp_server.artwork_repo.approve_artworks.assert_called_once_with("project-1", artwork_ids)
+        
+    @pytest.mark.asyncio
+    async def test_reject_artworks_failure(self, mcp_server, mock_graphql_client):
+        """Test a failed bulk rejection."""
+        # Arrange
+        mcp_server.artwork_repo.reject_artworks.return_value = False
+        
+        # Act
+        result = await mcp_server._execute_tool("reject_artworks", {
+            "project_id": "project-1",
+            "artwork_ids": ["artwork-1"]
+        })
+        
+        # Assert
+        assert result["success"] is False
+        assert result["rejected_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_approve_artworks_empty_skips_api(self, mcp_server, mock_graphql_client):
+        """Test that an empty artwork list returns without calling the API."""
+        # Act
+        result = await mcp_server._execute_tool("approve_artworks", {
+            "project_id": "project-1",
+            "artwork_ids": []
+        })
+
+        # Assert
+        assert result["success"] is True
+        assert result["approved_count"] == 0
+        mcp_server.artwork_repo.approve_artworks.assert_not_called()
+
+
 class TestRejectArtwork:
     """Test reject_artwork tool."""
     
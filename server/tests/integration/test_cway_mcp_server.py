@@ -1,6 +1,8 @@
 """Integration tests for the actual Cway MCP server."""
 
+import asyncio
 import json
+import time
 from datetime import datetime, date
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Any, Dict
@@ -106,6 +108,41 @@ class TestCwayMCPServerInitialization:
         mock_client.assert_called_once()
         mock_client_instance.connect.assert_called_once()
 
+    @patch('src.presentation.cway_mcp_server.CwayGraphQLClient')
+    async def test_ensure_initialized_concurrent_first_calls(self, mock_client: MagicMock) -> None:
+        """Test that concurrent first calls initialize only once."""
+        async def connect() -> None:
+            await asyncio.sleep(0)
+
+        mock_client_instance = AsyncMock()
+        mock_client_instance.connect.side_effect = connect
+        mock_client.return_value = mock_client_instance
+
+        server = CwayMCPServer()
+
+        await asyncio.gather(*(server._ensure_initialized() for _ in range(5)))
+
+        mock_client.assert_called_once()
+        assert server._initialized is True
+
+    @patch('src.presentation.cway_mcp_server.get_indexing_service')
+    def test_indexing_service_is_lazy(self, mock_get_service: MagicMock) -> None:
+        """Test that the indexing service loads on first access only."""
+        server = CwayMCPServer()
+        mock_get_service.assert_not_called()
+
+        assert server.indexing_service is server.indexing_service
+        mock_get_service.assert_called_once()
+
+    @patch('src.presentation.cway_mcp_server.ConfirmationService')
+    def test_confirmation_service_is_lazy(self, mock_service_class: MagicMock) -> None:
+        """Test that the confirmation service is created on first access only."""
+        server = CwayMCPServer()
+        mock_service_class.assert_not_called()
+
+        assert server.confirmation_service is server.confirmation_service
+        mock_service_class.assert_called_once()
+
 
 # We'll focus on testing the server business logic instead of MCP internals
 # since those are implementation details that may change
@@ -275,7 +312,35 @@ class TestServerBusinessLogic:
         
         assert result["user"] is None
         assert "User not found" in result["message"]
-        
+
+    async def test_execute_find_user_by_email_reuses_lookup(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_cway_user: CwayUser
+    ) -> None:
+        """Test that repeated lookups of one address hit the API once."""
+        server_with_mocks.user_repo.find_user_by_email.return_value = sample_cway_user
+
+        await server_with_mocks._execute_tool("find_user_by_email", {"email": " Test@Example.com "})
+        result = await server_with_mocks._execute_tool("find_user_by_email", {"email": "test@example.com"})
+
+        assert result["user"] is not None
+        server_with_mocks.user_repo.find_user_by_email.assert_awaited_once_with("test@example.com")
+
+    async def test_find_user_by_email_cache_is_bounded(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_cway_user: CwayUser
+    ) -> None:
+        """Test that the per-user lookup cache drops its oldest entry when full."""
+        server_with_mocks.user_repo.find_user_by_email.return_value = sample_cway_user
+
+        with patch("src.presentation.cway_mcp_server._MAX_CACHED_USER_LOOKUPS", 2):
+            for email in ("a@example.com", "b@example.com", "c@example.com"):
+                await server_with_mocks._execute_tool("find_user_by_email", {"email": email})
+
+        assert list(server_with_mocks._user_lookup_cache) == ["b@example.com", "c@example.com"]
+
     async def test_execute_get_users_page(
         self,
         server_with_mocks: CwayMCPServer,
@@ -318,7 +383,32 @@ class TestServerBusinessLogic:
         # Verify default values were used
         server_with_mocks.user_repo.find_users_page.assert_called_with(page=0, size=10)
         assert "users" in result
-        
+
+    async def test_execute_get_users_page_multiple_pages(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_cway_user: CwayUser
+    ) -> None:
+        """Test fetching several pages concurrently with get_users_page."""
+        async def find_users_page(page: int, size: int) -> Dict[str, Any]:
+            return {"users": [sample_cway_user], "page": page, "totalHits": 3}
+        server_with_mocks.user_repo.find_users_page.side_effect = find_users_page
+
+        result = await server_with_mocks._execute_tool(
+            "get_users_page",
+            {"page": 2, "size": 1, "pages": 3}
+        )
+
+        requested = sorted(
+            call.kwargs["page"]
+            for call in server_with_mocks.user_repo.find_users_page.call_args_list
+        )
+        assert requested == [2, 3, 4]
+        assert len(result["users"]) == 3
+        assert result["page"] == 2
+        assert result["pages"] == 3
+        assert result["totalHits"] == 3
+
     async def test_execute_get_system_status(self, server_with_mocks: CwayMCPServer) -> None:
         """Test executing get_system_status tool."""
         server_with_mocks.system_repo.validate_connection.return_value = True
@@ -330,13 +420,434 @@ class TestServerBusinessLogic:
         assert result["connected"] is True
         assert "user" in result["login_info"]
         assert "api_url" in result
-        
+
+    async def test_execute_analyze_project_velocity_fetches_once(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_cway_project: PlannerProject
+    ) -> None:
+        """Test that velocity analysis looks the project up a single time."""
+        server_with_mocks.project_repo.find_project_by_id.return_value = sample_cway_project
+        server_with_mocks.temporal_kpi_calculator = AsyncMock()
+        velocity = server_with_mocks.temporal_kpi_calculator.analyze_project_velocity.return_value
+        velocity.daily_velocities = [(date(2024, 1, 1), 2)]
+        velocity.weekly_velocities = [("2024-W01", 2)]
+        velocity.monthly_velocities = [("2024-01", 2)]
+
+        result = await server_with_mocks._execute_tool("analyze_project_velocity", {"project_id": "proj-uuid-123"})
+
+        server_with_mocks.project_repo.find_project_by_id.assert_awaited_once_with("proj-uuid-123")
+        assert result["project_velocity_analysis"]["daily_velocities"] == [("2024-01-01", 2)]
+
+    async def test_execute_analyze_project_velocity_not_found(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test velocity analysis of a missing project."""
+        server_with_mocks.project_repo.find_project_by_id.return_value = None
+
+        result = await server_with_mocks._execute_tool("analyze_project_velocity", {"project_id": "missing"})
+
+        assert result == {"error": "Project not found"}
+
+    async def test_execute_prepare_close_projects_batches_lookup(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that the close preview fetches all projects in one repository call."""
+        server_with_mocks.project_repo.get_projects_by_ids.return_value = {
+            "proj-1": {"id": "proj-1", "name": "One", "status": "OK", "artworks": [{"id": "a"}]}
+        }
+
+        result = await server_with_mocks._execute_tool(
+            "prepare_close_projects", {"project_ids": ["proj-1", "proj-2"]}
+        )
+
+        server_with_mocks.project_repo.get_projects_by_ids.assert_awaited_once_with(["proj-1", "proj-2"])
+        server_with_mocks.project_repo.get_project_by_id.assert_not_called()
+        assert result["items"] == [{"id": "proj-1", "name": "One", "status": "OK", "artwork_count": 1}]
+        assert "Project proj-2 not found" in result["warnings"]
+
+    async def test_execute_prepare_delete_projects_dedupes_ids(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that repeated project IDs are previewed once."""
+        server_with_mocks.project_repo.get_projects_by_ids.return_value = {
+            "proj-1": {"id": "proj-1", "name": "One", "status": "OK", "artworks": []}
+        }
+
+        result = await server_with_mocks._execute_tool(
+            "prepare_delete_projects", {"project_ids": ["proj-1", "proj-1"]}
+        )
+
+        server_with_mocks.project_repo.get_projects_by_ids.assert_awaited_once_with(["proj-1"])
+        assert len(result["items"]) == 1
+        assert "Ignored 1 duplicate project id(s)" in result["warnings"]
+
     async def test_execute_unknown_tool(self, server_with_mocks: CwayMCPServer) -> None:
         """Test executing unknown tool raises error."""
         with pytest.raises(ValueError, match="Unknown tool: unknown_tool"):
             await server_with_mocks._execute_tool("unknown_tool", {})
 
 
+class TestResourceCache:
+    """Test caching of rendered resources."""
+
+    @pytest.fixture
+    def server_with_mocks(self, sample_cway_project: PlannerProject) -> CwayMCPServer:
+        """Create server with mocked repositories."""
+        server = CwayMCPServer()
+        server.project_repo = AsyncMock()
+        server.project_repo.get_planner_projects.return_value = [sample_cway_project]
+        server.indexing_service = MagicMock()
+        server.indexing_service.get_targets.return_value = []
+        return server
+
+    async def test_repeated_read_uses_cache(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that a second read within the TTL is served from cache."""
+        first = await server_with_mocks._read_resource_cached("cway://projects")
+        second = await server_with_mocks._read_resource_cached("cway://projects")
+
+        assert first == second
+        assert "Sample Project" in first
+        server_with_mocks.project_repo.get_planner_projects.assert_awaited_once()
+
+    async def test_concurrent_misses_render_once(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that concurrent reads of a cold URI share one rendering."""
+        await asyncio.gather(*(
+            server_with_mocks._read_resource_cached("cway://projects") for _ in range(5)
+        ))
+
+        server_with_mocks.project_repo.get_planner_projects.assert_awaited_once()
+
+    async def test_uncached_uri_is_rendered_every_time(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that live indexing resources bypass the cache."""
+        await server_with_mocks._read_resource_cached("cway://indexing/targets")
+        await server_with_mocks._read_resource_cached("cway://indexing/targets")
+
+        assert server_with_mocks.indexing_service.get_targets.call_count == 2
+        assert "cway://indexing/targets" not in server_with_mocks._resource_cache
+
+    async def test_unrouted_uri_is_not_cached(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that client-made URIs under a cached prefix leave no cache or lock entries."""
+        content = await server_with_mocks._read_resource_cached("cway://projects/made-up")
+
+        assert content == "Resource not found: cway://projects/made-up"
+        assert server_with_mocks._resource_cache == {}
+        assert server_with_mocks._resource_locks == {}
+
+    async def test_error_rendering_is_not_cached(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that a failed content-stats rendering is retried on the next read."""
+        server_with_mocks.indexing_service.get_indexable_content_stats = AsyncMock(
+            return_value={"error": "boom"}
+        )
+
+        content = await server_with_mocks._read_resource_cached("cway://indexing/content-stats")
+
+        assert content == "❌ Error getting content stats: boom"
+        assert "cway://indexing/content-stats" not in server_with_mocks._resource_cache
+
+    async def test_expired_entry_is_rendered_again(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that entries older than the TTL are refreshed."""
+        server_with_mocks._resource_cache["cway://projects"] = (float("-inf"), "stale")
+
+        content = await server_with_mocks._read_resource_cached("cway://projects")
+
+        assert "Sample Project" in content
+
+    async def test_temporal_dashboard_is_shared(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that temporal resources share one dashboard computation."""
+        server_with_mocks.temporal_kpi_calculator = AsyncMock()
+        dashboard = MagicMock()
+        server_with_mocks.temporal_kpi_calculator.generate_temporal_kpi_dashboard.return_value = dashboard
+
+        results = await asyncio.gather(*(
+            server_with_mocks._get_temporal_dashboard() for _ in range(4)
+        ))
+        results.append(await server_with_mocks._get_temporal_dashboard())
+
+        assert all(result is dashboard for result in results)
+        server_with_mocks.temporal_kpi_calculator.generate_temporal_kpi_dashboard.assert_awaited_once()
+
+    async def test_temporal_tools_share_dashboard(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that temporal tools reuse the dashboard for the same analysis period."""
+        server_with_mocks.temporal_kpi_calculator = AsyncMock()
+        dashboard = MagicMock()
+        dashboard.stagnation_alerts = []
+        server_with_mocks.temporal_kpi_calculator.generate_temporal_kpi_dashboard.return_value = dashboard
+
+        await server_with_mocks._execute_tool("get_temporal_dashboard", {})
+        await server_with_mocks._execute_tool("get_stagnation_alerts", {})
+        await server_with_mocks._execute_tool("get_temporal_dashboard", {"analysis_period_days": 30})
+
+        calculator = server_with_mocks.temporal_kpi_calculator.generate_temporal_kpi_dashboard
+        assert [call.args for call in calculator.await_args_list] == [(90,), (30,)]
+
+    async def test_expired_shared_results_are_dropped(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that storing a new shared result evicts expired entries for other keys."""
+        server_with_mocks.temporal_kpi_calculator = AsyncMock()
+
+        await server_with_mocks._get_temporal_dashboard(30)
+        _, future = server_with_mocks._shared_results["temporal_dashboard:30"]
+        server_with_mocks._shared_results["temporal_dashboard:30"] = (float("-inf"), future)
+        await server_with_mocks._get_temporal_dashboard(60)
+
+        assert list(server_with_mocks._shared_results) == ["temporal_dashboard:60"]
+
+    async def test_reference_data_is_reused(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that permission groups and roles are fetched once within the TTL."""
+        from src.presentation.cway_mcp_server import _RESOURCE_INVALIDATING_TOOLS
+
+        server_with_mocks.user_repo = AsyncMock()
+        server_with_mocks.user_repo.get_permission_groups.return_value = [{"id": "g-1"}]
+        server_with_mocks.project_repo.get_user_roles.return_value = [{"id": "r-1"}]
+
+        for _ in range(2):
+            groups = await server_with_mocks._execute_tool("get_permission_groups", {})
+            roles = await server_with_mocks._execute_tool("get_user_roles", {})
+
+        assert groups["count"] == 1 and roles["role_count"] == 1
+        server_with_mocks.user_repo.get_permission_groups.assert_awaited_once()
+        server_with_mocks.project_repo.get_user_roles.assert_awaited_once()
+        assert "set_user_permissions" in _RESOURCE_INVALIDATING_TOOLS
+
+    async def test_taxonomy_tools_share_one_fetch(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that categories, brands and specifications come from one taxonomy fetch."""
+        server_with_mocks.category_repo = AsyncMock()
+        server_with_mocks.category_repo.get_taxonomy.return_value = {
+            "categories": [{"id": "c-1"}],
+            "brands": [{"id": "b-1"}, {"id": "b-2"}],
+            "specifications": [],
+        }
+
+        taxonomy = await server_with_mocks._execute_tool("get_taxonomy", {})
+        categories = await server_with_mocks._execute_tool("get_categories", {})
+        brands = await server_with_mocks._execute_tool("get_brands", {})
+        specs = await server_with_mocks._execute_tool("get_print_specifications", {})
+
+        assert len(taxonomy["brands"]) == 2
+        assert (categories["count"], brands["count"], specs["count"]) == (1, 2, 0)
+        server_with_mocks.category_repo.get_taxonomy.assert_awaited_once()
+        server_with_mocks.category_repo.get_categories.assert_not_called()
+
+    async def test_failed_dashboard_is_not_shared(self, server_with_mocks: CwayMCPServer) -> None:
+        """Test that a failed computation is retried on the next call."""
+        server_with_mocks.kpi_use_cases = AsyncMock()
+        server_with_mocks.kpi_use_cases.calculate_system_kpi_dashboard.side_effect = [
+            CwayAPIError("boom"),
+            "dashboard",
+        ]
+
+        with pytest.raises(CwayAPIError):
+            await server_with_mocks._get_kpi_dashboard()
+
+        assert await server_with_mocks._get_kpi_dashboard() == "dashboard"
+
+
+class TestListResources:
+    """Test the list_resources handler."""
+
+    async def test_returns_static_catalogue(self) -> None:
+        """Test that every call returns the same prebuilt resource list."""
+        from mcp.types import ListResourcesRequest
+
+        server = CwayMCPServer()
+        handler = server.server.request_handlers[ListResourcesRequest]
+
+        first = await handler(ListResourcesRequest(method="resources/list"))
+        second = await handler(ListResourcesRequest(method="resources/list"))
+
+        uris = [str(resource.uri) for resource in first.root.resources]
+        assert len(uris) == 16
+        assert "cway://kpis/dashboard" in uris
+        assert first.root.resources is second.root.resources
+
+    def test_every_listed_resource_has_renderer(self) -> None:
+        """Test that each listed URI routes to a renderer."""
+        from src.presentation.cway_mcp_server import _RESOURCES
+
+        server = CwayMCPServer()
+
+        assert set(server._resource_renderers) == {str(resource.uri) for resource in _RESOURCES}
+
+    async def test_unknown_resource_not_found(self) -> None:
+        """Test that an unrouted URI renders a not-found message."""
+        server = CwayMCPServer()
+
+        assert await server._render_resource("cway://nope") == "Resource not found: cway://nope"
+
+
+class TestToolDispatch:
+    """Test routing of tool calls to their handlers."""
+
+    def test_every_defined_tool_has_handler(self) -> None:
+        """Test that each advertised tool routes to a handler."""
+        from src.presentation.tool_definitions import get_all_tools
+
+        server = CwayMCPServer()
+
+        assert set(server._tool_handlers) == {tool.name for tool in get_all_tools()}
+
+    async def test_list_tools_returns_prebuilt_result(self) -> None:
+        """Test that every list_tools call serves the same prebuilt tool list."""
+        from mcp.types import ListToolsRequest
+
+        server = CwayMCPServer()
+        handler = server.server.request_handlers[ListToolsRequest]
+
+        first = await handler(ListToolsRequest(method="tools/list"))
+        second = await handler(ListToolsRequest(method="tools/list"))
+
+        assert len(first.root.tools) == len(server._tool_handlers)
+        assert first.root.tools is second.root.tools
+
+    async def test_unknown_tool_raises(self) -> None:
+        """Test that an unrouted tool name is rejected."""
+        server = CwayMCPServer()
+
+        with pytest.raises(ValueError, match="Unknown tool: nope"):
+            await server._execute_tool("nope", {})
+
+    async def test_alias_write_invalidates_caches(self) -> None:
+        """Test that a write through a tool alias clears cached resources."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        server = CwayMCPServer()
+        server._initialized = True
+        server.project_repo = AsyncMock()
+        server.project_repo.create_project.return_value = {"id": "proj-1"}
+        server._resource_cache["cway://projects"] = (time.monotonic(), "cached")
+        handler = server.server.request_handlers[CallToolRequest]
+
+        result = await handler(CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="create_cway_project", arguments={"name": "New"})
+        ))
+
+        assert result.root.isError is False
+        assert "cway://projects" not in server._resource_cache
+
+    async def test_alias_arguments_are_validated(self) -> None:
+        """Test that calls through a tool alias use the target tool's schema."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        server = CwayMCPServer()
+        server._initialized = True
+        server.project_repo = AsyncMock()
+        handler = server.server.request_handlers[CallToolRequest]
+
+        result = await handler(CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="create_cway_project", arguments={})
+        ))
+
+        assert result.root.isError is True
+        assert "Invalid arguments" in result.root.content[0].text
+        server.project_repo.create_project.assert_not_called()
+
+
+class TestReadResource:
+    """Test the read_resource handler."""
+
+    async def test_returns_rendered_text(self) -> None:
+        """Test that the handler returns the rendered body as text contents."""
+        from mcp.types import ReadResourceRequest, ReadResourceRequestParams
+
+        server = CwayMCPServer()
+        server._initialized = True
+        server.project_repo = AsyncMock()
+        server.project_repo.get_completed_projects.return_value = []
+        handler = server.server.request_handlers[ReadResourceRequest]
+
+        result = await handler(ReadResourceRequest(
+            method="resources/read",
+            params=ReadResourceRequestParams(uri="cway://projects/completed")
+        ))
+
+        contents = result.root.contents
+        assert len(contents) == 1
+        assert contents[0].text == "Completed Projects (0):\n\n"
+        assert contents[0].mimeType == "text/plain"
+        assert str(contents[0].uri) == "cway://projects/completed"
+
+    async def test_indexing_status_when_idle(self) -> None:
+        """Test that an idle indexer renders the empty status."""
+        server = CwayMCPServer()
+        server.indexing_service = MagicMock()
+        server.indexing_service.get_active_jobs.return_value = []
+        server.indexing_service.get_job_history.return_value = []
+
+        content = await server._render_resource("cway://indexing/status")
+
+        assert "ACTIVE JOBS: None" in content
+        assert "RECENT HISTORY (0 jobs)" in content
+
+
+class TestJsonHelpers:
+    """Test module-level JSON helpers."""
+
+    def test_dumps_pretty_matches_stdlib(self) -> None:
+        """Test that pretty output matches json.dumps(indent=2) with and without orjson."""
+        from src.presentation.json_encoding import dumps_pretty
+
+        payload = {"user": {"id": "u-1", "name": "Åsa Öberg", "roles": ["admin", "viewer"]}, "active": True}
+        expected = json.dumps(payload, indent=2, ensure_ascii=False)
+
+        assert dumps_pretty(payload) == expected
+        with patch('src.presentation.json_encoding.orjson', None):
+            assert dumps_pretty(payload) == expected
+
+    def test_dumps_pretty_without_orjson(self) -> None:
+        """Test the stdlib fallback when orjson is not installed."""
+        from src.presentation.json_encoding import dumps_pretty
+
+        with patch('src.presentation.json_encoding.orjson', None):
+            assert dumps_pretty({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_encode_result_matches_stdlib(self) -> None:
+        """Test that tool results decode the same with and without orjson."""
+        from src.presentation.tool_responses import UserSummary
+
+        server = CwayMCPServer()
+        result = {
+            "users": [UserSummary("u-1", "Jane", "Jane Doe", "jane@example.com", "jane", True)],
+            "generated_at": datetime(2024, 5, 6, 7, 8, 9),
+            "counts": {1: 2},
+        }
+
+        encoded = server._encode_result(result)
+        with patch('src.presentation.json_encoding.orjson', None):
+            fallback = server._encode_result(result)
+
+        assert json.loads(encoded) == json.loads(fallback)
+        assert json.loads(encoded)["generated_at"] == "2024-05-06 07:08:09"
+
+    def test_encode_result_is_compact_by_default(self) -> None:
+        """Test that the stdlib fallback emits compact JSON like orjson."""
+        server = CwayMCPServer()
+
+        with patch('src.presentation.json_encoding.orjson', None):
+            encoded = server._encode_result({"a": [1, 2], "b": {"c": "d"}})
+
+        assert encoded == '{"a":[1,2],"b":{"c":"d"}}'
+
+    def test_non_ascii_output_matches_orjson(self) -> None:
+        """Test that non-ASCII text is written unescaped with and without orjson."""
+        server = CwayMCPServer()
+        result = {"name": "Åsa Öberg", "city": "Göteborg"}
+
+        encoded = server._encode_result(result)
+        with patch('src.presentation.json_encoding.orjson', None):
+            fallback = server._encode_result(result)
+
+        assert encoded == fallback == '{"name":"Åsa Öberg","city":"Göteborg"}'
+
+    def test_iso_datetime_encoder_matches_stdlib(self) -> None:
+        """Test that ISO datetime output is the same with and without orjson."""
+        from src.presentation.json_encoding import JsonEncoder
+
+        encoder = JsonEncoder(iso_datetimes=True)
+        payload = {"created_at": datetime(2024, 5, 6, 7, 8, 9), "state": ProjectState.COMPLETED}
+
+        encoded = encoder.encode(payload)
+        with patch('src.presentation.json_encoding.orjson', None):
+            fallback = encoder.encode(payload)
+
+        assert encoded == fallback == '{"created_at":"2024-05-06T07:08:09","state":"COMPLETED"}'
+
+
 class TestServerLifecycle:
     """Test server lifecycle methods."""
     
@@ -362,6 +873,26 @@ class TestServerLifecycle:
         # Should not raise error
         await server._cleanup()
         
+    @patch('src.presentation.cway_mcp_server.asyncio.set_event_loop_policy')
+    def test_install_uvloop_disabled(self, mock_set_policy: MagicMock) -> None:
+        """Test that uvloop is skipped when disabled in settings."""
+        from src.presentation.cway_mcp_server import _install_uvloop
+
+        with patch('src.presentation.cway_mcp_server.settings.use_uvloop', False):
+            _install_uvloop()
+
+        mock_set_policy.assert_not_called()
+
+    @patch('src.presentation.cway_mcp_server.asyncio.set_event_loop_policy')
+    def test_install_uvloop_not_installed(self, mock_set_policy: MagicMock) -> None:
+        """Test fallback to the default loop when uvloop is missing."""
+        from src.presentation.cway_mcp_server import _install_uvloop
+
+        with patch.dict('sys.modules', {'uvloop': None}):
+            _install_uvloop()
+
+        mock_set_policy.assert_not_called()
+
     @patch('src.presentation.cway_mcp_server.asyncio.run')
     def test_main_function(self, mock_asyncio_run: MagicMock) -> None:
         """Test main function creates and runs server."""
@@ -468,6 +468,7 @@ class TestIndexingTools:
     async def test_configure_indexing_target_new(self, mcp_server):
         """Test configuring a new indexing target."""
         # Arrange
+        mcp_server.indexing_service.has_target = MagicMock(return_value=False)
         mcp_server.indexing_service.add_target = MagicMock(return_value=True)
         
         # Act
@@ -487,7 +488,8 @@ class TestIndexingTools:
     async def test_configure_indexing_target_update(self, mcp_server):
         """Test updating an existing indexing target."""
         # Arrange
-        mcp_server.indexing_service.add_target = MagicMock(return_value=False)
+        mcp_server.indexing_service.has_target = MagicMock(return_value=True)
+        mcp_server.indexing_service.add_target = MagicMock()
         mcp_server.indexing_service.update_target = MagicMock(return_value=True)
         
         # Act
@@ -500,6 +502,7 @@ class TestIndexingTools:
         # Assert
         assert result["configuration_result"]["success"] is True
         assert result["configuration_result"]["action"] == "updated"
+        mcp_server.indexing_service.add_target.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_indexing_job_status_found(self, mcp_server):
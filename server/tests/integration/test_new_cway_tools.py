@@ -341,9 +341,43 @@ class TestUpdateUserNameTool:
         assert result["user"]["lastName"] == "User"
 
 
+class TestPrepareDeleteUserTool:
+    """Test the prepare_delete_user MCP tool."""
+
+    async def test_prepare_delete_user_uses_exact_lookup(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_cway_user: CwayUser
+    ) -> None:
+        """Test the preview resolves the user by exact username."""
+        server_with_mocks.user_repo.find_user_by_username.return_value = sample_cway_user
+
+        result = await server_with_mocks._execute_tool("prepare_delete_user", {
+            "username": "testuser"
+        })
+
+        assert result["action"] == "preview"
+        server_with_mocks.user_repo.find_user_by_username.assert_awaited_once_with("testuser")
+        server_with_mocks.user_repo.search_users.assert_not_called()
+
+    async def test_prepare_delete_user_not_found(
+        self,
+        server_with_mocks: CwayMCPServer
+    ) -> None:
+        """Test the preview reports an unknown username."""
+        server_with_mocks.user_repo.find_user_by_username.return_value = None
+
+        result = await server_with_mocks._execute_tool("prepare_delete_user", {
+            "username": "ghost"
+        })
+
+        assert result["action"] == "error"
+        assert "not found" in result["message"]
+
+
 class TestDeleteUserTool:
     """Test the delete_user MCP tool."""
-    
+
     async def test_delete_user_success(
         self,
         server_with_mocks: CwayMCPServer
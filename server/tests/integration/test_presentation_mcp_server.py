@@ -417,6 +417,19 @@ class TestCallTool:
         with pytest.raises(Exception, match="API Error"):
             await server_with_mocks._execute_tool("list_projects", {})
 
+    async def test_tool_result_is_encoded_as_json(
+        self,
+        server_with_mocks: CwayMCPServer,
+        sample_project: Project
+    ) -> None:
+        """Test tool results are sent as JSON rather than a Python repr."""
+        from src.presentation.mcp_server import _json_encoder
+
+        server_with_mocks.project_use_cases.get_project.return_value = None
+        result = await server_with_mocks._execute_tool("get_project", {"project_id": "missing"})
+
+        assert json.loads(_json_encoder.encode(result)) == {"project": None, "message": "Project not found"}
+
 
 class TestMCPHandlerRegistration:
     """Test MCP handler registration and execution through the server object."""
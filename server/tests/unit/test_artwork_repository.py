@@ -130,6 +130,64 @@ class TestRejectArtwork:
         assert "reason" not in call_args[0][1]["input"] or call_args[0][1]["input"]["reason"] is None
 
 
+class TestBulkArtworkReview:
+    """Tests for approve_artworks and reject_artworks methods."""
+    
+    @pytest.mark.asyncio
+    async def test_approve_artworks_single_mutation(self, artwork_repository, mock_graphql_client):
+        """Test that all artworks are approved in one mutation."""
+        mock_graphql_client.execute_mutation.return_value = {"approveArtworks": True}
+        
+        result = await artwork_repository.approve_artworks("proj-1", ["art-1", "art-2"])
+        
+        assert result is True
+        mock_graphql_client.execute_mutation.assert_called_once()
+        call_args = mock_graphql_client.execute_mutation.call_args
+        assert call_args[0][1] == {"projectId": "proj-1", "artworkIds": ["art-1", "art-2"]}
+    
+    @pytest.mark.asyncio
+    async def test_reject_artworks_error(self, artwork_repository, mock_graphql_client):
+        """Test that API errors are wrapped."""
+        mock_graphql_client.execute_mutation.side_effect = Exception("API Error")
+        
+        with pytest.raises(CwayAPIError, match="Failed to reject artworks"):
+            await artwork_repository.reject_artworks("proj-1", ["art-1"])
+
+
+class TestCreateArtworkDownloadJob:
+    """Tests for create_artwork_download_job method."""
+    
+    @pytest.mark.asyncio
+    async def test_selects_current_revision_files(self, artwork_repository, mock_graphql_client):
+        """Test that each artwork's current revision files go into one download job."""
+        mock_graphql_client.execute_query.side_effect = [
+            {"artwork": {"id": "art-1", "name": "Label", "currentRevision": {
+                "id": "rev-1", "files": [{"id": "file-1", "name": "label.pdf"}]
+            }}},
+            {"artwork": None},
+        ]
+        mock_graphql_client.execute_mutation.return_value = {"createDownloadJob": "job-1"}
+        
+        job_id = await artwork_repository.create_artwork_download_job(["art-1", "missing"], "labels")
+        
+        assert job_id == "job-1"
+        variables = mock_graphql_client.execute_mutation.call_args[0][1]
+        assert variables == {
+            "selections": [{"fileId": "file-1", "fileName": "label.pdf", "folder": "Label"}],
+            "zipName": "labels",
+            "forceZipFile": True
+        }
+    
+    @pytest.mark.asyncio
+    async def test_no_files_raises(self, artwork_repository, mock_graphql_client):
+        """Test that a job is not created when no artwork has files."""
+        mock_graphql_client.execute_query.return_value = {"artwork": None}
+        
+        with pytest.raises(CwayAPIError, match="No files found"):
+            await artwork_repository.create_artwork_download_job(["missing"])
+        mock_graphql_client.execute_mutation.assert_not_called()
+
+
 class TestGetArtworkVersions:
     """Tests for get_artwork_versions method - version control."""
     
@@ -70,6 +70,8 @@ class TestSettings:
         assert settings.mcp_server_port == 8000
         assert settings.log_level == "INFO"
         assert settings.debug is False
+        assert settings.pretty_json is False
+        assert settings.use_uvloop is True
         assert settings.request_timeout == 30
         assert settings.max_retries == 3
         
@@ -83,6 +85,7 @@ class TestSettings:
             "MCP_SERVER_PORT=9000\n"
             "LOG_LEVEL=WARNING\n"
             "DEBUG=true\n"
+            "PRETTY_JSON=true\n"
             "REQUEST_TIMEOUT=60\n"
             "MAX_RETRIES=5\n"
         )
@@ -95,6 +98,7 @@ class TestSettings:
         assert settings.mcp_server_port == 9000
         assert settings.log_level == "WARNING"
         assert settings.debug is True
+        assert settings.pretty_json is True
         assert settings.request_timeout == 60
         assert settings.max_retries == 5
         
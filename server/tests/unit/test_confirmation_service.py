@@ -75,6 +75,17 @@ class TestConfirmationService:
         with pytest.raises(ValueError, match="Invalid token signature"):
             self.service.validate_token(tampered_token)
     
+    def test_validate_token_from_other_secret(self):
+        """Test validation fails for a token signed with a different secret."""
+        other = ConfirmationService(secret_key="another-secret-key")
+        token_info = other.generate_token(
+            action="delete_projects",
+            data={"project_ids": ["proj-1"]}
+        )
+        
+        with pytest.raises(ValueError, match="Invalid token signature"):
+            self.service.validate_token(token_info["token"])
+    
     def test_validate_token_already_used(self):
         """Test validation fails when token is reused."""
         # Generate and validate token once
@@ -145,7 +156,30 @@ class TestConfirmationService:
         assert "confirmation_token" in response
         assert "token_expires_at" in response
         assert "next_step" in response
-    
+
+    def test_generate_preview_with_token(self):
+        """Test building a preview and its token in one call."""
+        items = [{"id": "proj-1", "name": "Project 1"}]
+
+        response = self.service.generate_preview_with_token(
+            token_action="close_projects",
+            data={"project_ids": ["proj-1"], "force": False},
+            action="close",
+            items=items,
+            item_type="projects",
+            warnings=["Will close 1 project(s)"]
+        )
+
+        assert response["action"] == "preview"
+        assert response["item_count"] == 1
+        assert response["token_expires_in_seconds"] == 300
+        assert response["next_step"].startswith("To proceed, call confirm_close_projects")
+
+        validated = self.service.validate_token(
+            response["confirmation_token"], expected_action="close_projects"
+        )
+        assert validated["data"] == {"project_ids": ["proj-1"], "force": False}
+
     def test_token_cleanup(self):
         """Test that old used tokens are cleaned up."""
         # Generate and use multiple tokens
@@ -201,3 +235,16 @@ class TestConfirmationService:
         assert validated["action"] == "delete_projects"
         # If application expected "close_projects", it should reject
         assert validated["action"] != "close_projects"
+    
+    def test_expected_action_mismatch_keeps_token_usable(self):
+        """Test that a token for another action is rejected without consuming it."""
+        token_info = self.service.generate_token(
+            action="delete_projects",
+            data={"project_ids": ["proj-1"]}
+        )
+        
+        with pytest.raises(ValueError, match="wrong action type"):
+            self.service.validate_token(token_info["token"], expected_action="close_projects")
+        
+        validated = self.service.validate_token(token_info["token"], expected_action="delete_projects")
+        assert validated["data"] == {"project_ids": ["proj-1"]}
@@ -67,13 +67,12 @@ class TestCwayGraphQLClient:
     async def test_disconnect(self, client: CwayGraphQLClient) -> None:
         """Test client disconnection."""
         mock_client = AsyncMock()
-        mock_transport = AsyncMock()
-        mock_client.transport = mock_transport
         client._client = mock_client
         
         await client.disconnect()
         
-        mock_transport.close.assert_called_once()
+        mock_client.close_async.assert_awaited_once()
+        assert client._client is None
     
     @pytest.mark.asyncio
     async def test_disconnect_no_client(self, client: CwayGraphQLClient) -> None:
@@ -95,7 +94,8 @@ class TestCwayGraphQLClient:
         # Should not raise an exception
         await client.disconnect()
         
-        assert client._client == mock_client
+        mock_client.close_async.assert_awaited_once()
+        assert client._client is None
     
     @pytest.mark.asyncio
     async def test_execute_query_success(self, client: CwayGraphQLClient) -> None:
@@ -104,7 +104,7 @@ class TestCwayGraphQLClient:
         expected_data = {"users": [{"id": "1", "name": "Test User"}]}
         
         mock_client = AsyncMock()
-        mock_client.execute_async.return_value = expected_data
+        mock_client.session.execute.return_value = expected_data
         client._client = mock_client
         
         with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -114,7 +114,7 @@ class TestCwayGraphQLClient:
             
             assert result == expected_data
             mock_gql.assert_called_once_with(query)
-            mock_client.execute_async.assert_called_once_with("parsed_query", variable_values=None)
+            mock_client.session.execute.assert_called_once_with("parsed_query", variable_values=None)
     
     @pytest.mark.asyncio
     async def test_execute_query_with_variables(self, client: CwayGraphQLClient) -> None:
@@ -124,7 +124,7 @@ class TestCwayGraphQLClient:
         expected_data = {"user": {"id": "user-123", "name": "Test User"}}
         
         mock_client = AsyncMock()
-        mock_client.execute_async.return_value = expected_data
+        mock_client.session.execute.return_value = expected_data
         client._client = mock_client
         
         with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -133,7 +133,7 @@ class TestCwayGraphQLClient:
             result = await client.execute_query(query, variables)
             
             assert result == expected_data
-            mock_client.execute_async.assert_called_once_with("parsed_query", variable_values=variables)
+            mock_client.session.execute.assert_called_once_with("parsed_query", variable_values=variables)
     
     @pytest.mark.asyncio
     async def test_execute_query_auto_connect(self, client: CwayGraphQLClient) -> None:
@@ -143,7 +143,7 @@ class TestCwayGraphQLClient:
         
         with patch.object(client, 'connect') as mock_connect:
             mock_client = AsyncMock()
-            mock_client.execute_async.return_value = expected_data
+            mock_client.session.execute.return_value = expected_data
             client._client = None  # Not connected initially
             
             # After connect is called, set the client
@@ -165,7 +165,7 @@ class TestCwayGraphQLClient:
         query = "{ users { id } }"
         
         mock_client = AsyncMock()
-        mock_client.execute_async.side_effect = TransportError("Connection failed")
+        mock_client.session.execute.side_effect = TransportError("Connection failed")
         client._client = mock_client
         
         with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -176,7 +176,7 @@ class TestCwayGraphQLClient:
                     await client.execute_query(query)
                     
                 # Should have retried 3 times
-                assert mock_client.execute_async.call_count == 3
+                assert mock_client.session.execute.call_count == 3
                 # Should have slept between retries (exponential backoff)
                 assert mock_sleep.call_count == 2
     
@@ -186,7 +186,7 @@ class TestCwayGraphQLClient:
         query = "{ users { id } }"
         
         mock_client = AsyncMock()
-        mock_client.execute_async.side_effect = ValueError("Unexpected error")
+        mock_client.session.execute.side_effect = ValueError("Unexpected error")
         client._client = mock_client
         
         with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -17,6 +17,7 @@ class TestCwayGraphQLClientConnection:
         # Arrange
         with patch('src.infrastructure.graphql_client.AIOHTTPTransport') as mock_transport:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
+                mock_client_class.return_value.connect_async = AsyncMock()
                 client = CwayGraphQLClient("https://test.api/graphql", "test-token")
                 
                 # Act
@@ -25,6 +26,7 @@ class TestCwayGraphQLClientConnection:
                 # Assert
                 mock_transport.assert_called_once()
                 mock_client_class.assert_called_once()
+                mock_client_class.return_value.connect_async.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_connect_failure(self):
@@ -45,8 +47,8 @@ class TestCwayGraphQLClientConnection:
         with patch('src.infrastructure.graphql_client.AIOHTTPTransport'):
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 mock_client = MagicMock()
-                mock_transport = AsyncMock()
-                mock_client.transport = mock_transport
+                mock_client.connect_async = AsyncMock()
+                mock_client.close_async = AsyncMock()
                 mock_client_class.return_value = mock_client
                 
                 client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -56,7 +58,8 @@ class TestCwayGraphQLClientConnection:
                 await client.disconnect()
                 
                 # Assert
-                mock_transport.close.assert_called_once()
+                mock_client.close_async.assert_awaited_once()
+                assert client._client is None
     
     @pytest.mark.asyncio
     async def test_context_manager(self):
@@ -65,8 +68,8 @@ class TestCwayGraphQLClientConnection:
         with patch('src.infrastructure.graphql_client.AIOHTTPTransport'):
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 mock_client = MagicMock()
-                mock_transport = AsyncMock()
-                mock_client.transport = mock_transport
+                mock_client.connect_async = AsyncMock()
+                mock_client.close_async = AsyncMock()
                 mock_client_class.return_value = mock_client
                 
                 client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -77,7 +80,7 @@ class TestCwayGraphQLClientConnection:
                     assert client._client is not None
                 
                 # Assert disconnect was called
-                mock_transport.close.assert_called_once()
+                mock_client.close_async.assert_awaited_once()
 
 
 class TestCwayGraphQLClientQueries:
@@ -91,7 +94,7 @@ class TestCwayGraphQLClientQueries:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql') as mock_gql:
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(return_value={"data": "test"})
+                    mock_client.session.execute = AsyncMock(return_value={"data": "test"})
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -101,7 +104,7 @@ class TestCwayGraphQLClientQueries:
                     
                     # Assert
                     assert result == {"data": "test"}
-                    mock_client.execute_async.assert_called_once()
+                    mock_client.session.execute.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_query_with_variables(self):
@@ -111,7 +114,7 @@ class TestCwayGraphQLClientQueries:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql'):
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(return_value={"data": "test"})
+                    mock_client.session.execute = AsyncMock(return_value={"data": "test"})
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -134,7 +137,7 @@ class TestCwayGraphQLClientQueries:
                     
                     mock_client = AsyncMock()
                     # Fail twice, then succeed
-                    mock_client.execute_async = AsyncMock(
+                    mock_client.session.execute = AsyncMock(
                         side_effect=[
                             TransportError("Error 1"),
                             TransportError("Error 2"),
@@ -151,7 +154,7 @@ class TestCwayGraphQLClientQueries:
                     
                     # Assert
                     assert result == {"data": "success"}
-                    assert mock_client.execute_async.call_count == 3
+                    assert mock_client.session.execute.call_count == 3
     
     @pytest.mark.asyncio
     async def test_execute_query_max_retries_exceeded(self):
@@ -165,7 +168,7 @@ class TestCwayGraphQLClientQueries:
                         
                         mock_settings.max_retries = 2
                         mock_client = AsyncMock()
-                        mock_client.execute_async = AsyncMock(side_effect=TransportError("Persistent error"))
+                        mock_client.session.execute = AsyncMock(side_effect=TransportError("Persistent error"))
                         mock_client_class.return_value = mock_client
                         
                         client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -183,7 +186,7 @@ class TestCwayGraphQLClientQueries:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql'):
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(side_effect=ValueError("Unexpected"))
+                    mock_client.session.execute = AsyncMock(side_effect=ValueError("Unexpected"))
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -205,7 +208,7 @@ class TestCwayGraphQLClientMutations:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql'):
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(return_value={"mutate": "success"})
+                    mock_client.session.execute = AsyncMock(return_value={"mutate": "success"})
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -225,7 +228,7 @@ class TestCwayGraphQLClientMutations:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql'):
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(return_value={"mutate": "success"})
+                    mock_client.session.execute = AsyncMock(return_value={"mutate": "success"})
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -257,7 +260,7 @@ class TestCwayGraphQLClientSchema:
                             "types": [{"name": "Query"}]
                         }
                     }
-                    mock_client.execute_async = AsyncMock(return_value=mock_schema)
+                    mock_client.session.execute = AsyncMock(return_value=mock_schema)
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -277,7 +280,7 @@ class TestCwayGraphQLClientSchema:
             with patch('src.infrastructure.graphql_client.Client') as mock_client_class:
                 with patch('src.infrastructure.graphql_client.gql'):
                     mock_client = AsyncMock()
-                    mock_client.execute_async = AsyncMock(side_effect=Exception("Schema error"))
+                    mock_client.session.execute = AsyncMock(side_effect=Exception("Schema error"))
                     mock_client_class.return_value = mock_client
                     
                     client = CwayGraphQLClient("https://test.api/graphql", "test-token")
@@ -34,7 +34,7 @@ class TestGraphQLClientExtended:
             
             client = CwayGraphQLClient()
             mock_client = AsyncMock()
-            mock_client.execute_async.side_effect = TransportError("Temporary failure")
+            mock_client.session.execute.side_effect = TransportError("Temporary failure")
             client._client = mock_client
             
             with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -59,7 +59,7 @@ class TestGraphQLClientExtended:
             client = CwayGraphQLClient()
             mock_client = AsyncMock()
             result = {"data": "test"}
-            mock_client.execute_async.return_value = result
+            mock_client.session.execute.return_value = result
             client._client = mock_client
             
             with patch('src.infrastructure.graphql_client.gql') as mock_gql:
@@ -67,7 +67,7 @@ class TestGraphQLClientExtended:
                 
                 response = await client.execute_query("{ test }")
                 assert response == result
-                assert mock_client.execute_async.call_count == 1
+                assert mock_client.session.execute.call_count == 1
     
     @pytest.mark.asyncio
     async def test_get_schema_empty_result(self) -> None:
@@ -0,0 +1,43 @@
+"""Tests for KPI use cases."""
+
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.kpi_use_cases import KPIUseCases
+
+
+@pytest.fixture
+def kpi_use_cases() -> KPIUseCases:
+    """Create KPI use cases with health scoring stubbed per project."""
+    projects = [SimpleNamespace(id=f"proj-{score}", score=score) for score in (50, 10, 90, 30, 70)]
+
+    project_repository = AsyncMock()
+    project_repository.get_planner_projects.return_value = projects
+
+    use_cases = KPIUseCases(AsyncMock(), project_repository, MagicMock())
+    use_cases._get_all_project_revisions = AsyncMock(return_value={})
+    use_cases._calculate_project_health_score = AsyncMock(
+        side_effect=lambda project, revisions: SimpleNamespace(
+            project_id=project.id, overall_score=project.score
+        )
+    )
+    return use_cases
+
+
+def _scores(health_scores: List[SimpleNamespace]) -> List[int]:
+    return [score.overall_score for score in health_scores]
+
+
+class TestProjectHealthScores:
+    """Test project health score retrieval."""
+
+    async def test_all_scores_worst_first(self, kpi_use_cases: KPIUseCases) -> None:
+        """Test that all scores are returned sorted worst first."""
+        assert _scores(await kpi_use_cases.get_project_health_scores()) == [10, 30, 50, 70, 90]
+
+    async def test_top_performing(self, kpi_use_cases: KPIUseCases) -> None:
+        """Test that top performers are returned best first."""
+        assert _scores(await kpi_use_cases.get_top_performing_projects(limit=2)) == [90, 70]
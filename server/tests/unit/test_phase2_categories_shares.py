@@ -203,6 +203,32 @@ async def test_get_print_specifications_error(category_repo, mock_graphql_client
         await category_repo.get_print_specifications()
 
 
+@pytest.mark.asyncio
+async def test_get_taxonomy_single_request(category_repo, mock_graphql_client):
+    """Test categories, brands and specifications come from one query"""
+    mock_graphql_client.execute_query.return_value = {
+        "categories": [{"id": "cat1", "name": "Print"}],
+        "brands": [{"id": "brand1", "name": "Acme"}],
+        "printSpecifications": [{"id": "spec1", "name": "A4"}]
+    }
+    
+    result = await category_repo.get_taxonomy()
+    
+    mock_graphql_client.execute_query.assert_called_once()
+    assert result["categories"][0]["name"] == "Print"
+    assert result["brands"][0]["name"] == "Acme"
+    assert result["specifications"][0]["name"] == "A4"
+
+
+@pytest.mark.asyncio
+async def test_get_taxonomy_error(category_repo, mock_graphql_client):
+    """Test error handling when getting taxonomy"""
+    mock_graphql_client.execute_query.side_effect = Exception("API error")
+    
+    with pytest.raises(CwayAPIError, match="Failed to get taxonomy"):
+        await category_repo.get_taxonomy()
+
+
 @pytest.mark.asyncio
 async def test_create_print_specification_success(category_repo, mock_graphql_client):
     """Test successful print specification creation with all parameters"""
@@ -7,8 +7,10 @@ Focus on:
 - Error handling
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.repositories.base_repository import MAX_CONCURRENT_FETCHES
 from src.infrastructure.repositories.project_repository import ProjectRepository
 from src.domain.cway_entities import PlannerProject, ProjectState
 from src.infrastructure.graphql_client import CwayAPIError
@@ -166,6 +168,79 @@ class TestGetActiveProjects:
         assert result[1].name == "Active Project 2"
 
 
+class TestGetProjectsByIds:
+    """Tests for get_projects_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_ids_in_one_query(self, project_repository, mock_graphql_client):
+        """Test that every project is requested through one aliased query."""
+        mock_graphql_client.execute_query.return_value = {
+            "p0": {"id": "proj-1", "name": "One", "status": "OK", "artworks": []},
+            "p1": None,
+        }
+
+        result = await project_repository.get_projects_by_ids(["proj-1", "missing", "proj-1"])
+
+        mock_graphql_client.execute_query.assert_awaited_once()
+        query, variables = mock_graphql_client.execute_query.call_args[0]
+        assert "p0: project(id: $id0)" in query
+        assert variables == {"id0": "proj-1", "id1": "missing"}
+        assert result == {"proj-1": {"id": "proj-1", "name": "One", "status": "OK", "artworks": []}}
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_skip_query(self, project_repository, mock_graphql_client):
+        """Test that no request is made without IDs."""
+        assert await project_repository.get_projects_by_ids([]) == {}
+        mock_graphql_client.execute_query.assert_not_called()
+
+
+class TestCompareProjects:
+    """Tests for compare_projects method."""
+
+    @pytest.mark.asyncio
+    async def test_compares_found_projects_in_order(self, project_repository):
+        """Test that missing projects are skipped and metrics cover the rest."""
+        projects = {
+            "proj-1": {
+                "id": "proj-1", "state": "IN_PROGRESS", "status": "OK",
+                "progress": {"percentageDone": 40, "artworksDone": 1, "artworksInProgress": 1, "artworksUnstarted": 0},
+            },
+            "proj-2": {
+                "id": "proj-2", "state": "COMPLETED", "status": "OK",
+                "progress": {"percentageDone": 60, "artworksDone": 2, "artworksInProgress": 0, "artworksUnstarted": 1},
+            },
+        }
+        project_repository.get_project_by_id = AsyncMock(side_effect=projects.get)
+
+        result = await project_repository.compare_projects(["proj-1", "missing", "proj-2"])
+
+        assert [p["id"] for p in result["projects"]] == ["proj-1", "proj-2"]
+        assert result["comparison"]["avg_progress"] == 50
+        assert result["comparison"]["total_artworks"] == 5
+        assert result["comparison"]["states"] == ["IN_PROGRESS", "COMPLETED"]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_lookups(self, project_repository):
+        """Test that no more than MAX_CONCURRENT_FETCHES lookups run at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_project_by_id(project_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return None
+
+        project_repository.get_project_by_id = get_project_by_id
+
+        result = await project_repository.compare_projects([f"proj-{i}" for i in range(MAX_CONCURRENT_FETCHES * 3)])
+
+        assert result == {"projects": [], "comparison": {}}
+        assert max_in_flight == MAX_CONCURRENT_FETCHES
+
+
 class TestSearchProjects:
     """Tests for search_projects method."""
     
@@ -9,7 +9,8 @@ from src.domain.entities import Project
 from src.domain.temporal_kpi_entities import (
     ProjectActivityTimeline, 
     ActivityLevel, 
-    StagnationRisk
+    StagnationRisk,
+    TeamTemporalMetrics
 )
 from src.application.temporal_kpi_use_cases import TemporalKPICalculator
 
@@ -358,4 +359,27 @@ def test_stagnation_risk_classification():
     )
     
     # __post_init__ should classify this as critical
-    assert timeline_critical.stagnation_risk == StagnationRisk.CRITICAL
\ No newline at end of file
+    assert timeline_critical.stagnation_risk == StagnationRisk.CRITICAL
+
+
+def test_sorted_monthly_activity_trend():
+    """Test that the monthly trend is ordered by month and computed once."""
+    metrics = TeamTemporalMetrics(
+        total_active_days=10,
+        avg_team_response_time=None,
+        peak_activity_day_of_week="Monday",
+        peak_activity_hour=9,
+        activity_by_day_of_week={},
+        activity_by_hour={},
+        team_velocity_revisions_per_day=1.0,
+        team_velocity_projects_per_month=2.0,
+        concurrent_project_activity=1,
+        avg_projects_per_active_day=1.0,
+        monthly_activity_trend={"2024-03": 5, "2023-12": 7, "2024-01": 2},
+        quarterly_productivity={}
+    )
+    
+    trend = metrics.sorted_monthly_activity_trend
+    
+    assert trend == [("2023-12", 7), ("2024-01", 2), ("2024-03", 5)]
+    assert metrics.sorted_monthly_activity_trend is trend
@@ -0,0 +1,55 @@
+"""Unit tests for token providers."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.auth.token_cache import TokenCache
+from src.infrastructure.auth.token_provider import OAuth2TokenProvider, StaticTokenProvider
+
+
+@pytest.fixture
+def oauth2_provider(tmp_path: Path) -> OAuth2TokenProvider:
+    """OAuth2 provider with the MSAL application mocked out."""
+    with patch("src.infrastructure.auth.token_provider.ConfidentialClientApplication") as app_class:
+        app = MagicMock()
+        app.get_accounts.return_value = []
+        app.acquire_token_for_client.return_value = {"access_token": "fresh-token", "expires_in": 3600}
+        app_class.return_value = app
+        return OAuth2TokenProvider(
+            tenant_id="tenant",
+            client_id="client",
+            client_secret="secret",
+            cache=TokenCache(tmp_path / "token_cache.json"),
+        )
+
+
+class TestStaticTokenProvider:
+    """Test the static token provider."""
+
+    async def test_get_token(self) -> None:
+        """Test that the static token is returned unchanged."""
+        provider = StaticTokenProvider("static-token")
+
+        assert await provider.get_token() == "static-token"
+        assert await provider.refresh_token() == "static-token"
+
+
+class TestOAuth2TokenProvider:
+    """Test the OAuth2 token provider."""
+
+    async def test_get_token_acquires_and_reuses(self, oauth2_provider: OAuth2TokenProvider) -> None:
+        """Test that a token is acquired once and then served from memory."""
+        assert await oauth2_provider.get_token() == "fresh-token"
+        assert await oauth2_provider.get_token() == "fresh-token"
+
+        oauth2_provider.app.acquire_token_for_client.assert_called_once()
+
+    async def test_concurrent_get_token_acquires_once(self, oauth2_provider: OAuth2TokenProvider) -> None:
+        """Test that concurrent callers share one token acquisition."""
+        tokens = await asyncio.gather(*(oauth2_provider.get_token() for _ in range(5)))
+
+        assert tokens == ["fresh-token"] * 5
+        oauth2_provider.app.acquire_token_for_client.assert_called_once()
@@ -0,0 +1,202 @@
+"""Tests for slotted MCP tool response payloads."""
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+from src.domain.cway_entities import CwayUser, PlannerProject, ProjectState
+from src.domain.temporal_kpi_entities import ActivityLevel, StagnationAlert, StagnationRisk
+from src.presentation.tool_responses import (
+    ToolResponse,
+    UserSummary,
+    UserProfile,
+    UserDetail,
+    UserRecord,
+    ProjectSummary,
+    ProjectListing,
+    StagnationAlertSummary,
+)
+
+
+@pytest.fixture
+def user() -> CwayUser:
+    """Create a sample Cway user."""
+    return CwayUser(
+        id="user-123",
+        name="John Doe",
+        email="john@example.com",
+        username="johndoe",
+        firstName="John",
+        lastName="Doe",
+        isSSO=True,
+    )
+
+
+class TestUserSummary:
+    """Test UserSummary payload."""
+
+    def test_from_user(self, user: CwayUser) -> None:
+        """Test building a summary from a user entity."""
+        summary = UserSummary.from_user(user)
+
+        assert summary["id"] == "user-123"
+        assert summary["fullName"] == "John Doe"
+        assert summary["enabled"] is True
+        assert "email" in summary
+        assert "isSSO" not in summary
+
+    def test_has_no_instance_dict(self, user: CwayUser) -> None:
+        """Test that payloads are slotted."""
+        summary = UserSummary.from_user(user)
+
+        assert not hasattr(summary, "__dict__")
+
+    def test_unknown_key_raises_key_error(self, user: CwayUser) -> None:
+        """Test mapping access with an unknown key."""
+        with pytest.raises(KeyError):
+            UserSummary.from_user(user)["avatar"]
+
+    def test_to_dict_preserves_field_order(self, user: CwayUser) -> None:
+        """Test conversion to a plain dict."""
+        assert list(UserSummary.from_user(user).to_dict()) == [
+            "id", "name", "fullName", "email", "username", "enabled"
+        ]
+
+
+class TestUserProfile:
+    """Test UserProfile payload."""
+
+    def test_from_user(self, user: CwayUser) -> None:
+        """Test building a profile from a user entity."""
+        profile = UserProfile.from_user(user)
+
+        assert profile["firstName"] == "John"
+        assert profile["isSSO"] is True
+        assert profile.to_dict()["avatar"] is False
+
+
+class TestUserDetail:
+    """Test UserDetail payload."""
+
+    def test_from_user(self, user: CwayUser) -> None:
+        """Test building a full user payload from a user entity."""
+        detail = UserDetail.from_user(user)
+
+        assert detail["fullName"] == "John Doe"
+        assert detail["acceptedTerms"] is False
+        assert list(detail.to_dict())[-2:] == ["acceptedTerms", "earlyAccessProgram"]
+
+
+class TestUserRecord:
+    """Test UserRecord payload."""
+
+    def test_from_user(self, user: CwayUser) -> None:
+        """Test building a search result from a user entity."""
+        record = UserRecord.from_user(user)
+
+        assert record.to_dict() == {
+            "id": "user-123",
+            "name": "John Doe",
+            "username": "johndoe",
+            "email": "john@example.com",
+            "firstName": "John",
+            "lastName": "Doe",
+            "enabled": True,
+        }
+
+
+class TestProjectSummary:
+    """Test ProjectSummary payload."""
+
+    def test_from_project(self) -> None:
+        """Test building a summary from a planner project."""
+        project = PlannerProject(
+            id="proj-1",
+            name="Project",
+            state=ProjectState.IN_PROGRESS,
+            percentageDone=0.5,
+            startDate=date(2024, 1, 1),
+        )
+
+        summary = ProjectSummary.from_project(project)
+
+        assert summary["state"] == "IN_PROGRESS"
+        assert summary["startDate"] == "2024-01-01"
+        assert summary["endDate"] is None
+        assert summary["isActive"] is True
+        assert json.loads(json.dumps(summary.to_dict()))["name"] == "Project"
+
+
+class TestProjectListing:
+    """Test ProjectListing payload."""
+
+    def test_from_project(self) -> None:
+        """Test that listings omit derived state flags."""
+        project = PlannerProject(
+            id="proj-2",
+            name="Done",
+            state=ProjectState.COMPLETED,
+            percentageDone=1.0,
+            endDate=date(2024, 6, 30),
+        )
+
+        listing = ProjectListing.from_project(project)
+
+        assert listing["state"] == "COMPLETED"
+        assert listing["endDate"] == "2024-06-30"
+        assert "isCompleted" not in listing
+
+
+class TestStagnationAlertSummary:
+    """Test StagnationAlertSummary payload."""
+
+    def test_from_alert(self) -> None:
+        """Test that enums and dates are flattened for JSON."""
+        alert = StagnationAlert(
+            project_id="proj-3",
+            project_name="Stalled",
+            risk_level=StagnationRisk.HIGH,
+            days_since_activity=45,
+            last_activity_date=datetime(2024, 3, 1, 12, 0),
+            previous_activity_level=ActivityLevel.HIGH,
+            expected_activity_level=ActivityLevel.MODERATE,
+            recommended_actions=["Check in with the team"],
+            urgency_score=8,
+        )
+
+        summary = StagnationAlertSummary.from_alert(alert)
+
+        assert summary["risk_level"] == "high"
+        assert summary["last_activity_date"] == "2024-03-01T12:00:00"
+        assert summary["previous_activity_level"] == "high"
+        assert json.loads(json.dumps(summary.to_dict()))["urgency_score"] == 8
+
+
+class TestToolResponse:
+    """Test the ToolResponse base class."""
+
+    def test_subclass_gets_generated_to_dict(self) -> None:
+        """Test that each slotted subclass gets its own to_dict."""
+        class Point(ToolResponse):
+            __slots__ = ("x", "y")
+
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+        assert Point.to_dict is not ToolResponse.to_dict
+        assert Point(1, 2).to_dict() == {"x": 1, "y": 2}
+
+    def test_subclass_to_dict_is_kept(self) -> None:
+        """Test that a subclass's own to_dict is not replaced."""
+        class Label(ToolResponse):
+            __slots__ = ("text",)
+
+            def __init__(self, text: str) -> None:
+                self.text = text
+
+            def to_dict(self) -> dict:
+                return {"text": self.text.upper()}
+
+        assert Label("ok").to_dict() == {"text": "OK"}
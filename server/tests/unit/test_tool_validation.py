@@ -0,0 +1,75 @@
+"""Tests for precompiled tool argument validation."""
+
+import pytest
+from mcp.types import Tool
+
+from src.presentation.tool_definitions import get_all_tools
+from src.presentation.tool_validation import (
+    ToolArgumentError,
+    ToolArgumentValidator,
+    build_validators,
+)
+
+
+@pytest.fixture
+def validator() -> ToolArgumentValidator:
+    """Create a validator for a paginated tool schema."""
+    return ToolArgumentValidator("get_users_page", {
+        "type": "object",
+        "properties": {
+            "page": {"type": "integer", "default": 0},
+            "size": {"type": "integer", "default": 10},
+            "query": {"type": "string"},
+        },
+        "required": ["query"],
+    })
+
+
+class TestToolArgumentValidator:
+    """Test ToolArgumentValidator."""
+
+    def test_applies_defaults(self, validator: ToolArgumentValidator) -> None:
+        """Test that schema defaults fill in missing arguments."""
+        assert validator({"query": "john", "size": 5}) == {
+            "page": 0, "size": 5, "query": "john"
+        }
+
+    def test_does_not_mutate_arguments(self, validator: ToolArgumentValidator) -> None:
+        """Test that the caller's arguments dict is left untouched."""
+        arguments = {"query": "john"}
+        validator(arguments)
+
+        assert arguments == {"query": "john"}
+
+    def test_missing_required_argument(self, validator: ToolArgumentValidator) -> None:
+        """Test that a missing required argument is rejected."""
+        with pytest.raises(ToolArgumentError, match="'query' is a required property"):
+            validator({})
+
+    def test_wrong_type_reports_location(self, validator: ToolArgumentValidator) -> None:
+        """Test that type errors name the offending argument."""
+        with pytest.raises(ToolArgumentError, match="page: 'x' is not of type 'integer'"):
+            validator({"query": "john", "page": "x"})
+
+    def test_invalid_schema_fails_at_build_time(self) -> None:
+        """Test that broken schemas are caught when compiling."""
+        with pytest.raises(Exception):
+            ToolArgumentValidator("broken", {"type": "not-a-type"})
+
+
+class TestBuildValidators:
+    """Test build_validators."""
+
+    def test_compiles_all_tool_schemas(self) -> None:
+        """Test that every registered tool schema compiles."""
+        tools = get_all_tools()
+
+        validators = build_validators(tools)
+
+        assert set(validators) == {tool.name for tool in tools}
+
+    def test_keyed_by_tool_name(self) -> None:
+        """Test lookup of a compiled validator by name."""
+        tool = Tool(name="ping", description="Ping", inputSchema={"type": "object", "properties": {}})
+
+        assert build_validators([tool])["ping"]({}) == {}
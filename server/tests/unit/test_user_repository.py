@@ -209,6 +209,52 @@ class TestFindUserByEmail:
         assert result.username == "john"
 
 
+class TestFindUserByUsername:
+    """Tests for find_user_by_username method."""
+
+    @pytest.mark.asyncio
+    async def test_find_user_by_username_found(self, user_repository, mock_graphql_client):
+        """Test exact username lookup via getUser."""
+        mock_graphql_client.execute_query.return_value = {
+            "getUser": {
+                "id": "user-1",
+                "name": "John Doe",
+                "email": "john@example.com",
+                "username": "john",
+                "firstName": "John",
+                "lastName": "Doe",
+                "enabled": True,
+                "isSSO": True
+            }
+        }
+
+        result = await user_repository.find_user_by_username("john")
+
+        assert result is not None
+        assert result.username == "john"
+        assert result.isSSO is True
+        args = mock_graphql_client.execute_query.call_args[0]
+        assert "getUser" in args[0]
+        assert args[1] == {"username": "john"}
+
+    @pytest.mark.asyncio
+    async def test_find_user_by_username_not_found(self, user_repository, mock_graphql_client):
+        """Test lookup returns None when getUser is null."""
+        mock_graphql_client.execute_query.return_value = {"getUser": None}
+
+        result = await user_repository.find_user_by_username("ghost")
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_find_user_by_username_error(self, user_repository, mock_graphql_client):
+        """Test API errors are wrapped in CwayAPIError."""
+        mock_graphql_client.execute_query.side_effect = Exception("API Error")
+
+        with pytest.raises(CwayAPIError):
+            await user_repository.find_user_by_username("john")
+
+
 class TestFindUsersPage:
     """Tests for find_users_page method with pagination."""
     